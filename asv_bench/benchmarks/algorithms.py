@@ -65,6 +65,23 @@ class Factorize:
         pd.factorize(self.data, sort=sort)
 
 
+class FactorizeThreads:
+    params = [[1, 4], ["int64", "float64", "datetime64[ns]"]]
+    param_names = ["num_threads", "dtype"]
+
+    def setup(self, num_threads, dtype):
+        N = 10**7
+        rng = np.random.default_rng(42)
+        self.data = rng.integers(0, 10_000, N).astype(dtype)
+        pd.set_option("compute.num_threads", num_threads)
+
+    def teardown(self, num_threads, dtype):
+        pd.set_option("compute.num_threads", 1)
+
+    def time_factorize(self, num_threads, dtype):
+        pd.factorize(self.data)
+
+
 class Duplicated:
     params = [
         [True, False],
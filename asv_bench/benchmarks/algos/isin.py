@@ -339,3 +339,19 @@ class IsInIndexes:
 
     def time_isin_index(self):
         self.series.isin(self.index)
+
+
+class IsInLargeKeys:
+    # most of the values are not in the keys
+    params = [False, True]
+    param_names = ["keys_index"]
+
+    def setup(self, keys_index):
+        rng = np.random.default_rng(0)
+        keys = rng.integers(0, 2**40, 2_000_000)
+        self.keys = Index(keys) if keys_index else keys
+        self.series = Series(rng.integers(0, 2**40, 5_000_000))
+        self.series.isin(self.keys)
+
+    def time_isin(self, keys_index):
+        self.series.isin(self.keys)
@@ -197,5 +197,15 @@ class FromArrays:
             verify_integrity=False,
         )
 
+    def time_frame_from_arrays_public_float(self):
+        self.df = DataFrame.from_arrays(
+            self.float_arrays, index=self.index, columns=self.columns
+        )
+
+    def time_frame_from_arrays_public_int(self):
+        self.df = DataFrame.from_arrays(
+            self.int_arrays, index=self.index, columns=self.columns
+        )
+
 
 from .pandas_vb_common import setup  # noqa: F401 isort:skip
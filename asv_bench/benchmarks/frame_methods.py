@@ -11,6 +11,7 @@ from pandas import (
     Series,
     date_range,
     isnull,
+    option_context,
     period_range,
     timedelta_range,
 )
@@ -886,4 +887,41 @@ class Update:
         self.df_sample.update(self.df)
 
 
+class WideFrameColumnStore:
+    # each column of a non-consolidated frame keeps its own block
+    params = [True, False]
+    param_names = ["consolidate"]
+
+    def setup(self, consolidate):
+        N, K = 100, 10_000
+        self.arrays = {i: np.random.randn(N) for i in range(K)}
+        with option_context("mode.consolidate", consolidate):
+            self.df = DataFrame(self.arrays)
+
+    def time_build_by_column(self, consolidate):
+        with option_context("mode.consolidate", consolidate):
+            with warnings.catch_warnings(record=True):
+                df = DataFrame(index=range(100))
+                for key, arr in self.arrays.items():
+                    df[key] = arr
+                df.copy()
+
+    def time_from_dict(self, consolidate):
+        with option_context("mode.consolidate", consolidate):
+            DataFrame(self.arrays)
+
+    def time_sum_axis_0(self, consolidate):
+        self.df.sum()
+
+    def time_sum_axis_1(self, consolidate):
+        self.df.sum(axis=1)
+
+    def time_row(self, consolidate):
+        self.df.iloc[50]
+
+    def time_copy(self, consolidate):
+        with option_context("mode.consolidate", consolidate):
+            self.df.copy()
+
+
 from .pandas_vb_common import setup  # noqa: F401 isort:skip
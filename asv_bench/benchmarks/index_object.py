@@ -10,6 +10,7 @@ from pandas import (
     RangeIndex,
     Series,
     date_range,
+    set_option,
 )
 
 
@@ -242,6 +243,34 @@ class IntervalIndexMethod:
         self.intv.intersection(self.intv2)
 
 
+class IntervalIndexGetIndexer:
+    params = [[1, 4], ["unique", "non_unique"]]
+    param_names = ["num_threads", "method"]
+
+    def setup(self, num_threads, method):
+        N = 10**5
+        rng = np.random.default_rng(42)
+        left = np.sort(rng.integers(0, 10**9, N))
+        self.unique = IntervalIndex.from_breaks(np.arange(0, 10**7, 10))
+        self.overlapping = IntervalIndex.from_arrays(
+            left, left + rng.integers(1, 10**5, N)
+        )
+        self.target = rng.integers(0, 10**7, 10**6)
+        # build the trees outside of the timings
+        self.unique.get_indexer(self.target[:1])
+        self.overlapping.get_indexer_non_unique(self.target[:1])
+        set_option("compute.num_threads", num_threads)
+
+    def teardown(self, num_threads, method):
+        set_option("compute.num_threads", 1)
+
+    def time_get_indexer(self, num_threads, method):
+        if method == "unique":
+            self.unique.get_indexer(self.target)
+        else:
+            self.overlapping.get_indexer_non_unique(self.target * 100)
+
+
 class GC:
     params = [1, 2, 5]
 
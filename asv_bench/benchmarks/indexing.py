@@ -185,6 +185,24 @@ class DataFrameStringIndexing:
         self.df[self.boolean_indexer]
 
 
+class DataFrameSetValues:
+    def setup(self):
+        index = Index([f"i-{i}" for i in range(1000)], dtype=object)
+        columns = Index([f"i-{i}" for i in range(30)], dtype=object)
+        self.df = DataFrame(np.random.randn(1000, 30), index=index, columns=columns)
+        rng = np.random.default_rng(0)
+        self.rows = index[rng.integers(0, 1000, 10_000)]
+        self.cols = columns[rng.integers(0, 30, 10_000)]
+        self.values = rng.standard_normal(10_000)
+
+    def time_at_setitem_loop(self):
+        for row, col, value in zip(self.rows, self.cols, self.values):
+            self.df.at[row, col] = value
+
+    def time_set_values(self):
+        self.df.set_values(self.rows, self.cols, self.values)
+
+
 class DataFrameNumericIndexing:
     params = [
         (np.int64, np.uint64, np.float64),
@@ -12,6 +12,8 @@ import numpy as np
 
 from pandas._libs import index as libindex
 
+from pandas import Timestamp
+
 from pandas.core.arrays import BaseMaskedArray
 
 
@@ -174,3 +176,45 @@ class ObjectEngineIndexing:
 
     def time_get_loc(self, index_type):
         self.data.get_loc("b")
+
+
+class SortedEngineIndexing:
+    # above SIZE_CUTOFF, unique monotonic indexes are searched with
+    #  searchsorted instead of populating a hash table
+    params = [
+        [("Int64Engine", np.int64), ("DatetimeEngine", "M8[ns]")],
+        ["monotonic_incr", "monotonic_decr", "non_monotonic"],
+    ]
+    param_names = ["engine_and_dtype", "index_type"]
+
+    def setup(self, engine_and_dtype, index_type):
+        engine_name, dtype = engine_and_dtype
+        N = 2 * 10**6
+        arr = np.arange(N, dtype=np.int64)
+        if index_type == "monotonic_decr":
+            arr = arr[::-1]
+        elif index_type == "non_monotonic":
+            arr = np.random.default_rng(42).permutation(arr)
+        self.arr = arr.view(dtype)
+        self.engine_type = getattr(libindex, engine_name)
+        self.data = self.engine_type(self.arr)
+        box = Timestamp if engine_name == "DatetimeEngine" else lambda x: x
+        self.data.get_loc(box(self.arr[2]))
+        self.targets = self.arr[::10].copy()
+        self.key_middle = box(self.arr[N // 2])
+
+    def time_get_loc(self, engine_and_dtype, index_type):
+        self.data.get_loc(self.key_middle)
+
+    def time_get_indexer(self, engine_and_dtype, index_type):
+        self.data.get_indexer(self.targets.view("i8"))
+
+    def peakmem_get_indexer(self, engine_and_dtype, index_type):
+        self.engine_type(self.arr).get_indexer(self.targets.view("i8"))
+
+    def track_sizeof(self, engine_and_dtype, index_type):
+        engine = self.engine_type(self.arr)
+        engine.get_indexer(self.targets.view("i8"))
+        return engine.sizeof()
+
+    track_sizeof.unit = "bytes"
@@ -27,9 +27,21 @@ class GetLoc:
             [np.arange(100), list("A"), list("A")], names=["one", "two", "three"]
         )
 
+        # label combinations overflowing 64 bits
+        self.mi_wide = MultiIndex.from_arrays([np.arange(10**6)] * 5)
+        self.key_wide = self.mi_wide[-1]
+        self.mi_wide.get_loc(self.key_wide)
+
     def time_large_get_loc(self):
         self.mi_large.get_loc((999, 19, "Z"))
 
+    def time_wide_get_loc_warm(self):
+        for _ in range(1000):
+            self.mi_wide.get_loc(self.key_wide)
+
+    def time_wide_get_indexer(self):
+        self.mi_wide.get_indexer(self.mi_wide[::2])
+
     def time_large_get_loc_warm(self):
         for _ in range(1000):
             self.mi_large.get_loc((999, 19, "Z"))
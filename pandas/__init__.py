@@ -100,6 +100,7 @@ from pandas.core.api import (
     Grouper,
     factorize,
     unique,
+    ValueCountsAccumulator,
     NamedAgg,
     array,
     Categorical,
@@ -278,6 +279,7 @@ __all__ = [
     "UInt16Dtype",
     "UInt32Dtype",
     "UInt64Dtype",
+    "ValueCountsAccumulator",
     "api",
     "array",
     "arrays",
@@ -151,6 +151,12 @@ class ObjectVector:
     def __len__(self) -> int: ...
     def to_array(self) -> npt.NDArray[np.object_]: ...
 
+class BloomFilter:
+    words: npt.NDArray[np.uint64]
+    def __init__(self, size: int) -> None: ...
+    def add(self, values: np.ndarray) -> None: ...
+    def contains(self, values: np.ndarray) -> npt.NDArray[np.bool_]: ...
+
 class HashTable:
     # NB: The base HashTable class does _not_ actually have these methods;
     #  we are putting them here for the sake of mypy to avoid
@@ -269,6 +275,7 @@ def value_count(
 def ismember(
     arr: np.ndarray,
     values: np.ndarray,
+    use_bloom: bool = ...,
 ) -> npt.NDArray[np.bool_]: ...
 def object_hash(obj) -> int: ...
 def objects_are_equal(a, b) -> bool: ...
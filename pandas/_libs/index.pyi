@@ -6,7 +6,10 @@ from pandas import (
     Index,
     MultiIndex,
 )
-from pandas.core.arrays import ExtensionArray
+from pandas.core.arrays import (
+    ArrowStringArray,
+    ExtensionArray,
+)
 
 multiindex_nulls_shift: int
 
@@ -29,6 +32,7 @@ class IndexEngine:
     def is_mapping_populated(self) -> bool: ...
     def clear_mapping(self): ...
     def get_indexer(self, values: np.ndarray) -> npt.NDArray[np.intp]: ...
+    def isin(self, values: np.ndarray) -> npt.NDArray[np.bool_]: ...
     def get_indexer_non_unique(
         self,
         targets: np.ndarray,
@@ -105,3 +109,19 @@ class ExtensionEngine:
     def is_monotonic_decreasing(self) -> bool: ...
     def sizeof(self, deep: bool = ...) -> int: ...
     def clear_mapping(self): ...
+
+class ArrowStringEngine(ExtensionEngine):
+    def __init__(
+        self,
+        values: ArrowStringArray,
+        offsets: npt.NDArray[np.int64],
+        data: npt.NDArray[np.uint8],
+        mask: npt.NDArray[np.bool_] | None,
+    ) -> None: ...
+    def get_indexer(
+        self, values: npt.NDArray[np.object_] | ArrowStringArray
+    ) -> npt.NDArray[np.intp]: ...
+    def get_indexer_non_unique(
+        self,
+        targets: npt.NDArray[np.object_] | ArrowStringArray,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: ...
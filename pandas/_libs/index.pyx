@@ -1,5 +1,7 @@
 cimport cython
 from cpython.sequence cimport PySequence_GetItem
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize
+from libc.string cimport memcmp
 
 import numpy as np
 
@@ -9,6 +11,7 @@ from numpy cimport (
     intp_t,
     ndarray,
     uint8_t,
+    uint64_t,
 )
 
 cnp.import_array()
@@ -43,6 +46,7 @@ from pandas._libs.missing cimport (
 )
 
 from decimal import InvalidOperation
+import threading
 
 # Defines shift of MultiIndex codes to avoid negative codes (missing values)
 multiindex_nulls_shift = 2
@@ -148,10 +152,17 @@ cdef class IndexEngine:
         bint unique, monotonic_inc, monotonic_dec
         bint need_monotonic_check, need_unique_check
         object _np_type
+        # Bloom filter of the values, built by isin for large indexes
+        object bloom
+        # engines are shared between indexes with the same values, which may
+        #  be used from several threads, so the mapping is populated under a lock
+        object _populate_lock
+        object __weakref__
 
     def __init__(self, ndarray values):
         self.values = values
         self.mask = None
+        self._populate_lock = threading.Lock()
 
         self.over_size_threshold = len(values) >= _SIZE_CUTOFF
         self.clear_mapping()
@@ -321,6 +332,11 @@ cdef class IndexEngine:
             if is_strict_monotonic:
                 self.unique = 1
                 self.need_unique_check = 0
+            elif self.monotonic_inc or self.monotonic_dec:
+                # monotonic but not strictly so: there are duplicates, no need
+                #  to populate the mapping to find out
+                self.unique = 0
+                self.need_unique_check = 0
 
     cdef _call_monotonic(self, values):
         return algos.is_monotonic(values, timelike=False)
@@ -342,18 +358,22 @@ cdef class IndexEngine:
         # also satisfies the need_unique_check
 
         if not self.is_mapping_populated:
+            with self._populate_lock:
+                if not self.is_mapping_populated:
+                    values = self.values
+                    mapping = self._make_hash_table(len(values))
+                    mapping.map_locations(values, self.mask)
 
-            values = self.values
-            self.mapping = self._make_hash_table(len(values))
-            self.mapping.map_locations(values, self.mask)
-
-            if len(self.mapping) == len(values):
-                self.unique = 1
+                    if len(mapping) == len(values):
+                        self.unique = 1
+                    # only publish the mapping once it is complete
+                    self.mapping = mapping
 
         self.need_unique_check = 0
 
     def clear_mapping(self):
         self.mapping = None
+        self.bloom = None
         self.need_monotonic_check = 1
         self.need_unique_check = 1
 
@@ -362,9 +382,79 @@ cdef class IndexEngine:
         self.monotonic_dec = 0
 
     def get_indexer(self, ndarray values) -> np.ndarray:
+        if self._use_searchsorted(values):
+            return self._get_indexer_sorted(values)
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
+    def isin(self, ndarray values) -> np.ndarray:
+        """
+        Return whether each of the values, of the dtype of the index, is in
+        the index.
+
+        The hash table of the index is reused between calls. Large numeric
+        indexes also keep a Bloom filter of their values, which is checked
+        first to skip probing the hash table for most of the values which are
+        not in the index, if a sample of the values is mostly not in the index.
+        """
+        cdef:
+            ndarray[uint8_t, cast=True] result
+
+        if self._use_searchsorted(values):
+            return self._get_indexer_sorted(values) != -1
+        self._ensure_mapping_populated()
+        if not self.over_size_threshold or self.values.dtype.kind not in "iuf":
+            return self.mapping.lookup(values) != -1
+
+        sample = values[:: max(len(values) // 1024, 1)]
+        if len(sample) == 0 or (self.mapping.lookup(sample) != -1).mean() >= 0.25:
+            return self.mapping.lookup(values) != -1
+
+        bloom = self.bloom
+        if bloom is None:
+            bloom = _hash.BloomFilter(len(self.values))
+            bloom.add(self.values)
+            self.bloom = bloom
+        result = bloom.contains(values)
+        result[result] = self.mapping.lookup(values[result]) != -1
+        return result
+
+    cdef bint _use_searchsorted(self, ndarray targets):
+        # For large unique monotonic indexes, binary search avoids building
+        #  a hash table about as large as the values themselves.
+        if not self.over_size_threshold or self.is_mapping_populated:
+            return False
+        if self.mask is not None or self.values.dtype.kind == "O":
+            return False
+        if targets.dtype != self.values.dtype:
+            return False
+        if not (self.is_monotonic_increasing or self.is_monotonic_decreasing):
+            return False
+        return self.unique == 1
+
+    cdef ndarray _get_indexer_sorted(self, ndarray targets):
+        """
+        Return the positions of ``targets`` in the unique monotonic values, or
+        -1 when missing, using binary search instead of the hash table.
+        """
+        cdef:
+            ndarray values = self.values
+            ndarray[intp_t] indexer
+            Py_ssize_t n = len(values)
+
+        if n == 0:
+            return np.full(len(targets), -1, dtype=np.intp)
+
+        if not self.monotonic_inc:
+            values = values[::-1]
+        indexer = np.asarray(values.searchsorted(targets, side="left"), dtype=np.intp)
+        # NaN targets never compare equal, so they are reported as missing
+        missing = values.take(np.minimum(indexer, n - 1)) != targets
+        if not self.monotonic_inc:
+            indexer = n - 1 - indexer
+        indexer[missing] = -1
+        return indexer
+
     def get_indexer_non_unique(self, ndarray targets):
         """
         Return an indexer suitable for taking from a non unique index
@@ -1179,6 +1269,362 @@ cdef class ExtensionEngine(SharedEngine):
         hash(val)
 
 
+cdef inline uint64_t _hash_utf8(const char* buf, Py_ssize_t n) noexcept nogil:
+    # 64-bit FNV-1a
+    cdef:
+        uint64_t h = 0xcbf29ce484222325ULL
+        Py_ssize_t i
+
+    for i in range(n):
+        h = (h ^ <uint8_t>buf[i]) * 0x100000001b3ULL
+    return h
+
+
+cdef class ArrowStringEngine(ExtensionEngine):
+    """
+    Engine for an ArrowStringArray, hashing the UTF-8 bytes of the Arrow
+    buffers instead of converting the values to Python strings.
+
+    Equal values are chained in order of their position, so that lookups of
+    duplicated values do not need to scan the values.
+    """
+
+    cdef:
+        ndarray offsets, data, mask
+        ndarray _table, _hashes, _next
+        intp_t _na_head
+        uint64_t _table_mask
+        bint _mapping_populated
+
+    def __init__(
+        self,
+        values: "ArrowStringArray",
+        ndarray offsets,
+        ndarray data,
+        object mask,
+    ):
+        super().__init__(values)
+        # offsets: int64 with len(values) + 1 entries, data: the UTF-8 bytes,
+        #  mask: True for missing values (or None)
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        self.data = np.ascontiguousarray(data, dtype=np.uint8)
+        self.mask = None if mask is None else np.asarray(mask, dtype=bool)
+        self._mapping_populated = False
+
+    def clear_mapping(self):
+        self._table = None
+        self._hashes = None
+        self._next = None
+        self._mapping_populated = False
+
+    def sizeof(self, deep: bool = False) -> int:
+        """ return the sizeof our mapping """
+        if not self._mapping_populated:
+            return 0
+        return self._table.nbytes + self._hashes.nbytes + self._next.nbytes
+
+    @property
+    def is_unique(self) -> bool:
+        if self.need_unique_check:
+            self._ensure_mapping_populated()
+        return self.unique
+
+    cdef _do_monotonic_check(self):
+        # compare the UTF-8 bytes of consecutive values, whose order matches
+        #  the order of the code points
+        cdef:
+            Py_ssize_t i, n = len(self.offsets) - 1
+            int64_t prev_len, cur_len
+            int cmp
+            bint inc = 1, dec = 1, strict = 1
+            const int64_t* offsets
+            const char* data
+
+        self.need_monotonic_check = 0
+        if self.mask is not None and self.mask.any():
+            self.monotonic_inc = 0
+            self.monotonic_dec = 0
+            return
+
+        offsets = <const int64_t*>cnp.PyArray_DATA(self.offsets)
+        data = <const char*>cnp.PyArray_DATA(self.data)
+        with nogil:
+            for i in range(1, n):
+                prev_len = offsets[i] - offsets[i - 1]
+                cur_len = offsets[i + 1] - offsets[i]
+                cmp = memcmp(
+                    data + offsets[i - 1],
+                    data + offsets[i],
+                    min(prev_len, cur_len),
+                )
+                if cmp == 0:
+                    cmp = (prev_len > cur_len) - (prev_len < cur_len)
+                if cmp > 0:
+                    inc = 0
+                elif cmp < 0:
+                    dec = 0
+                else:
+                    strict = 0
+                if not inc and not dec:
+                    break
+
+        self.monotonic_inc = inc
+        self.monotonic_dec = dec
+        # we can only be sure of uniqueness if strictly monotonic
+        if strict and (inc or dec):
+            self.unique = 1
+            self.need_unique_check = 0
+
+    cdef _ensure_mapping_populated(self):
+        cdef:
+            Py_ssize_t i, n = len(self.offsets) - 1, n_groups = 0
+            Py_ssize_t capacity = 8
+            intp_t pos, na_tail = -1
+            uint64_t h, slot, table_mask
+            const int64_t* offsets
+            const char* data
+            const uint8_t* mask = NULL
+            intp_t* table
+            intp_t* tails
+            intp_t* nxt
+            uint64_t* hashes
+            ndarray tails_arr
+
+        if self._mapping_populated:
+            return
+
+        while capacity < 2 * n:
+            capacity <<= 1
+        table_mask = capacity - 1
+
+        self._table = np.full(capacity, -1, dtype=np.intp)
+        self._hashes = np.empty(n, dtype=np.uint64)
+        self._next = np.full(n, -1, dtype=np.intp)
+        tails_arr = np.empty(capacity, dtype=np.intp)
+
+        offsets = <const int64_t*>cnp.PyArray_DATA(self.offsets)
+        data = <const char*>cnp.PyArray_DATA(self.data)
+        if self.mask is not None:
+            mask = <const uint8_t*>cnp.PyArray_DATA(self.mask)
+        table = <intp_t*>cnp.PyArray_DATA(self._table)
+        tails = <intp_t*>cnp.PyArray_DATA(tails_arr)
+        nxt = <intp_t*>cnp.PyArray_DATA(self._next)
+        hashes = <uint64_t*>cnp.PyArray_DATA(self._hashes)
+
+        self._na_head = -1
+        with nogil:
+            for i in range(n):
+                if mask != NULL and mask[i]:
+                    if na_tail == -1:
+                        self._na_head = i
+                        n_groups += 1
+                    else:
+                        nxt[na_tail] = i
+                    na_tail = i
+                    continue
+
+                h = _hash_utf8(data + offsets[i], offsets[i + 1] - offsets[i])
+                hashes[i] = h
+                slot = h & table_mask
+                while True:
+                    pos = table[slot]
+                    if pos == -1:
+                        table[slot] = i
+                        tails[slot] = i
+                        n_groups += 1
+                        break
+                    if hashes[pos] == h and self._equals(
+                        pos, data + offsets[i], offsets[i + 1] - offsets[i]
+                    ):
+                        nxt[tails[slot]] = i
+                        tails[slot] = i
+                        break
+                    slot = (slot + 1) & table_mask
+
+        self._table_mask = table_mask
+        self.unique = n_groups == n
+        self.need_unique_check = 0
+        self._mapping_populated = True
+
+    cdef inline bint _equals(
+        self, intp_t pos, const char* key, Py_ssize_t length
+    ) noexcept nogil:
+        cdef:
+            const int64_t* offsets = <const int64_t*>cnp.PyArray_DATA(self.offsets)
+            const char* data = <const char*>cnp.PyArray_DATA(self.data)
+            Py_ssize_t start = offsets[pos]
+
+        return (
+            offsets[pos + 1] - start == length
+            and memcmp(data + start, key, length) == 0
+        )
+
+    cdef inline intp_t _lookup(
+        self, const char* key, Py_ssize_t length
+    ) noexcept nogil:
+        # position of the first occurrence of the key, -1 if not found
+        cdef:
+            uint64_t h = _hash_utf8(key, length)
+            uint64_t slot = h & self._table_mask
+            const intp_t* table = <const intp_t*>cnp.PyArray_DATA(self._table)
+            const uint64_t* hashes = <const uint64_t*>cnp.PyArray_DATA(self._hashes)
+            intp_t pos
+
+        while True:
+            pos = table[slot]
+            if pos == -1 or (hashes[pos] == h and self._equals(pos, key, length)):
+                return pos
+            slot = (slot + 1) & self._table_mask
+
+    cdef intp_t _lookup_scalar(self, object val) except? -2:
+        cdef:
+            const char* key
+            Py_ssize_t length
+
+        if isinstance(val, str):
+            try:
+                key = PyUnicode_AsUTF8AndSize(val, &length)
+            except UnicodeEncodeError:
+                # e.g. lone surrogates, which cannot be in an Arrow array
+                return -1
+            return self._lookup(key, length)
+        elif checknull(val):
+            return self._na_head
+        return -1
+
+    cdef ndarray _lookup_heads(self, object targets):
+        # ndarray[intp] with the first matching position of each target
+        cdef:
+            Py_ssize_t i, n
+            ndarray[intp_t, ndim=1] result
+            intp_t* res
+            const int64_t* t_offsets
+            const char* t_data
+            const uint8_t* t_mask = NULL
+            ndarray offsets_arr, data_arr
+
+        self._ensure_mapping_populated()
+
+        if isinstance(targets, np.ndarray):
+            n = len(targets)
+            result = np.empty(n, dtype=np.intp)
+            for i in range(n):
+                result[i] = self._lookup_scalar(targets[i])
+            return result
+
+        # an ArrowStringArray, compare its buffers directly
+        offsets_arr, data_arr, mask_arr = targets._utf8_buffers()
+        offsets_arr = np.ascontiguousarray(offsets_arr, dtype=np.int64)
+        data_arr = np.ascontiguousarray(data_arr, dtype=np.uint8)
+        if mask_arr is not None:
+            mask_arr = np.ascontiguousarray(mask_arr, dtype=bool)
+            t_mask = <const uint8_t*>cnp.PyArray_DATA(mask_arr)
+
+        n = len(offsets_arr) - 1
+        result = np.empty(n, dtype=np.intp)
+        res = <intp_t*>cnp.PyArray_DATA(result)
+        t_offsets = <const int64_t*>cnp.PyArray_DATA(offsets_arr)
+        t_data = <const char*>cnp.PyArray_DATA(data_arr)
+        with nogil:
+            for i in range(n):
+                if t_mask != NULL and t_mask[i]:
+                    res[i] = self._na_head
+                else:
+                    res[i] = self._lookup(
+                        t_data + t_offsets[i], t_offsets[i + 1] - t_offsets[i]
+                    )
+        return result
+
+    cpdef get_loc(self, object val):
+        # -> Py_ssize_t | slice | ndarray[bool]
+        cdef:
+            intp_t loc, last
+            const intp_t* nxt
+            ndarray[uint8_t, ndim=1, cast=True] indexer
+
+        if is_definitely_invalid_key(val):
+            raise TypeError(f"'{val}' is an invalid key")
+
+        self._ensure_mapping_populated()
+        loc = self._lookup_scalar(val)
+        if loc == -1:
+            raise KeyError(val)
+
+        nxt = <const intp_t*>cnp.PyArray_DATA(self._next)
+        if nxt[loc] == -1:
+            return loc
+
+        if self.is_monotonic_increasing:
+            # the duplicates are contiguous
+            last = loc
+            while nxt[last] != -1:
+                last = nxt[last]
+            return slice(loc, last + 1)
+
+        indexer = np.zeros(len(self.offsets) - 1, dtype=bool)
+        while loc != -1:
+            indexer[loc] = 1
+            loc = nxt[loc]
+        return indexer
+
+    def get_indexer(self, values) -> np.ndarray:
+        # values : ndarray[object] or ArrowStringArray
+        # Note: we only get here with self.is_unique
+        return self._lookup_heads(values)
+
+    def get_indexer_non_unique(self, targets):
+        """
+        Return an indexer suitable for taking from a non unique index
+        return the labels in the same order as the target
+        and a missing indexer into the targets (which correspond
+        to the -1 indices in the results
+
+        Parameters
+        ----------
+        targets : ndarray[object] or ArrowStringArray
+
+        Returns
+        -------
+        indexer : np.ndarray[np.intp]
+        missing : np.ndarray[np.intp]
+        """
+        cdef:
+            ndarray[intp_t, ndim=1] heads, result, missing
+            const intp_t* nxt
+            Py_ssize_t i, j = 0, n_missing = 0, count = 0, n_t
+            intp_t loc
+
+        heads = self._lookup_heads(targets)
+        nxt = <const intp_t*>cnp.PyArray_DATA(self._next)
+        n_t = len(heads)
+
+        with nogil:
+            for i in range(n_t):
+                loc = heads[i]
+                if loc == -1:
+                    count += 1
+                while loc != -1:
+                    count += 1
+                    loc = nxt[loc]
+
+        result = np.empty(count, dtype=np.intp)
+        missing = np.empty(n_t, dtype=np.intp)
+        with nogil:
+            for i in range(n_t):
+                loc = heads[i]
+                if loc == -1:
+                    result[j] = -1
+                    j += 1
+                    missing[n_missing] = i
+                    n_missing += 1
+                while loc != -1:
+                    result[j] = loc
+                    j += 1
+                    loc = nxt[loc]
+
+        return result, missing[:n_missing]
+
+
 cdef class MaskedIndexEngine(IndexEngine):
     def __init__(self, object values):
         super().__init__(self._get_data(values))
@@ -24,7 +24,9 @@ from numpy cimport (
     PyArray_Take,
     float64_t,
     int64_t,
+    intp_t,
     ndarray,
+    uint8_t,
     uint64_t,
 )
 
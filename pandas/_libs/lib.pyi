@@ -146,6 +146,11 @@ def convert_nans_to_NA(
     arr: npt.NDArray[np.object_],
 ) -> npt.NDArray[np.object_]: ...
 def fast_zip(ndarrays: list) -> npt.NDArray[np.object_]: ...
+def rows_from_columns(
+    columns: list[list],
+    row_type: type[tuple] | None = ...,
+    keys: list | None = ...,
+) -> list: ...
 
 # TODO: can we be more specific about rows?
 def to_object_array_tuples(rows: object) -> ndarray_obj_2d: ...
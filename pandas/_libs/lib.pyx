@@ -431,6 +431,67 @@ def fast_zip(list ndarrays) -> ndarray[object]:
     return result
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def rows_from_columns(
+    list columns, object row_type=None, list keys=None
+) -> list:
+    """
+    Build the rows of a table from lists of the boxed values of its columns.
+
+    Parameters
+    ----------
+    columns : list of lists
+        The values of each column, all of the same length.
+    row_type : type, optional
+        A subclass of tuple, such as a namedtuple, to create the rows with.
+        By default, the rows are tuples.
+    keys : list, optional
+        Create the rows as dicts with these keys, one for each column.
+
+    Returns
+    -------
+    list
+    """
+    cdef:
+        Py_ssize_t i, j, n, k = len(columns)
+        list col, result
+        dict row
+        object val, tup
+
+    if k == 0:
+        return []
+
+    n = len(columns[0])
+    for j in range(1, k):
+        if len(columns[j]) != n:
+            raise ValueError("all columns must be same length")
+
+    result = [None] * n
+    if keys is not None:
+        if len(keys) != k:
+            raise ValueError("keys must be of the same length as columns")
+        for i in range(n):
+            row = {}
+            for j in range(k):
+                col = columns[j]
+                row[keys[j]] = col[i]
+            result[i] = row
+        return result
+
+    for i in range(n):
+        tup = PyTuple_New(k)
+        for j in range(k):
+            col = columns[j]
+            val = col[i]
+            Py_INCREF(val)
+            PyTuple_SET_ITEM(tup, j, val)
+        if row_type is not None:
+            tup = tuple.__new__(row_type, tup)
+        result[i] = tup
+    return result
+
+
 def get_reverse_indexer(const intp_t[:] indexer, Py_ssize_t length) -> ndarray:
     """
     Reverse indexing operation.
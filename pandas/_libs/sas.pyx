@@ -31,12 +31,12 @@ cdef struct Buffer:
     size_t length
 
 
-cdef uint8_t buf_get(Buffer buf, size_t offset) except? 255:
+cdef uint8_t buf_get(Buffer buf, size_t offset) except? 255 nogil:
     assert offset < buf.length, "Out of bounds read"
     return buf.data[offset]
 
 
-cdef bint buf_set(Buffer buf, size_t offset, uint8_t value) except 0:
+cdef bint buf_set(Buffer buf, size_t offset, uint8_t value) except 0 nogil:
     assert offset < buf.length, "Out of bounds write"
     buf.data[offset] = value
     return True
@@ -54,7 +54,7 @@ cdef Buffer buf_new(size_t length) except *:
     return Buffer(data, length)
 
 
-cdef buf_free(Buffer buf):
+cdef void buf_free(Buffer buf) noexcept:
     if buf.data != NULL:
         free(buf.data)
 
@@ -63,7 +63,7 @@ cdef buf_free(Buffer buf):
 #
 # https://cran.r-project.org/package=sas7bdat/vignettes/sas7bdat.pdf
 # Licence at LICENSES/SAS7BDAT_LICENSE
-cdef int rle_decompress(Buffer inbuff, Buffer outbuff) except? 0:
+cdef int rle_decompress(Buffer inbuff, Buffer outbuff) except? 0 nogil:
 
     cdef:
         uint8_t control_byte, x
@@ -151,7 +151,8 @@ cdef int rle_decompress(Buffer inbuff, Buffer outbuff) except? 0:
                 buf_set(outbuff, rpos, 0x00)
                 rpos += 1
         else:
-            raise ValueError(f"unknown control byte: {control_byte}")
+            with gil:
+                raise ValueError(f"unknown control byte: {control_byte}")
 
     return rpos
 
@@ -159,7 +160,7 @@ cdef int rle_decompress(Buffer inbuff, Buffer outbuff) except? 0:
 # rdc_decompress decompresses data using the Ross Data Compression algorithm:
 #
 # http://collaboration.cmc.ec.gc.ca/science/rpn/biblio/ddj/Website/articles/CUJ/1992/9210/ross/ross.htm
-cdef int rdc_decompress(Buffer inbuff, Buffer outbuff) except? 0:
+cdef int rdc_decompress(Buffer inbuff, Buffer outbuff) except? 0 nogil:
 
     cdef:
         uint8_t cmd
@@ -309,6 +310,7 @@ cdef class Parser:
         int64_t[:] column_types
         uint8_t[:, :] byte_chunk
         object[:, :] string_chunk
+        Buffer decompressed_row
         uint8_t *cached_page
         int cached_page_len
         int current_row_on_page_index
@@ -324,7 +326,7 @@ cdef class Parser:
         int subheader_pointer_length
         int current_page_type
         bint is_little_endian
-        int (*decompress)(Buffer, Buffer) except? 0
+        int (*decompress)(Buffer, Buffer) except? 0 nogil
         object parser
 
     def __init__(self, object parser):
@@ -368,11 +370,19 @@ cdef class Parser:
         else:
             self.decompress = NULL
 
+        # rows are decompressed into a single buffer that is reused for the
+        # whole chunk instead of allocating one per row
+        if self.decompress != NULL:
+            self.decompressed_row = buf_new(self.row_length)
+
         # update to current state of the parser
         self.current_row_in_chunk_index = parser._current_row_in_chunk_index
         self.current_row_in_file_index = parser._current_row_in_file_index
         self.current_row_on_page_index = parser._current_row_on_page_index
 
+    def __dealloc__(self):
+        buf_free(self.decompressed_row)
+
     def read(self, int nrows):
         cdef:
             bint done
@@ -483,7 +493,7 @@ cdef class Parser:
             Py_ssize_t j
             int s, k, m, jb, js, current_row, rpos
             int64_t lngt, start, ct
-            Buffer source, decompressed_source
+            Buffer source
             int64_t[:] column_types
             int64_t[:] lengths
             int64_t[:] offsets
@@ -496,14 +506,16 @@ cdef class Parser:
 
         compressed = self.decompress != NULL and length < self.row_length
         if compressed:
-            decompressed_source = buf_new(self.row_length)
-            rpos = self.decompress(source, decompressed_source)
+            # the decompression only touches C buffers, so let other threads
+            # (e.g. reading other files or chunks) run in the meantime
+            with nogil:
+                rpos = self.decompress(source, self.decompressed_row)
             if rpos != self.row_length:
                 raise ValueError(
                     f"Expected decompressed line of length {self.row_length} bytes "
                     f"but decompressed {rpos} bytes"
                 )
-            source = decompressed_source
+            source = self.decompressed_row
 
         current_row = self.current_row_in_chunk_index
         column_types = self.column_types
@@ -544,6 +556,3 @@ cdef class Parser:
         self.current_row_on_page_index += 1
         self.current_row_in_chunk_index += 1
         self.current_row_in_file_index += 1
-
-        if compressed:
-            buf_free(decompressed_source)
@@ -0,0 +1,46 @@
+import numpy as np
+
+from pandas._typing import npt
+
+MIN_PRECISION: int
+MAX_PRECISION: int
+
+class HyperLogLog:
+    precision: int
+    registers: npt.NDArray[np.uint8]
+    def __init__(self, precision: int = ...) -> None: ...
+    def update(self, hashes: npt.NDArray[np.uint64]) -> None: ...
+    def merge(self, other: HyperLogLog) -> None: ...
+    def estimate(self) -> float: ...
+
+def group_nunique_approx(
+    hashes: npt.NDArray[np.uint64],
+    labels: npt.NDArray[np.intp],
+    ngroups: int,
+    precision: int = ...,
+) -> npt.NDArray[np.float64]: ...
+
+class TDigest:
+    def __init__(self, compression: float = ...) -> None: ...
+    @property
+    def compression(self) -> float: ...
+    @property
+    def count(self) -> float: ...
+    @property
+    def centroids(
+        self,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]: ...
+    def update(self, values: np.ndarray) -> None: ...
+    def merge(self, other: TDigest) -> None: ...
+    def quantile(self, qs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]: ...
+
+def group_quantile_approx(
+    out: np.ndarray,  # float64_t[:, ::1]
+    values: np.ndarray,  # const float64_t[:]
+    mask: npt.NDArray[np.uint8],
+    qs: npt.NDArray[np.float64],
+    starts: npt.NDArray[np.int64],
+    ends: npt.NDArray[np.int64],
+    result_mask: np.ndarray | None,  # uint8_t[:, ::1] | None
+    compression: float = ...,
+) -> None: ...
@@ -0,0 +1,706 @@
+"""
+Probabilistic sketches summarizing data in a fixed amount of memory.
+
+The sketches are mergeable: the sketches of chunks of data combine into the
+sketch of all the data.
+"""
+cimport cython
+from libc.math cimport (
+    M_PI,
+    NAN,
+    asin,
+    ceil,
+    ldexp,
+    log,
+    sin,
+)
+from libc.stdlib cimport (
+    free,
+    malloc,
+    realloc,
+)
+
+import numpy as np
+
+cimport numpy as cnp
+from numpy cimport (
+    float64_t,
+    int64_t,
+    intp_t,
+    ndarray,
+    uint8_t,
+    uint64_t,
+)
+
+cnp.import_array()
+
+
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #include <intrin.h>
+    #endif
+
+    static inline int pd_clz64(uint64_t x) {
+    #if defined(_MSC_VER)
+        unsigned long index;
+        return _BitScanReverse64(&index, x) ? 63 - (int)index : 64;
+    #else
+        return x ? __builtin_clzll(x) : 64;
+    #endif
+    }
+    """
+    int pd_clz64(uint64_t x) nogil
+
+
+# ----------------------------------------------------------------------
+# HyperLogLog
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+
+cdef inline void _hll_add(
+    uint8_t* registers, int precision, uint64_t h
+) noexcept nogil:
+    cdef:
+        uint64_t index = h >> (64 - precision)
+        int rank = pd_clz64(h << precision) + 1
+
+    if rank > 65 - precision:
+        # all the bits after the index are zero
+        rank = 65 - precision
+    if rank > registers[index]:
+        registers[index] = rank
+
+
+cdef float64_t _hll_estimate(const uint8_t* registers, int precision) noexcept nogil:
+    cdef:
+        Py_ssize_t j, m = 1 << precision, zeros = 0
+        float64_t total = 0, alpha, estimate
+
+    for j in range(m):
+        total += ldexp(1.0, -registers[j])
+        if registers[j] == 0:
+            zeros += 1
+
+    if m == 16:
+        alpha = 0.673
+    elif m == 32:
+        alpha = 0.697
+    elif m == 64:
+        alpha = 0.709
+    else:
+        alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / total
+
+    if estimate <= 2.5 * m and zeros > 0:
+        # linear counting is more accurate for small cardinalities
+        estimate = m * log(<float64_t>m / zeros)
+    return estimate
+
+
+cdef _check_precision(int precision):
+    if not MIN_PRECISION <= precision <= MAX_PRECISION:
+        raise ValueError(
+            f"precision must be between {MIN_PRECISION} and {MAX_PRECISION}, "
+            f"got {precision}"
+        )
+
+
+cdef class HyperLogLog:
+    """
+    HyperLogLog sketch estimating the number of distinct values.
+
+    The sketch is updated with 64-bit hashes of the values, see
+    ``pandas.util.hash_array``, and uses ``2 ** precision`` bytes.
+
+    Parameters
+    ----------
+    precision : int, default 14
+        The relative standard error of the estimate is about
+        ``1.04 / sqrt(2 ** precision)``, i.e. 0.8% for the default.
+    """
+
+    cdef readonly:
+        int precision
+        ndarray registers
+
+    def __init__(self, int precision=14):
+        _check_precision(precision)
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def __reduce__(self):
+        return _hll_from_registers, (self.precision, self.registers)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update(self, const uint64_t[:] hashes) -> None:
+        """
+        Add the hashes of values to the sketch.
+        """
+        cdef:
+            Py_ssize_t i, n = len(hashes)
+            uint8_t* registers = <uint8_t*>cnp.PyArray_DATA(self.registers)
+
+        with nogil:
+            for i in range(n):
+                _hll_add(registers, self.precision, hashes[i])
+
+    def merge(self, HyperLogLog other) -> None:
+        """
+        Add the values of another sketch with the same precision.
+        """
+        if other.precision != self.precision:
+            raise ValueError(
+                "Cannot merge HyperLogLog sketches with different precisions"
+            )
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        """
+        Estimate the number of distinct values added to the sketch.
+        """
+        return _hll_estimate(
+            <const uint8_t*>cnp.PyArray_DATA(self.registers), self.precision
+        )
+
+
+def _hll_from_registers(int precision, ndarray registers) -> HyperLogLog:
+    sketch = HyperLogLog(precision)
+    sketch.registers[:] = registers
+    return sketch
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique_approx(
+    const uint64_t[:] hashes,
+    const intp_t[:] labels,
+    Py_ssize_t ngroups,
+    int precision=14,
+) -> np.ndarray:
+    """
+    Estimate the number of distinct values per group with HyperLogLog.
+
+    Parameters
+    ----------
+    hashes : np.ndarray[uint64]
+        Hashes of the values.
+    labels : np.ndarray[intp]
+        Group of each value, values with a negative label are skipped.
+    ngroups : int
+    precision : int, default 14
+        Each group uses ``2 ** precision`` bytes.
+
+    Returns
+    -------
+    np.ndarray[float64]
+    """
+    cdef:
+        Py_ssize_t i, lab, m, n = len(hashes)
+        ndarray[uint8_t, ndim=2] registers
+        uint8_t* regs
+        float64_t[::1] out
+
+    _check_precision(precision)
+    m = 1 << precision
+    registers = np.zeros((ngroups, m), dtype=np.uint8)
+    regs = <uint8_t*>cnp.PyArray_DATA(registers)
+    out = np.empty(ngroups, dtype=np.float64)
+
+    with nogil:
+        for i in range(n):
+            lab = labels[i]
+            if lab < 0:
+                continue
+            _hll_add(regs + lab * m, precision, hashes[i])
+
+        for lab in range(ngroups):
+            out[lab] = _hll_estimate(regs + lab * m, precision)
+
+    return np.asarray(out)
+
+
+# ----------------------------------------------------------------------
+# t-digest
+
+cdef struct tdigest_t:
+    float64_t compression
+    # centroids, sorted by mean
+    float64_t* means
+    float64_t* weights
+    Py_ssize_t ncentroids
+    float64_t weight
+    # values not merged into the centroids yet
+    float64_t* buffer
+    Py_ssize_t nbuffer
+    Py_ssize_t buffer_size
+    # room to merge the centroids with new values
+    float64_t* scratch_means
+    float64_t* scratch_weights
+    Py_ssize_t capacity
+    float64_t min
+    float64_t max
+
+
+cdef void _sort_float64(float64_t* a, Py_ssize_t n) noexcept nogil:
+    # quicksort with a median of three pivot, inlining the comparisons
+    #  makes it about twice as fast as qsort
+    cdef:
+        Py_ssize_t i, j
+        float64_t pivot, lo, mid, hi, tmp
+
+    while n > 16:
+        lo = a[0]
+        mid = a[n // 2]
+        hi = a[n - 1]
+        if lo > mid:
+            lo, mid = mid, lo
+        if mid > hi:
+            mid = hi if lo <= hi else lo
+        pivot = mid
+
+        i = 0
+        j = n - 1
+        while True:
+            while a[i] < pivot:
+                i += 1
+            while a[j] > pivot:
+                j -= 1
+            if i >= j:
+                break
+            tmp = a[i]
+            a[i] = a[j]
+            a[j] = tmp
+            i += 1
+            j -= 1
+
+        # recurse into the smaller part to bound the depth
+        if j + 1 < n - j - 1:
+            _sort_float64(a, j + 1)
+            a = a + j + 1
+            n = n - j - 1
+        else:
+            _sort_float64(a + j + 1, n - j - 1)
+            n = j + 1
+
+    for i in range(1, n):
+        tmp = a[i]
+        j = i - 1
+        while j >= 0 and a[j] > tmp:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = tmp
+
+
+cdef inline float64_t _td_k(float64_t q, float64_t compression) noexcept nogil:
+    # scale function k1, giving small centroids in the tails
+    return compression / (2 * M_PI) * asin(2 * q - 1)
+
+
+cdef inline float64_t _td_k_inv(float64_t k, float64_t compression) noexcept nogil:
+    if k >= compression / 4:
+        return 1
+    return (sin(k * 2 * M_PI / compression) + 1) / 2
+
+
+cdef int _td_init(tdigest_t* td, float64_t compression) noexcept nogil:
+    td.compression = compression
+    td.buffer_size = <Py_ssize_t>ceil(compression) * 10
+    td.capacity = 0
+    td.means = td.weights = td.scratch_means = td.scratch_weights = NULL
+    td.buffer = <float64_t*>malloc(td.buffer_size * sizeof(float64_t))
+    _td_clear(td)
+    return -1 if td.buffer == NULL else 0
+
+
+cdef void _td_clear(tdigest_t* td) noexcept nogil:
+    td.ncentroids = 0
+    td.nbuffer = 0
+    td.weight = 0
+    td.min = NAN
+    td.max = NAN
+
+
+cdef void _td_free(tdigest_t* td) noexcept nogil:
+    free(td.buffer)
+    free(td.means)
+    free(td.weights)
+    free(td.scratch_means)
+    free(td.scratch_weights)
+    td.buffer = td.means = td.weights = td.scratch_means = td.scratch_weights = NULL
+
+
+cdef int _td_reserve(tdigest_t* td, Py_ssize_t n) noexcept nogil:
+    cdef:
+        float64_t** arrays[4]
+        float64_t* new
+        int j
+
+    if n <= td.capacity:
+        return 0
+    n = max(n, 2 * td.capacity)
+    arrays[0] = &td.means
+    arrays[1] = &td.weights
+    arrays[2] = &td.scratch_means
+    arrays[3] = &td.scratch_weights
+    for j in range(4):
+        new = <float64_t*>realloc(arrays[j][0], n * sizeof(float64_t))
+        if new == NULL:
+            return -1
+        arrays[j][0] = new
+    td.capacity = n
+    return 0
+
+
+cdef int _td_merge_sorted(
+    tdigest_t* td, const float64_t* means, const float64_t* weights, Py_ssize_t n
+) noexcept nogil:
+    """
+    Merge centroids sorted by mean, with weight 1 if ``weights`` is NULL,
+    and compress the result.
+    """
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, total_n = td.ncentroids + n
+        float64_t total = td.weight, w, cum = 0, limit, cur_mean, cur_weight
+        float64_t* sm
+        float64_t* sw
+
+    if n == 0:
+        return 0
+    if _td_reserve(td, total_n) != 0:
+        return -1
+    sm = td.scratch_means
+    sw = td.scratch_weights
+
+    # merge the two sorted runs
+    while i < td.ncentroids or j < n:
+        if j == n or (i < td.ncentroids and td.means[i] <= means[j]):
+            sm[k] = td.means[i]
+            sw[k] = td.weights[i]
+            i += 1
+        else:
+            w = 1 if weights == NULL else weights[j]
+            sm[k] = means[j]
+            sw[k] = w
+            total += w
+            j += 1
+        k += 1
+
+    # compress: merge neighbours as long as the centroid spans at most one
+    #  unit of the scale function
+    limit = total * _td_k_inv(_td_k(0, td.compression) + 1, td.compression)
+    cur_mean = sm[0]
+    cur_weight = sw[0]
+    k = 0
+    for i in range(1, total_n):
+        if cum + cur_weight + sw[i] <= limit:
+            cur_weight += sw[i]
+            cur_mean += (sm[i] - cur_mean) * sw[i] / cur_weight
+        else:
+            td.means[k] = cur_mean
+            td.weights[k] = cur_weight
+            k += 1
+            cum += cur_weight
+            limit = total * _td_k_inv(
+                _td_k(min(cum / total, 1.0), td.compression) + 1, td.compression
+            )
+            cur_mean = sm[i]
+            cur_weight = sw[i]
+    td.means[k] = cur_mean
+    td.weights[k] = cur_weight
+    td.ncentroids = k + 1
+    td.weight = total
+    return 0
+
+
+cdef int _td_flush(tdigest_t* td) noexcept nogil:
+    cdef int ret
+
+    if td.nbuffer == 0:
+        return 0
+    _sort_float64(td.buffer, td.nbuffer)
+    ret = _td_merge_sorted(td, td.buffer, NULL, td.nbuffer)
+    td.nbuffer = 0
+    return ret
+
+
+cdef inline void _td_update_range(
+    tdigest_t* td, float64_t lo, float64_t hi
+) noexcept nogil:
+    # min and max are NaN while the sketch is empty
+    if not td.min <= lo:
+        td.min = lo
+    if not td.max >= hi:
+        td.max = hi
+
+
+cdef inline int _td_add(tdigest_t* td, float64_t x) noexcept nogil:
+    # Caller is responsible for skipping NaN
+    _td_update_range(td, x, x)
+    td.buffer[td.nbuffer] = x
+    td.nbuffer += 1
+    if td.nbuffer == td.buffer_size:
+        return _td_flush(td)
+    return 0
+
+
+cdef float64_t _td_quantile(tdigest_t* td, float64_t q) noexcept nogil:
+    """
+    Interpolate the quantile between the centroids, after flushing.
+
+    A centroid of weight w covers the ranks from its start to its start + w,
+    its mean sits in the middle. The rank of ``q`` is ``q * (weight - 1)``,
+    as numpy's linear interpolation, so that centroids of weight 1 give the
+    exact quantiles.
+    """
+    cdef:
+        Py_ssize_t i, n = td.ncentroids
+        float64_t index, cum = 0, left, right, half
+
+    if n == 0:
+        return NAN
+    if n == 1:
+        return td.means[0]
+
+    index = q * (td.weight - 1) + 0.5
+    half = td.weights[0] / 2
+    if index < half:
+        # index is at least 0.5, so the first centroid has more than one value
+        return td.min + (td.means[0] - td.min) * (index - 0.5) / (half - 0.5)
+
+    for i in range(n - 1):
+        left = cum + td.weights[i] / 2
+        right = cum + td.weights[i] + td.weights[i + 1] / 2
+        if index <= right:
+            return td.means[i] + (
+                (td.means[i + 1] - td.means[i]) * (index - left) / (right - left)
+            )
+        cum += td.weights[i]
+
+    half = td.weights[n - 1] / 2
+    return td.means[n - 1] + (
+        (td.max - td.means[n - 1]) * min((index - cum - half) / (half - 0.5), 1.0)
+    )
+
+
+cdef class TDigest:
+    """
+    t-digest sketch estimating the quantiles of a stream of values.
+
+    The values are summarized by a bounded number of centroids, with small
+    centroids in the tails, so that the relative accuracy is best for
+    quantiles close to 0 and 1.
+
+    Parameters
+    ----------
+    compression : float, default 100
+        Bounds the number of centroids, trading memory for accuracy.
+    """
+
+    cdef tdigest_t td
+
+    def __cinit__(self, float64_t compression=100):
+        if not compression >= 1:
+            raise ValueError(f"compression must be at least 1, got {compression}")
+        if _td_init(&self.td, compression) != 0:
+            raise MemoryError
+
+    def __dealloc__(self):
+        _td_free(&self.td)
+
+    def __reduce__(self):
+        means, weights = self.centroids
+        return (
+            _tdigest_from_centroids,
+            (self.compression, means, weights, self.td.min, self.td.max),
+        )
+
+    @property
+    def compression(self) -> float:
+        return self.td.compression
+
+    @property
+    def count(self) -> float:
+        """
+        Number of values added to the sketch.
+        """
+        return self.td.weight + self.td.nbuffer
+
+    @property
+    def centroids(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Means and weights of the centroids.
+        """
+        cdef Py_ssize_t n
+
+        self._flush()
+        n = self.td.ncentroids
+        means = np.empty(n, dtype=np.float64)
+        weights = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            means[i] = self.td.means[i]
+            weights[i] = self.td.weights[i]
+        return means, weights
+
+    cdef _flush(self):
+        if _td_flush(&self.td) != 0:
+            raise MemoryError
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update(self, ndarray values) -> None:
+        """
+        Add values to the sketch, skipping NaN.
+        """
+        cdef:
+            Py_ssize_t i, start, stop, size = self.td.buffer_size
+            float64_t[:, ::1] blocks
+            const float64_t[:] rest
+            int ret = 0
+
+        values = values.astype(np.float64, copy=False).ravel()
+        values = values[~np.isnan(values)]
+
+        # sorting many buffers at once with numpy is much faster than one at a
+        #  time, sort them in chunks to bound the memory
+        stop = len(values) - len(values) % size
+        for start in range(0, stop, size * 1024):
+            blocks = np.sort(
+                values[start : min(start + size * 1024, stop)].reshape(-1, size),
+                axis=1,
+            )
+            _td_update_range(
+                &self.td, np.min(blocks[:, 0]), np.max(blocks[:, size - 1])
+            )
+            with nogil:
+                for i in range(blocks.shape[0]):
+                    ret = _td_merge_sorted(&self.td, &blocks[i, 0], NULL, size)
+                    if ret != 0:
+                        break
+            if ret != 0:
+                raise MemoryError
+
+        rest = values[stop:]
+        with nogil:
+            for i in range(len(rest)):
+                ret = _td_add(&self.td, rest[i])
+                if ret != 0:
+                    break
+        if ret != 0:
+            raise MemoryError
+
+    def merge(self, TDigest other) -> None:
+        """
+        Add the values summarized by another sketch.
+        """
+        cdef int ret
+
+        self._flush()
+        other._flush()
+        if other.td.ncentroids == 0:
+            return
+        _td_update_range(&self.td, other.td.min, other.td.max)
+        ret = _td_merge_sorted(
+            &self.td, other.td.means, other.td.weights, other.td.ncentroids
+        )
+        if ret != 0:
+            raise MemoryError
+
+    def quantile(self, const float64_t[:] qs) -> np.ndarray:
+        """
+        Estimate the quantiles ``qs``, NaN if no values were added.
+        """
+        cdef:
+            Py_ssize_t k
+            float64_t[::1] out = np.empty(len(qs), dtype=np.float64)
+
+        self._flush()
+        for k in range(len(qs)):
+            out[k] = _td_quantile(&self.td, qs[k])
+        return np.asarray(out)
+
+
+def _tdigest_from_centroids(
+    float64_t compression,
+    const float64_t[:] means,
+    const float64_t[:] weights,
+    float64_t min_val,
+    float64_t max_val,
+) -> TDigest:
+    cdef TDigest sketch = TDigest(compression)
+
+    if len(means):
+        if _td_merge_sorted(&sketch.td, &means[0], &weights[0], len(means)) != 0:
+            raise MemoryError
+        sketch.td.min = min_val
+        sketch.td.max = max_val
+    return sketch
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile_approx(
+    float64_t[:, ::1] out,
+    const float64_t[:] values,
+    const uint8_t[:] mask,
+    const float64_t[:] qs,
+    const int64_t[::1] starts,
+    const int64_t[::1] ends,
+    uint8_t[:, ::1] result_mask,
+    float64_t compression=100,
+) -> None:
+    """
+    Estimate the quantiles per group with a t-digest.
+
+    Parameters
+    ----------
+    out : np.ndarray[np.float64, ndim=2]
+        Array of quantiles per group that will be written to.
+    values : np.ndarray[np.float64]
+        Values sorted by group.
+    mask : np.ndarray[bool]
+        Missing values, which are skipped.
+    qs : np.ndarray[float64_t]
+        The quantiles to estimate.
+    starts : np.ndarray[int64]
+        Positions at which each group begins.
+    ends : np.ndarray[int64]
+        Positions at which each group ends.
+    result_mask : np.ndarray[bool, ndim=2] or None
+        Set for groups without values, which are NaN in ``out`` otherwise.
+    compression : float, default 100
+    """
+    cdef:
+        Py_ssize_t i, j, k, nqs = len(qs), ngroups = len(out)
+        bint uses_result_mask = result_mask is not None
+        tdigest_t td
+        int ret = 0
+
+    if _td_init(&td, compression) != 0:
+        raise MemoryError
+
+    with nogil:
+        for i in range(ngroups):
+            _td_clear(&td)
+            for j in range(starts[i], ends[i]):
+                if not mask[j] and values[j] == values[j]:
+                    ret = _td_add(&td, values[j])
+                    if ret != 0:
+                        break
+            if ret == 0:
+                ret = _td_flush(&td)
+            if ret != 0:
+                break
+
+            for k in range(nqs):
+                if td.ncentroids == 0 and uses_result_mask:
+                    result_mask[i, k] = 1
+                else:
+                    out[i, k] = _td_quantile(&td, qs[k])
+
+    _td_free(&td)
+    if ret != 0:
+        raise MemoryError
@@ -7,6 +7,7 @@ from pandas import (
     Index,
 )
 from pandas.core.internals.api import _make_block
+from pandas.core.internals.copy_tracking import CopyTracker as _CopyTracker
 from pandas.core.internals.managers import BlockManager as _BlockManager
 
 
@@ -60,3 +61,41 @@ def create_dataframe_from_blocks(
     axes = [columns, index]
     mgr = _BlockManager(block_objs, axes)
     return DataFrame._from_mgr(mgr, mgr.axes)
+
+
+def track_copies() -> _CopyTracker:
+    """
+    Record the copies triggered by Copy-on-Write.
+
+    With Copy-on-Write, objects derived from another object, for example by
+    selecting columns or by methods returning a new object, share their data
+    with the original object. The data is only copied once one of them is
+    modified in place. This function returns a context manager recording each
+    of those copies, which helps to find hidden copies in performance
+    critical code.
+
+    Attention: this is an advanced, low-level function meant for diagnosing
+    performance. The recorded information depends on the internals of pandas
+    and can change without notice.
+
+    Returns
+    -------
+    CopyTracker
+        Context manager whose ``events`` attribute lists the recorded copies,
+        each with the ``nbytes`` and ``dtype`` of the copied values, the pandas
+        ``method`` that triggered the copy, the ``location`` of the calling
+        code and the ``stack`` of pandas functions leading to the copy. Its
+        ``report()`` method summarizes the copies in a DataFrame and
+        ``total_bytes`` gives the total number of bytes copied.
+
+    Examples
+    --------
+    >>> from pandas.api.internals import track_copies
+    >>> df = pd.DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]})
+    >>> subset = df[["a"]]
+    >>> with track_copies() as tracker:
+    ...     subset.iloc[0, 0] = 10
+    >>> tracker.total_bytes
+    24
+    """
+    return _CopyTracker()
@@ -33,7 +33,10 @@ from pandas._typing import (
     TakeIndexer,
     npt,
 )
-from pandas.util._decorators import doc
+from pandas.util._decorators import (
+    doc,
+    set_module,
+)
 from pandas.util._exceptions import find_stack_level
 
 from pandas.core.dtypes.cast import (
@@ -70,6 +73,7 @@ from pandas.core.dtypes.generic import (
     ABCIndex,
     ABCMultiIndex,
     ABCNumpyExtensionArray,
+    ABCRangeIndex,
     ABCSeries,
     ABCTimedeltaArray,
 )
@@ -85,6 +89,10 @@ from pandas.core.construction import (
     extract_array,
 )
 from pandas.core.indexers import validate_indices
+from pandas.core.util.parallel import (
+    get_num_threads,
+    thread_map,
+)
 
 if TYPE_CHECKING:
     from pandas._typing import (
@@ -478,6 +486,11 @@ unique1d = unique
 _MINIMUM_COMP_ARR_LEN = 1_000_000
 
 
+# isin checks a Bloom filter of at least that many values before probing their
+#  hash table, if most of the values to test are not in them
+_MIN_BLOOM_VALUES = 10_000
+
+
 def isin(comps: ListLike, values: ListLike) -> npt.NDArray[np.bool_]:
     """
     Compute the isin boolean array.
@@ -503,6 +516,13 @@ def isin(comps: ListLike, values: ListLike) -> npt.NDArray[np.bool_]:
             f"to isin(), you passed a `{type(values).__name__}`"
         )
 
+    # an Index of keys reuses its hash table, see IndexEngine.isin
+    keys_index = None
+    if isinstance(values, ABCIndex) and not isinstance(
+        values, (ABCMultiIndex, ABCRangeIndex)
+    ):
+        keys_index = values
+
     if not isinstance(values, (ABCIndex, ABCSeries, ABCExtensionArray, np.ndarray)):
         orig_values = list(values)
         values = _ensure_arraylike(orig_values, func_name="isin-targets")
@@ -567,13 +587,21 @@ def isin(comps: ListLike, values: ListLike) -> npt.NDArray[np.bool_]:
 
     else:
         common = np_find_common_type(values.dtype, comps_array.dtype)
+        if keys_index is not None and common == values.dtype and common.kind in "iuf":
+            return keys_index._engine.isin(comps_array.astype(common, copy=False))
+
         values = values.astype(common, copy=False)
         comps_array = comps_array.astype(common, copy=False)
-        f = htable.ismember
+        use_bloom = len(values) >= _MIN_BLOOM_VALUES
+        f = lambda a, b: htable.ismember(a, b, use_bloom=use_bloom)
 
     return f(comps_array, values)
 
 
+# factorize_array splits larger arrays in chunks factorized in parallel
+_MIN_FACTORIZE_CHUNK_SIZE = 1_000_000
+
+
 def factorize_array(
     values: np.ndarray,
     use_na_sentinel: bool = True,
@@ -620,14 +648,26 @@ def factorize_array(
 
     hash_klass, values = _get_hashtable_algo(values)
 
-    table = hash_klass(size_hint or len(values))
-    uniques, codes = table.factorize(
-        values,
-        na_sentinel=-1,
-        na_value=na_value,
-        mask=mask,
-        ignore_na=use_na_sentinel,
-    )
+    nchunks = min(get_num_threads(), len(values) // _MIN_FACTORIZE_CHUNK_SIZE)
+    if (
+        nchunks > 1
+        # the object hashtables hold the GIL
+        and values.dtype != object
+        and (mask is None or use_na_sentinel)
+        and _has_few_uniques(hash_klass, values, nchunks)
+    ):
+        uniques, codes = _factorize_chunks(
+            hash_klass, values, nchunks, na_value, mask, use_na_sentinel
+        )
+    else:
+        table = hash_klass(size_hint or len(values))
+        uniques, codes = table.factorize(
+            values,
+            na_sentinel=-1,
+            na_value=na_value,
+            mask=mask,
+            ignore_na=use_na_sentinel,
+        )
 
     # re-cast e.g. i8->dt64/td64, uint8->bool
     uniques = _reconstruct_data(uniques, original.dtype, original)
@@ -636,6 +676,76 @@ def factorize_array(
     return codes, uniques
 
 
+def _has_few_uniques(
+    hash_klass: type[htable.HashTable], values: np.ndarray, nchunks: int
+) -> bool:
+    """
+    Whether ``values`` likely has few enough uniques for ``_factorize_chunks``
+    to pay off, as the uniques of all the chunks are factorized once more.
+
+    The number of uniques is estimated from the repeats in a sample.
+    """
+    sample = values[:: max(len(values) // 10_000, 1)]
+    nunique = len(hash_klass(len(sample)).unique(sample))
+    repeats = len(sample) - nunique
+    if repeats == 0:
+        return False
+    # birthday estimate, an overestimate when there are few uniques
+    estimate = max(nunique, len(sample) ** 2 / (2 * repeats))
+    return estimate * nchunks <= len(values) // 4
+
+
+def _factorize_chunks(
+    hash_klass: type[htable.HashTable],
+    values: np.ndarray,
+    nchunks: int,
+    na_value: object,
+    mask: npt.NDArray[np.bool_] | None,
+    ignore_na: bool,
+) -> tuple[np.ndarray, npt.NDArray[np.intp]]:
+    """
+    Factorize ``values`` in chunks in the threads of ``compute.num_threads``.
+
+    Each chunk is factorized with its own hashtable, which releases the GIL.
+    The uniques of the chunks are then factorized in chunk order, so the
+    uniques come out in order of first appearance, as in a single pass, and
+    the codes of each chunk are mapped to them.
+    """
+    bounds = np.linspace(0, len(values), nchunks + 1).astype(np.intp)
+    slices = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def factorize_chunk(slc: slice) -> tuple[np.ndarray, npt.NDArray[np.intp]]:
+        chunk = values[slc]
+        table = hash_klass(len(chunk))
+        return table.factorize(
+            chunk,
+            na_sentinel=-1,
+            na_value=na_value,
+            mask=None if mask is None else mask[slc],
+            ignore_na=ignore_na,
+        )
+
+    results = thread_map(factorize_chunk, slices)
+
+    chunk_uniques = [chunk_uniques for chunk_uniques, _ in results]
+    table = hash_klass(sum(len(chunk_uniques) for chunk_uniques in chunk_uniques))
+    uniques, unique_codes = table.factorize(
+        np.concatenate(chunk_uniques),
+        na_sentinel=-1,
+        na_value=na_value,
+        ignore_na=ignore_na,
+    )
+    offsets = np.cumsum([0] + [len(chunk_uniques) for chunk_uniques in chunk_uniques])
+
+    def map_codes(i: int) -> npt.NDArray[np.intp]:
+        # the trailing -1 maps the sentinel of missing values to itself
+        mapping = np.append(unique_codes[offsets[i] : offsets[i + 1]], -1)
+        return mapping.take(results[i][1])
+
+    codes = np.concatenate(thread_map(map_codes, range(nchunks)))
+    return uniques, codes
+
+
 @doc(
     values=dedent(
         """\
@@ -956,6 +1066,210 @@ def value_counts_arraylike(
     return res_keys, counts, na_counter
 
 
+# Minimum number of pending keys before the counts of the chunks are combined
+_MIN_PENDING_KEYS = 4096
+
+
+@set_module("pandas")
+class ValueCountsAccumulator:
+    """
+    Count the unique values of data which is passed in chunks.
+
+    Each chunk is reduced to its unique values and their counts with the same
+    hash table machinery as :meth:`Series.value_counts`, such that only the
+    unique values are kept in memory. Accumulators can be merged, e.g. after
+    counting the chunks of a large file in separate processes.
+
+    .. versionadded:: 3.0.0
+
+    Parameters
+    ----------
+    dropna : bool, default True
+        Don't include counts of NaN.
+
+    See Also
+    --------
+    Series.value_counts : Return a Series containing counts of unique values.
+    read_csv : Read a comma-separated values (csv) file, optionally in chunks.
+
+    Examples
+    --------
+    >>> acc = pd.ValueCountsAccumulator()
+    >>> acc.update(pd.Series(["a", "b", "a"]))
+    >>> acc.update(pd.Series(["b", "c", "a"]))
+    >>> acc.result()
+    a    3
+    b    2
+    c    1
+    Name: count, dtype: int64
+
+    Counting a column of a csv file which does not fit in memory:
+
+    >>> acc = pd.ValueCountsAccumulator()
+    >>> with pd.read_csv("logs.csv", chunksize=1_000_000) as reader:  # doctest: +SKIP
+    ...     for chunk in reader:
+    ...         acc.update(chunk["category"])
+    """
+
+    def __init__(self, dropna: bool = True) -> None:
+        self.dropna = dropna
+        self._counts: Series | None = None
+        self._pending: list[Series] = []
+        self._npending = 0
+
+    def update(self, values: AnyArrayLike) -> None:
+        """
+        Count the values of a chunk.
+
+        Parameters
+        ----------
+        values : Series, Index, np.ndarray or ExtensionArray
+        """
+        counts = value_counts_internal(values, sort=False, dropna=self.dropna)
+        self._add_counts(counts)
+
+    def merge(self, other: ValueCountsAccumulator) -> None:
+        """
+        Add the counts of another accumulator.
+
+        Parameters
+        ----------
+        other : ValueCountsAccumulator
+            Accumulator with the same ``dropna``.
+        """
+        if not isinstance(other, ValueCountsAccumulator):
+            raise TypeError(
+                f"Can only merge a ValueCountsAccumulator, not {type(other).__name__}"
+            )
+        if other.dropna != self.dropna:
+            raise ValueError("Cannot merge accumulators with different 'dropna'")
+        other._combine()
+        if other._counts is not None:
+            self._add_counts(other._counts)
+
+    def result(
+        self, normalize: bool = False, sort: bool = True, ascending: bool = False
+    ) -> Series:
+        """
+        Return the counts of the unique values seen so far.
+
+        Parameters
+        ----------
+        normalize : bool, default False
+            If True then the object returned will contain the relative
+            frequencies of the unique values.
+        sort : bool, default True
+            Sort by frequencies when True. Preserve the order of the data when
+            False.
+        ascending : bool, default False
+            Sort in ascending order.
+
+        Returns
+        -------
+        Series
+            Like the result of :meth:`Series.value_counts` on the concatenated
+            chunks.
+        """
+        from pandas import (
+            Index,
+            Series,
+        )
+
+        self._combine()
+        name = "proportion" if normalize else "count"
+        if self._counts is None:
+            result = Series(
+                [], index=Index([], dtype=object), dtype=np.int64, name=name
+            )
+        else:
+            result = self._counts.copy(deep=False)
+            result.name = name
+
+        if sort:
+            result = result.sort_values(ascending=ascending)
+
+        if normalize:
+            result = result / result.sum()
+
+        return result
+
+    def _add_counts(self, counts: Series) -> None:
+        self._pending.append(counts)
+        self._npending += len(counts)
+        # combine once the pending keys outnumber the known ones, such that
+        #  every key is hashed an amortized constant number of times
+        ncounts = 0 if self._counts is None else len(self._counts)
+        if self._npending > max(ncounts, _MIN_PENDING_KEYS):
+            self._combine()
+
+    def _combine(self) -> None:
+        """
+        Combine the pending counts with the counts seen so far.
+        """
+        from pandas import Series
+        from pandas.core.indexes.base import get_unanimous_names
+
+        if not self._pending:
+            return
+        parts = self._pending
+        if self._counts is not None:
+            parts = [self._counts, *parts]
+        self._pending = []
+        self._npending = 0
+
+        if len(parts) == 1:
+            self._counts = parts[0]
+            return
+
+        indexes = [part.index for part in parts]
+        keys = _concat_keys(indexes)
+        counts = np.concatenate(
+            [part.to_numpy(dtype=np.int64, copy=False) for part in parts]
+        )
+
+        codes, uniques = keys.factorize()
+        na_locs = np.flatnonzero(codes == -1)
+        if len(na_locs):
+            # value_counts keeps the missing values of object data apart,
+            #  e.g. None and NaN, while factorize would combine them.
+            #  There are only a few missing keys per chunk.
+            na_codes: dict[type, int] = {}
+            first_locs = []
+            for loc in na_locs:
+                key_type = type(keys[loc])
+                if key_type not in na_codes:
+                    na_codes[key_type] = len(uniques) + len(first_locs)
+                    first_locs.append(loc)
+                codes[loc] = na_codes[key_type]
+            uniques = _concat_keys([uniques, keys.take(first_locs)])
+
+            # restore the order of first appearance of the missing keys
+            first = np.full(len(uniques), len(keys), dtype=np.intp)
+            np.minimum.at(first, codes, np.arange(len(keys), dtype=np.intp))
+            order = np.argsort(first, kind="stable")
+            uniques = uniques.take(order)
+            codes = np.argsort(order)[codes]
+        uniques = uniques.set_names(get_unanimous_names(*indexes))
+
+        totals = np.zeros(len(uniques), dtype=np.int64)
+        np.add.at(totals, codes, counts)
+        result = Series(totals, index=uniques, name="count", copy=False)
+        self._counts = result.astype(parts[0].dtype)
+
+
+def _concat_keys(indexes: list[Index]) -> Index:
+    """
+    Concatenate the keys of value counts without inferring the result dtype.
+    """
+    from pandas import Index
+
+    if isinstance(indexes[0], ABCMultiIndex):
+        return indexes[0].append(indexes[1:])
+    # Index.append would infer the dtype of object keys
+    values = concat_compat([index._values for index in indexes])
+    return Index(values, dtype=values.dtype)
+
+
 def duplicated(
     values: ArrayLike,
     keep: Literal["first", "last", False] = "first",
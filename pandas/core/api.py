@@ -21,6 +21,7 @@ from pandas.core.dtypes.missing import (
 )
 
 from pandas.core.algorithms import (
+    ValueCountsAccumulator,
     factorize,
     unique,
 )
@@ -119,6 +120,7 @@ __all__ = [
     "UInt16Dtype",
     "UInt32Dtype",
     "UInt64Dtype",
+    "ValueCountsAccumulator",
     "array",
     "bdate_range",
     "date_range",
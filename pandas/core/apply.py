@@ -73,6 +73,12 @@ if TYPE_CHECKING:
 
 ResType = dict[int, Any]
 
+# groupby reductions which give the same result for each numeric column,
+#  whether the column is aggregated on its own or with the whole frame
+_BLOCKWISE_REDUCTIONS = frozenset(
+    ["sum", "prod", "min", "max", "mean", "median", "var", "std", "sem"]
+)
+
 
 def frame_apply(
     obj: DataFrame,
@@ -1525,10 +1531,62 @@ class GroupByApply(Apply):
         with com.temp_setattr(
             obj, "as_index", True, condition=hasattr(obj, "as_index")
         ):
+            if op_name == "agg":
+                result = self.agg_list_like_blockwise(selected_obj)
+                if result is not None:
+                    return result
             keys, results = self.compute_list_like(op_name, selected_obj, kwargs)
         result = self.wrap_results_list_like(keys, results)
         return result
 
+    def agg_list_like_blockwise(self, selected_obj: DataFrame) -> DataFrame | None:
+        """
+        Aggregate numeric columns with a list of cythonized reductions.
+
+        compute_list_like aggregates one column at a time, whereas reducing
+        all columns with each function works on whole blocks, whose column
+        chunks are aggregated in parallel with ``compute.num_threads``. The
+        result is the same for numeric columns.
+
+        Returns
+        -------
+        DataFrame or None
+            None if the functions or columns are not supported.
+        """
+        from pandas.core.groupby.generic import DataFrameGroupBy
+        from pandas.core.reshape.concat import concat
+
+        obj = self.obj
+        func = self.func
+        if (
+            not isinstance(obj, DataFrameGroupBy)
+            or self.args
+            or self.kwargs
+            or selected_obj.ndim != 2
+            or len(selected_obj.columns) == 0
+            or not selected_obj.columns.is_unique
+        ):
+            return None
+        func = cast(list[AggFuncTypeBase], func)
+        if len(set(func)) != len(func) or not all(
+            isinstance(how, str) and how in _BLOCKWISE_REDUCTIONS for how in func
+        ):
+            return None
+        if not all(
+            isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+            for dtype in selected_obj.dtypes
+        ):
+            return None
+
+        results = [getattr(obj, how)() for how in func]
+        # interleave the results to order the columns like compute_list_like
+        ncols = len(selected_obj.columns)
+        indexer = np.arange(len(func) * ncols).reshape(len(func), ncols).T.ravel()
+        result = concat(results, keys=func, axis=1).iloc[:, indexer]
+        # move the function level after all the levels of the columns
+        nlevels = result.columns.nlevels
+        return result.reorder_levels([*range(1, nlevels), 0], axis=1)
+
     def agg_or_apply_dict_like(
         self, op_name: Literal["agg", "apply"]
     ) -> DataFrame | Series:
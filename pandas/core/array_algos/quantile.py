@@ -9,6 +9,8 @@ from pandas.core.dtypes.missing import (
     na_value_for_dtype,
 )
 
+from pandas.core.array_algos.sketches import quantile_approx
+
 if TYPE_CHECKING:
     from pandas._typing import (
         ArrayLike,
@@ -28,6 +30,8 @@ def quantile_compat(
     values : np.ndarray or ExtensionArray
     qs : np.ndarray[float64]
     interpolation : str
+        One of the methods of np.quantile, or "approx" to estimate the
+        quantiles with a t-digest.
 
     Returns
     -------
@@ -142,6 +146,9 @@ def _nanquantile_1d(
         # equiv: 'np.array([na_value] * len(qs))' but much faster
         return np.full(len(qs), na_value)
 
+    if interpolation == "approx":
+        return quantile_approx(values, qs)
+
     return np.quantile(
         values,
         qs,
@@ -192,20 +199,22 @@ def _nanquantile(
         #  have float result at this point, not i8
         return result.astype(values.dtype)
 
-    if mask.any():
+    if mask.any() or interpolation == "approx":
         # Caller is responsible for ensuring mask shape match
         assert mask.shape == values.shape
         result = [
             _nanquantile_1d(val, m, qs, na_value, interpolation=interpolation)
             for (val, m) in zip(list(values), list(mask))
         ]
-        if values.dtype.kind == "f":
-            # preserve itemsize
+        if values.dtype.kind == "f" and mask.any():
+            # preserve itemsize. Without missing values, e.g. for
+            #  interpolation="approx", np.quantile below gives float64
             result = np.asarray(result, dtype=values.dtype).T
         else:
             result = np.asarray(result).T
             if (
                 result.dtype != values.dtype
+                and mask.any()
                 and not mask.all()
                 and (result == result.astype(values.dtype, copy=False)).all()
             ):
@@ -0,0 +1,236 @@
+"""
+Approximate aggregations backed by the sketches of pandas._libs.sketches.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pandas._libs import sketches as libsketches
+
+from pandas.core.dtypes.missing import isna
+
+from pandas.core.util.hashing import hash_array
+
+if TYPE_CHECKING:
+    from pandas._typing import (
+        ArrayLike,
+        npt,
+    )
+
+
+def hll_precision(error: float) -> int:
+    """
+    Return the HyperLogLog precision for a relative standard error.
+
+    The precision is capped at ``libsketches.MAX_PRECISION``, i.e. an error of
+    about 0.2%.
+    """
+    if not 0 < error < 1:
+        raise ValueError(f"error must be between 0 and 1, got {error}")
+    precision = math.ceil(math.log2((1.04 / error) ** 2))
+    return min(max(precision, libsketches.MIN_PRECISION), libsketches.MAX_PRECISION)
+
+
+def hash_for_sketch(values: ArrayLike, dropna: bool) -> npt.NDArray[np.uint64]:
+    """
+    Hash the values such that equal values have equal hashes.
+
+    Parameters
+    ----------
+    values : np.ndarray or ExtensionArray
+    dropna : bool
+        Whether to skip the missing values.
+
+    Returns
+    -------
+    np.ndarray[uint64]
+    """
+    if dropna:
+        mask = isna(values)
+        if mask.any():
+            values = values[~mask]
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        return _hash_objects(values)
+    if isinstance(values, np.ndarray) and values.dtype.kind in "fc":
+        # -0.0 == 0.0, and NaN with any payload is the same missing value
+        values = values + 0
+        if not dropna:
+            values[np.isnan(values)] = np.nan
+    # categorizing would factorize the values, which we want to avoid
+    return hash_array(values, categorize=False)
+
+
+# distinguishes the hashes of missing values from those of strings
+_NA_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _hash_objects(values: npt.NDArray[np.object_]) -> npt.NDArray[np.uint64]:
+    # hash_array hashes the string representation of objects, for which e.g.
+    #  1 and "1" collide. Hash the strings with hash_array, the integers (and
+    #  equal floats and booleans, such as 1.0 and True) by their int64 value and
+    #  the other values with the builtin hash, which is equal for equal values.
+    #  The builtin hash is not used for integers, as e.g. hash(-1) == hash(-2)
+    mask = isna(values)
+    is_str = np.fromiter(
+        (isinstance(val, str) for val in values), dtype=bool, count=len(values)
+    )
+    result = np.empty(len(values), dtype=np.uint64)
+    result[is_str] = hash_array(values[is_str], categorize=False)
+    if mask.any():
+        # like nunique, count each kind of missing value (None, NaN, NA, ...)
+        kinds = np.array(
+            [
+                "nan" if isinstance(val, float) else type(val).__name__
+                for val in values[mask]
+            ],
+            dtype=object,
+        )
+        result[mask] = hash_array(kinds, categorize=False) ^ _NA_HASH
+    other = ~(is_str | mask)
+    if other.any():
+        objs = values[other]
+        is_int = np.fromiter(
+            (_is_int64(val) for val in objs), dtype=bool, count=len(objs)
+        )
+        hashes = np.empty(len(objs), dtype=np.uint64)
+        hashes[is_int] = hash_array(objs[is_int].astype(np.int64), categorize=False)
+        rest = ~is_int
+        if rest.any():
+            builtin = np.fromiter(
+                (hash(val) for val in objs[rest]), dtype=np.int64, count=rest.sum()
+            )
+            hashes[rest] = _mix_hashes(builtin.view(np.uint64))
+        result[other] = hashes
+    return result
+
+
+def _is_int64(val) -> bool:
+    # whether val is equal to an int64 value
+    if isinstance(val, (float, np.floating)):
+        return val.is_integer() and -(2.0**63) <= val < 2.0**63
+    if isinstance(val, (bool, np.bool_, np.signedinteger)):
+        return True
+    if isinstance(val, np.unsignedinteger):
+        return val <= np.iinfo(np.int64).max
+    return isinstance(val, int) and -(2**63) <= val < 2**63
+
+
+def _mix_hashes(hashes: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    # the builtin hash of small integers is the integer itself, spread the
+    #  bits with the splitmix64 finalizer for the sketches
+    hashes = (hashes ^ (hashes >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    hashes = (hashes ^ (hashes >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return hashes ^ (hashes >> np.uint64(31))
+
+
+def nunique_approx(values: ArrayLike, dropna: bool, error: float) -> int:
+    """
+    Estimate the number of distinct values with HyperLogLog.
+
+    Parameters
+    ----------
+    values : np.ndarray or ExtensionArray
+    dropna : bool
+        Don't count the missing values.
+    error : float
+        Relative standard error of the estimate.
+
+    Returns
+    -------
+    int
+    """
+    sketch = libsketches.HyperLogLog(hll_precision(error))
+    sketch.update(hash_for_sketch(values, dropna))
+    return round(sketch.estimate())
+
+
+def group_nunique_approx(
+    values: ArrayLike,
+    ids: npt.NDArray[np.intp],
+    ngroups: int,
+    dropna: bool,
+    error: float,
+) -> npt.NDArray[np.int64]:
+    """
+    Estimate the number of distinct values per group with HyperLogLog.
+
+    Groups with fewer values than the ``2 ** hll_precision(error)`` bytes of
+    a sketch are counted exactly from the hashes of their values, so that
+    the sketches of the other groups take at most a byte per value.
+
+    Parameters
+    ----------
+    values : np.ndarray or ExtensionArray
+    ids : np.ndarray[intp]
+        Group of each value, values with a negative id are skipped.
+    ngroups : int
+    dropna : bool
+        Don't count the missing values.
+    error : float
+        Relative standard error of the estimates.
+
+    Returns
+    -------
+    np.ndarray[int64]
+    """
+    precision = hll_precision(error)
+    if dropna:
+        mask = isna(values)
+        if mask.any():
+            ids = np.where(mask, -1, ids)
+    hashes = hash_for_sketch(values, dropna=False)
+
+    valid = ids >= 0
+    sizes = np.bincount(ids[valid], minlength=ngroups)
+    is_small = sizes < (1 << precision)
+    result = np.zeros(ngroups, dtype=np.int64)
+
+    # count the distinct (group, hash) pairs of the small groups
+    small = valid.copy()
+    small[valid] = is_small[ids[valid]]
+    small_ids = ids[small]
+    small_hashes = hashes[small]
+    order = np.lexsort((small_hashes, small_ids))
+    small_ids = small_ids[order]
+    small_hashes = small_hashes[order]
+    first = np.ones(len(small_ids), dtype=bool)
+    first[1:] = (small_ids[1:] != small_ids[:-1]) | (
+        small_hashes[1:] != small_hashes[:-1]
+    )
+    result += np.bincount(small_ids[first], minlength=ngroups)
+
+    large_groups = np.flatnonzero(~is_small)
+    if len(large_groups):
+        large_ids = np.full(ngroups, -1, dtype=np.intp)
+        large_ids[large_groups] = np.arange(len(large_groups))
+        large_ids = np.where(valid, large_ids[ids], -1)
+        estimates = libsketches.group_nunique_approx(
+            hashes, large_ids, len(large_groups), precision
+        )
+        result[large_groups] = np.round(estimates)
+    return result
+
+
+def quantile_approx(
+    values: np.ndarray, qs: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Estimate the quantiles of the values with a t-digest.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Numeric values without missing values, NaN are skipped.
+    qs : np.ndarray[float64]
+
+    Returns
+    -------
+    np.ndarray[float64]
+    """
+    sketch = libsketches.TDigest()
+    sketch.update(values.astype(np.float64, copy=False))
+    return sketch.quantile(qs)
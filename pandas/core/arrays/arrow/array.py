@@ -2145,7 +2145,10 @@ class ArrowExtensionArray(
             else:
                 data = data.cast(pa.int64())
 
-        result = pc.quantile(data, q=qs, interpolation=interpolation)
+        if interpolation == "approx":
+            result = pc.tdigest(data, q=qs)
+        else:
+            result = pc.quantile(data, q=qs, interpolation=interpolation)
 
         if pa.types.is_temporal(pa_dtype):
             if pa.types.is_floating(result.type):
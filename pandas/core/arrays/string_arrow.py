@@ -273,6 +273,34 @@ class ArrowStringArray(ObjectStringArrayMixin, ArrowExtensionArray, BaseStringAr
                     )
         return super()._maybe_convert_setitem_value(value)
 
+    def _utf8_buffers(
+        self,
+    ) -> tuple[
+        npt.NDArray[np.int64], npt.NDArray[np.uint8], npt.NDArray[np.bool_] | None
+    ]:
+        """
+        Return the offsets, the UTF-8 bytes and the mask of missing values.
+
+        The offsets and bytes are views on the Arrow buffers, unless the
+        array has several chunks, which are combined first.
+        """
+        arr = self._pa_array.combine_chunks()
+        _, offsets_buf, data_buf = arr.buffers()
+        n = len(arr)
+        if offsets_buf is None:
+            offsets = np.zeros(n + 1, dtype=np.int64)
+        else:
+            offsets = np.frombuffer(offsets_buf, dtype=np.int64)
+            offsets = offsets[arr.offset : arr.offset + n + 1]
+        if data_buf is None:
+            data = np.empty(0, dtype=np.uint8)
+        else:
+            data = np.frombuffer(data_buf, dtype=np.uint8)
+        mask = None
+        if arr.null_count:
+            mask = arr.is_null().to_numpy(zero_copy_only=False)
+        return offsets, data, mask
+
     def isin(self, values: ArrayLike) -> npt.NDArray[np.bool_]:
         value_set = [
             pa_scalar.as_py()
@@ -58,6 +58,7 @@ from pandas.core import (
     ops,
 )
 from pandas.core.accessor import DirNamesMixin
+from pandas.core.array_algos import sketches
 from pandas.core.arraylike import OpsMixin
 from pandas.core.arrays import ExtensionArray
 from pandas.core.construction import (
@@ -1106,7 +1107,9 @@ class IndexOpsMixin(OpsMixin):
         return result
 
     @final
-    def nunique(self, dropna: bool = True) -> int:
+    def nunique(
+        self, dropna: bool = True, *, approx: bool = False, error: float = 0.01
+    ) -> int:
         """
         Return number of unique elements in the object.
 
@@ -1116,6 +1119,18 @@ class IndexOpsMixin(OpsMixin):
         ----------
         dropna : bool, default True
             Don't include NaN in the count.
+        approx : bool, default False
+            Estimate the number of unique elements with a HyperLogLog sketch
+            instead of counting them exactly. This uses a fixed amount of
+            memory and avoids building a hash table of all the values.
+
+            .. versionadded:: 3.0.0
+        error : float, default 0.01
+            Relative standard error of the estimate if ``approx=True``. The
+            sketch takes about ``(1.04 / error) ** 2`` bytes, rounded up to a
+            power of 2.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -1141,6 +1156,9 @@ class IndexOpsMixin(OpsMixin):
         >>> s.nunique()
         4
         """
+        if approx:
+            return sketches.nunique_approx(self._values, dropna, error)
+
         uniqs = self.unique()
         if dropna:
             uniqs = remove_na_arraylike(uniqs)
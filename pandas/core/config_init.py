@@ -72,6 +72,21 @@ def use_numba_cb(key: str) -> None:
     numba_.set_use_numba(cf.get_option(key))
 
 
+num_threads_doc = """
+: int
+    The number of threads used to apply operations to the blocks of a DataFrame,
+    or to column chunks of a large block, such as ``astype``, ``fillna``,
+    ``where``, arithmetic and reductions. The default of 1 runs them in the
+    calling thread, None or 0 uses the number of CPUs.
+"""
+
+
+def num_threads_cb(key: str) -> None:
+    from pandas.core.util import parallel
+
+    parallel.set_num_threads(cf.get_option(key))
+
+
 with cf.config_prefix("compute"):
     cf.register_option(
         "use_bottleneck",
@@ -86,6 +101,13 @@ with cf.config_prefix("compute"):
     cf.register_option(
         "use_numba", False, use_numba_doc, validator=is_bool, cb=use_numba_cb
     )
+    cf.register_option(
+        "num_threads",
+        1,
+        num_threads_doc,
+        validator=is_nonnegative_int,
+        cb=num_threads_cb,
+    )
 #
 # options from the "display" namespace
 
@@ -456,6 +478,22 @@ with cf.config_prefix("mode"):
         validator=is_bool,
     )
 
+consolidate_doc = """
+: boolean
+    Whether to consolidate the columns of a DataFrame with the same dtype into
+    2-D blocks. If False, columns built or inserted one at a time each keep their
+    own block, which avoids the copies made by consolidation for very wide
+    frames and disables the warning about highly fragmented frames.
+"""
+
+with cf.config_prefix("mode"):
+    cf.register_option(
+        "consolidate",
+        True,
+        consolidate_doc,
+        validator=is_bool,
+    )
+
 
 string_storage_doc = """
 : string
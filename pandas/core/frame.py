@@ -25,7 +25,9 @@ import functools
 from io import StringIO
 import itertools
 import operator
+import os
 import sys
+import tempfile
 from textwrap import dedent
 from typing import (
     TYPE_CHECKING,
@@ -81,6 +83,7 @@ from pandas.core.dtypes.cast import (
     LossySetitemError,
     can_hold_element,
     construct_1d_arraylike_from_scalar,
+    construct_1d_object_array_from_listlike,
     construct_2d_arraylike_from_scalar,
     find_common_type,
     infer_dtype_from_scalar,
@@ -162,9 +165,13 @@ from pandas.core.indexing import (
     check_bool_indexer,
     check_dict_or_set_indexers,
 )
-from pandas.core.internals import BlockManager
+from pandas.core.internals import (
+    BlockManager,
+    SingleBlockManager,
+)
 from pandas.core.internals.construction import (
     arrays_to_mgr,
+    column_arrays_to_mgr,
     dataclasses_to_dicts,
     dict_to_mgr,
     ndarray_to_mgr,
@@ -255,7 +262,6 @@ if TYPE_CHECKING:
 
     from pandas.core.groupby.generic import DataFrameGroupBy
     from pandas.core.interchange.dataframe_protocol import DataFrame as DataFrameXchg
-    from pandas.core.internals.managers import SingleBlockManager
 
     from pandas.io.formats.style import Styler
 
@@ -1515,11 +1521,28 @@ class DataFrame(NDFrame, OpsMixin):
         """
         columns = self.columns
         klass = self._constructor_sliced
-        for k, v in zip(self.index, self.values):
-            s = klass(v, index=columns, name=k).__finalize__(self)
-            if self._mgr.is_single_block:
-                s._mgr.add_references(self._mgr)
-            yield k, s
+        is_single_block = self._mgr.is_single_block
+        # the values are interleaved one batch of rows at a time to bound the
+        # memory use for frames of mixed dtypes
+        batch_size = self._row_batch_size(len(columns))
+        for start in range(0, len(self), batch_size):
+            batch = self.iloc[start : start + batch_size]
+            values = batch.values
+            if values.dtype.kind in "biufc":
+                for k, v in zip(batch.index, values):
+                    mgr = SingleBlockManager.from_array(v, columns)
+                    s = self._constructor_sliced_from_mgr(mgr, axes=mgr.axes)
+                    s._name = k
+                    s = s.__finalize__(self)
+                    if is_single_block:
+                        s._mgr.add_references(self._mgr)
+                    yield k, s
+            else:
+                for k, v in zip(batch.index, values):
+                    s = klass(v, index=columns, name=k).__finalize__(self)
+                    if is_single_block:
+                        s._mgr.add_references(self._mgr)
+                    yield k, s
 
     def itertuples(
         self, index: bool = True, name: str | None = "Pandas"
@@ -1583,25 +1606,51 @@ class DataFrame(NDFrame, OpsMixin):
         Animal(Index='dog', num_legs=4, num_wings=0)
         Animal(Index='hawk', num_legs=2, num_wings=2)
         """
-        arrays = []
         fields = list(self.columns)
         if index:
-            arrays.append(self.index)
             fields.insert(0, "Index")
 
-        # use integer indexing because of possible duplicate column names
-        arrays.extend(self.iloc[:, k] for k in range(len(self.columns)))
-
+        itertuple = None
         if name is not None:
             # https://github.com/python/mypy/issues/9046
             # error: namedtuple() expects a string literal as the first argument
             itertuple = collections.namedtuple(  # type: ignore[misc]
                 name, fields, rename=True
             )
-            return map(itertuple._make, zip(*arrays))
 
-        # fallback to regular tuples
-        return zip(*arrays)
+        return itertools.chain.from_iterable(
+            lib.rows_from_columns(columns, itertuple)
+            for columns in self._iter_column_batches(index)
+        )
+
+    @staticmethod
+    def _row_batch_size(ncols: int) -> int:
+        """
+        Number of rows to process at once when iterating over rows.
+        """
+        return min(10_000, max(1, 1_000_000 // max(ncols, 1)))
+
+    def _iter_column_batches(self, index: bool) -> Iterator[list[list]]:
+        """
+        Iterate over batches of rows, as lists of the boxed values of each column.
+
+        Values are boxed as when iterating over a column, but only one batch
+        at a time, to bound the memory use.
+        """
+        # use integer indexing because of possible duplicate column names
+        arrays = [self._mgr.iget_values(k) for k in range(len(self.columns))]
+        if index:
+            arrays.insert(0, self.index._values)
+
+        batch_size = self._row_batch_size(len(arrays))
+        for start in range(0, len(self), batch_size):
+            stop = start + batch_size
+            yield [
+                arr[start:stop].tolist()
+                if isinstance(arr, np.ndarray)
+                else list(arr[start:stop])
+                for arr in arrays
+            ]
 
     def __len__(self) -> int:
         """
@@ -1890,6 +1939,103 @@ class DataFrame(NDFrame, OpsMixin):
             columns = create_index(data["columns"], data["column_names"])
             return cls(realdata, index=index, columns=columns, dtype=dtype)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: Mapping[Hashable, Any] | Sequence[Any],
+        columns: Axes | None = None,
+        index: Axes | None = None,
+        *,
+        copy: bool = False,
+        consolidate: bool = False,
+    ) -> DataFrame:
+        """
+        Construct DataFrame from a dict or list of column arrays without copying.
+
+        Each array is stored as is as a separate column of the DataFrame. This
+        is faster than the DataFrame constructor, which by default copies the
+        arrays and combines the columns of the same dtype in 2D arrays.
+
+        .. versionadded:: 3.0.0
+
+        Parameters
+        ----------
+        arrays : dict or list of array-like
+            The columns of the DataFrame, as a dict mapping column labels to
+            arrays or as a list of arrays. NumPy arrays, extension arrays,
+            Series, pyarrow arrays and list-likes are supported, and must all
+            have the same length.
+        columns : Index or array-like, optional
+            Column labels. When ``arrays`` is a dict, this selects and orders
+            the columns, by default the keys of the dict. When ``arrays`` is a
+            list, this labels the arrays, by default with a RangeIndex.
+        index : Index or array-like, optional
+            Row labels, by default a RangeIndex. Series are aligned on it.
+        copy : bool, default False
+            Copy the NumPy and extension arrays. By default, the DataFrame
+            shares the memory of the arrays, such that modifying an array
+            afterwards also modifies the DataFrame, and vice versa.
+        consolidate : bool, default False
+            Combine the columns of the same dtype in 2D arrays, as the
+            DataFrame constructor does. This copies the NumPy arrays and can
+            speed up row-wise operations on many columns.
+
+        Returns
+        -------
+        DataFrame
+
+        See Also
+        --------
+        DataFrame : DataFrame constructor, which copies the arrays by default.
+        DataFrame.from_dict : From dicts of Series, arrays or dicts.
+
+        Notes
+        -----
+        pyarrow arrays are stored with an :class:`ArrowDtype` without
+        conversion.
+
+        Examples
+        --------
+        >>> a = np.array([1, 2, 3])
+        >>> df = pd.DataFrame.from_arrays({"a": a, "b": ["x", "y", "z"]})
+        >>> df
+           a  b
+        0  1  x
+        1  2  y
+        2  3  z
+
+        The column shares the memory of the array:
+
+        >>> np.shares_memory(df["a"].to_numpy(), a)
+        True
+
+        Arrays can also be passed as a list:
+
+        >>> pd.DataFrame.from_arrays([a, a * 2], columns=["a", "b"], index=list("pqr"))
+           a  b
+        p  1  2
+        q  2  4
+        r  3  6
+        """
+        if isinstance(arrays, abc.Mapping):
+            if columns is None:
+                columns = list(arrays.keys())
+            else:
+                columns = ensure_index(columns)
+            arrays = [arrays[key] for key in columns]
+        else:
+            arrays = list(arrays)
+            if columns is None:
+                columns = default_index(len(arrays))
+
+        columns = ensure_index(columns)
+        if len(columns) != len(arrays):
+            raise ValueError("len(columns) must match len(arrays)")
+        mgr = column_arrays_to_mgr(
+            arrays, columns, index, copy=copy, consolidate=consolidate
+        )
+        return cls._from_mgr(mgr, axes=mgr.axes)
+
     def to_numpy(
         self,
         dtype: npt.DTypeLike | None = None,
@@ -3664,6 +3810,86 @@ class DataFrame(NDFrame, OpsMixin):
             result = index_memory_usage._append(result)
         return result
 
+    def spill(
+        self,
+        path: FilePath | None = None,
+        memory_limit: int | None = None,
+    ) -> DataFrame:
+        """
+        Return a DataFrame whose data is stored in memory-mapped files on disk.
+
+        The values of the numeric, boolean and datetime-like columns are
+        written to temporary files in ``path``, and the returned DataFrame
+        reads them through :class:`numpy.memmap` objects. The operating system
+        then keeps only the parts in use in memory, which allows working with
+        data larger than the available memory.
+
+        .. versionadded:: 3.0.0
+
+        Parameters
+        ----------
+        path : str or path object, optional
+            Existing directory to write the files to. By default, the
+            directory for temporary files of the system is used.
+        memory_limit : int, optional
+            Number of bytes of column data which may stay in memory. The
+            largest groups of columns are spilled first until the remaining
+            data fit in ``memory_limit``. By default, all columns which can be
+            spilled are.
+
+        Returns
+        -------
+        DataFrame
+            DataFrame with the same data, partly or fully stored on disk.
+
+        See Also
+        --------
+        DataFrame.memory_usage : Bytes consumed by a DataFrame.
+        numpy.memmap : Memory-mapped array stored in a file on disk.
+
+        Notes
+        -----
+        The returned DataFrame supports all operations. Copies of its spilled
+        data, for example made by Copy-on-Write when it is modified, are
+        written to new files in the same directory, while new data computed
+        from it, such as the result of arithmetic operations, are kept in
+        memory and can be spilled again.
+
+        Columns of ``object`` and extension dtypes, apart from datetime-like
+        dtypes, are kept in memory.
+
+        The files are removed from ``path`` as soon as they are created. Their
+        disk space is released once the data are no longer referenced.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]})
+        >>> spilled = df.spill()
+        >>> spilled
+           a    b
+        0  1  0.5
+        1  2  1.5
+        2  3  2.5
+        >>> spilled.sum()
+        a    6.0
+        b    4.5
+        dtype: float64
+        """
+        if path is None:
+            path = tempfile.gettempdir()
+        path = os.fspath(path)
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"Directory {path!r} does not exist.")
+        if memory_limit is not None and (
+            not is_integer(memory_limit) or memory_limit < 0
+        ):
+            raise ValueError("memory_limit must be a non-negative integer.")
+
+        mgr = self._mgr.spill(path, memory_limit=memory_limit)
+        return self._constructor_from_mgr(mgr, axes=mgr.axes).__finalize__(
+            self, method="spill"
+        )
+
     def transpose(
         self,
         *args,
@@ -4390,6 +4616,101 @@ class DataFrame(NDFrame, OpsMixin):
 
         self._set_item_mgr(key, value, refs)
 
+    def set_values(self, rows, cols, values) -> None:
+        """
+        Set many single values by row and column label at once.
+
+        This is equivalent to ``df.at[row, col] = value`` for each triple of
+        ``zip(rows, cols, values)``, but the labels are looked up once per axis
+        and the values are set per block instead of cell by cell.
+
+        .. versionadded:: 3.0.0
+
+        Parameters
+        ----------
+        rows : list-like
+            Row labels of the cells to set.
+        cols : list-like
+            Column labels of the cells to set, of the same length as ``rows``.
+        values : scalar or list-like
+            Values to set, of the same length as ``rows``. A scalar is set in
+            all the cells. If a cell is given more than once, the last value
+            is set.
+
+        Returns
+        -------
+        None
+            The DataFrame is modified in place.
+
+        Raises
+        ------
+        KeyError
+            If a label is not found. Unlike ``.at``, ``set_values`` does not
+            enlarge the DataFrame.
+        ValueError
+            If ``rows``, ``cols`` and ``values`` have different lengths.
+
+        See Also
+        --------
+        DataFrame.at : Access a single value for a row/column label pair.
+        DataFrame.loc : Access a group of rows and columns by label(s).
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {"A": [1.0, 2.0, 3.0], "B": ["x", "y", "z"]}, index=["a", "b", "c"]
+        ... )
+        >>> df.set_values(["a", "c", "b"], ["A", "A", "B"], [10.0, 30.0, "w"])
+        >>> df
+              A  B
+        a  10.0  x
+        b   2.0  w
+        c  30.0  z
+        """
+        if not PYPY:
+            if sys.getrefcount(self) <= REF_COUNT:
+                warnings.warn(
+                    _chained_assignment_method_msg,
+                    ChainedAssignmentError,
+                    stacklevel=2,
+                )
+
+        rows = ensure_index(rows)
+        cols = ensure_index(cols)
+        if is_list_like(values):
+            values = construct_1d_object_array_from_listlike(list(values))
+        else:
+            values = construct_1d_arraylike_from_scalar(
+                values, len(rows), np.dtype(object)
+            )
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("rows, cols and values must have the same length")
+
+        if not (self.index.is_unique and self.columns.is_unique):
+            for labels, axis in ((rows, self.index), (cols, self.columns)):
+                missing = ~labels.isin(axis)
+                if missing.any():
+                    raise KeyError(f"{list(labels[missing].unique())} not in index")
+            for row, col, value in zip(rows, cols, values):
+                self._set_value(row, col, value)
+            return
+
+        irows = self.index.get_indexer(rows)
+        icols = self.columns.get_indexer(cols)
+        for labels, indexer in ((rows, irows), (cols, icols)):
+            missing = indexer == -1
+            if missing.any():
+                raise KeyError(f"{list(labels[missing].unique())} not in index")
+
+        # keep the last value of the cells which are set more than once
+        cells = icols * len(self.index) + irows
+        _, last = np.unique(cells[::-1], return_index=True)
+        if len(last) < len(cells):
+            keep = len(cells) - 1 - last
+            irows, icols, values = irows[keep], icols[keep], values[keep]
+
+        self._mgr.setitem_cells(irows, icols, values)
+
     def _set_value(
         self, index: IndexLabel, col, value: Scalar, takeable: bool = False
     ) -> None:
@@ -11597,6 +11918,18 @@ class DataFrame(NDFrame, OpsMixin):
                         result = result.mask(mask, other)
                     return result
 
+                if (
+                    name in ("sum", "prod", "min", "max")
+                    and len(df._mgr.blocks) > 1
+                    and not kwds.get("min_count")
+                    and isinstance(dtype, np.dtype)
+                    and dtype.kind in "iuf"
+                    and all(block.dtype == dtype for block in df._mgr.blocks)
+                ):
+                    # Fastpath for blocks of a single dtype (e.g. columns which
+                    # are not consolidated) avoiding a transpose
+                    return df._reduce_axis1(name, op, skipna=skipna)
+
             df = df.T
 
         # After possibly _get_data and transposing, we are now in the
@@ -11621,6 +11954,7 @@ class DataFrame(NDFrame, OpsMixin):
         Apply the reduction block-wise along axis=1 and then reduce the resulting
         1D arrays.
         """
+        result: np.ndarray | None
         if name == "all":
             result = np.ones(len(self), dtype=bool)
             ufunc = np.logical_and
@@ -11632,12 +11966,21 @@ class DataFrame(NDFrame, OpsMixin):
             # "_UFunc_Nin2_Nout1[Literal['logical_and'], Literal[20],
             # Literal[True]]")
             ufunc = np.logical_or  # type: ignore[assignment]
+        elif name in ("sum", "prod", "min", "max"):
+            # start from the reduction of the first block
+            result = None
+            ufunc = {  # type: ignore[assignment]
+                "sum": np.add,
+                "prod": np.multiply,
+                "min": np.fmin if skipna else np.minimum,
+                "max": np.fmax if skipna else np.maximum,
+            }[name]
         else:
             raise NotImplementedError(name)
 
         for blocks in self._mgr.blocks:
             middle = func(blocks.values, axis=0, skipna=skipna)
-            result = ufunc(result, middle)
+            result = middle if result is None else ufunc(result, middle)
 
         res_ser = self._constructor_sliced(result, index=self.index, copy=False)
         return res_ser
@@ -12773,7 +13116,14 @@ class DataFrame(NDFrame, OpsMixin):
         data = self._get_numeric_data() if numeric_only else self
         return NDFrame.cumprod(data, axis, skipna, *args, **kwargs)
 
-    def nunique(self, axis: Axis = 0, dropna: bool = True) -> Series:
+    def nunique(
+        self,
+        axis: Axis = 0,
+        dropna: bool = True,
+        *,
+        approx: bool = False,
+        error: float = 0.01,
+    ) -> Series:
         """
         Count number of distinct elements in specified axis.
 
@@ -12787,6 +13137,15 @@ class DataFrame(NDFrame, OpsMixin):
             column-wise.
         dropna : bool, default True
             Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the counts with HyperLogLog sketches instead of counting
+            exactly, see :meth:`Series.nunique`.
+
+            .. versionadded:: 3.0.0
+        error : float, default 0.01
+            Relative standard error of the estimates if ``approx=True``.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -12812,7 +13171,9 @@ class DataFrame(NDFrame, OpsMixin):
         2    2
         dtype: int64
         """
-        return self.apply(Series.nunique, axis=axis, dropna=dropna)
+        return self.apply(
+            Series.nunique, axis=axis, dropna=dropna, approx=approx, error=error
+        )
 
     def idxmin(
         self, axis: Axis = 0, skipna: bool = True, numeric_only: bool = False
@@ -13142,7 +13503,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = ...,
         numeric_only: bool = ...,
         interpolation: QuantileInterpolation = ...,
-        method: Literal["single", "table"] = ...,
+        method: Literal["single", "table", "approx"] = ...,
     ) -> Series: ...
 
     @overload
@@ -13152,7 +13513,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = ...,
         numeric_only: bool = ...,
         interpolation: QuantileInterpolation = ...,
-        method: Literal["single", "table"] = ...,
+        method: Literal["single", "table", "approx"] = ...,
     ) -> Series | DataFrame: ...
 
     @overload
@@ -13162,7 +13523,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = ...,
         numeric_only: bool = ...,
         interpolation: QuantileInterpolation = ...,
-        method: Literal["single", "table"] = ...,
+        method: Literal["single", "table", "approx"] = ...,
     ) -> Series | DataFrame: ...
 
     def quantile(
@@ -13171,7 +13532,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = 0,
         numeric_only: bool = False,
         interpolation: QuantileInterpolation = "linear",
-        method: Literal["single", "table"] = "single",
+        method: Literal["single", "table", "approx"] = "single",
     ) -> Series | DataFrame:
         """
         Return values at the given quantile over requested axis.
@@ -13198,10 +13559,16 @@ class DataFrame(NDFrame, OpsMixin):
             * higher: `j`.
             * nearest: `i` or `j` whichever is nearest.
             * midpoint: (`i` + `j`) / 2.
-        method : {'single', 'table'}, default 'single'
+        method : {'single', 'table', 'approx'}, default 'single'
             Whether to compute quantiles per-column ('single') or over all columns
             ('table'). When 'table', the only allowed interpolation methods are
-            'nearest', 'lower', and 'higher'.
+            'nearest', 'lower', and 'higher'. 'approx' estimates the quantiles
+            per-column with a t-digest, which is accurate to a fraction of a
+            percent of the ranks, most of all for quantiles close to 0 and 1,
+            and ignores ``interpolation``.
+
+            .. versionadded:: 3.0.0
+                The 'approx' method.
 
         Returns
         -------
@@ -13273,7 +13640,7 @@ class DataFrame(NDFrame, OpsMixin):
                 interpolation=interpolation,
                 method=method,
             )
-            if method == "single":
+            if method != "table":
                 res = res_df.iloc[0]
             else:
                 # cannot directly iloc over sparse arrays
@@ -13305,13 +13672,19 @@ class DataFrame(NDFrame, OpsMixin):
             res = self._constructor([], index=q, columns=cols, dtype=dtype)
             return res.__finalize__(self, method="quantile")
 
-        valid_method = {"single", "table"}
+        valid_method = {"single", "table", "approx"}
         if method not in valid_method:
             raise ValueError(
                 f"Invalid method: {method}. Method must be in {valid_method}."
             )
         if method == "single":
             res = data._mgr.quantile(qs=q, interpolation=interpolation)
+        elif method == "approx":
+            # the blocks dispatch "approx" to the t-digest of quantile_compat
+            res = data._mgr.quantile(
+                qs=q,
+                interpolation="approx",  # type: ignore[arg-type]
+            )
         elif method == "table":
             valid_interpolation = {"nearest", "lower", "higher"}
             if interpolation not in valid_interpolation:
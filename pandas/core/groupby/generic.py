@@ -62,6 +62,7 @@ from pandas.core.apply import (
     reconstruct_func,
     validate_func_kwargs,
 )
+from pandas.core.array_algos import sketches
 import pandas.core.common as com
 from pandas.core.frame import DataFrame
 from pandas.core.groupby import base
@@ -96,6 +97,7 @@ if TYPE_CHECKING:
         Manager,
         SingleBlockManager,
         TakeIndexer,
+        npt,
     )
 
     from pandas import Categorical
@@ -798,7 +800,9 @@ class SeriesGroupBy(GroupBy[Series]):
         filtered = self._apply_filter(indices, dropna)
         return filtered
 
-    def nunique(self, dropna: bool = True) -> Series | DataFrame:
+    def nunique(
+        self, dropna: bool = True, *, approx: bool = False, error: float = 0.01
+    ) -> Series | DataFrame:
         """
         Return number of unique elements in the group.
 
@@ -806,6 +810,17 @@ class SeriesGroupBy(GroupBy[Series]):
         ----------
         dropna : bool, default True
             Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the counts with a HyperLogLog sketch per group instead of
+            counting exactly. Each sketch takes about ``(1.04 / error) ** 2``
+            bytes, rounded up to a power of 2; smaller groups are counted
+            exactly.
+
+            .. versionadded:: 3.0.0
+        error : float, default 0.01
+            Relative standard error of the estimates if ``approx=True``.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -834,6 +849,10 @@ class SeriesGroupBy(GroupBy[Series]):
         ids = self._grouper.ids
         ngroups = self._grouper.ngroups
         val = self.obj._values
+        if approx:
+            res = sketches.group_nunique_approx(val, ids, ngroups, dropna, error)
+            return self._wrap_nunique_result(res)
+
         codes, uniques = algorithms.factorize(val, use_na_sentinel=dropna, sort=False)
 
         if self._grouper.has_dropped_na:
@@ -856,8 +875,9 @@ class SeriesGroupBy(GroupBy[Series]):
 
         mask = duplicated(group_index, "first")
         res = np.bincount(ids[~mask], minlength=ngroups)
-        res = ensure_int64(res)
+        return self._wrap_nunique_result(ensure_int64(res))
 
+    def _wrap_nunique_result(self, res: npt.NDArray[np.int64]) -> Series | DataFrame:
         ri = self._grouper.result_index
         result: Series | DataFrame = self.obj._constructor(
             res, index=ri, name=self.obj.name
@@ -2516,7 +2536,9 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
             res_df = self._insert_inaxis_grouper(res_df)
         return res_df
 
-    def nunique(self, dropna: bool = True) -> DataFrame:
+    def nunique(
+        self, dropna: bool = True, *, approx: bool = False, error: float = 0.01
+    ) -> DataFrame:
         """
         Return DataFrame with counts of unique elements in each position.
 
@@ -2524,6 +2546,15 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         ----------
         dropna : bool, default True
             Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the counts with HyperLogLog sketches instead of counting
+            exactly, see :meth:`.SeriesGroupBy.nunique`.
+
+            .. versionadded:: 3.0.0
+        error : float, default 0.01
+            Relative standard error of the estimates if ``approx=True``.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -2568,7 +2599,9 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         4   ham       5      x
         5   ham       5      y
         """
-        return self._apply_to_column_groupbys(lambda sgb: sgb.nunique(dropna))
+        return self._apply_to_column_groupbys(
+            lambda sgb: sgb.nunique(dropna, approx=approx, error=error)
+        )
 
     def idxmax(
         self,
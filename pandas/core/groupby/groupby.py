@@ -43,6 +43,7 @@ from pandas._libs import (
 from pandas._libs.algos import rank_1d
 import pandas._libs.groupby as libgroupby
 from pandas._libs.missing import NA
+import pandas._libs.sketches as libsketches
 from pandas._typing import (
     AnyArrayLike,
     ArrayLike,
@@ -4238,6 +4239,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             "linear", "lower", "higher", "nearest", "midpoint"
         ] = "linear",
         numeric_only: bool = False,
+        method: Literal["single", "approx"] = "single",
     ):
         """
         Return group values at the given quantile, a la numpy.percentile.
@@ -4257,6 +4259,13 @@ class GroupBy(BaseGroupBy[NDFrameT]):
 
                 numeric_only now defaults to ``False``.
 
+        method : {'single', 'approx'}, default 'single'
+            Whether to compute the exact quantiles ('single') or to estimate
+            them with a t-digest per group ('approx'), which avoids sorting the
+            values within the groups. 'approx' ignores ``interpolation``.
+
+            .. versionadded:: 3.0.0
+
         Returns
         -------
         Series or DataFrame
@@ -4280,6 +4289,14 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         a    2.0
         b    3.0
         """
+        valid_method = {"single", "approx"}
+        if method not in valid_method:
+            raise ValueError(
+                f"Invalid method: {method}. Method must be in {valid_method}."
+            )
+        # the interpolated quantiles are not cast back to integer dtypes
+        interpolates = method == "approx" or interpolation in {"linear", "midpoint"}
+
         mgr = self._get_data_to_aggregate(numeric_only=numeric_only, name="quantile")
         obj = self._wrap_agged_manager(mgr)
         splitter = self._grouper._get_splitter(obj)
@@ -4336,9 +4353,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
                 if isinstance(orig_vals, BaseMaskedArray):
                     assert result_mask is not None  # for mypy
 
-                    if interpolation in {"linear", "midpoint"} and not is_float_dtype(
-                        orig_vals
-                    ):
+                    if interpolates and not is_float_dtype(orig_vals):
                         return FloatingArray(vals, result_mask)
                     else:
                         # Item "ExtensionDtype" of "Union[ExtensionDtype, str,
@@ -4354,10 +4369,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
                                 result_mask,
                             )
 
-                elif not (
-                    is_integer_dtype(inference)
-                    and interpolation in {"linear", "midpoint"}
-                ):
+                elif not (is_integer_dtype(inference) and interpolates):
                     if needs_i8_conversion(inference):
                         # error: Item "ExtensionArray" of "Union[ExtensionArray,
                         # ndarray[Any, Any]]" has no attribute "_ndarray"
@@ -4389,14 +4401,35 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             ids = ids[ids >= 0]
         nqs = len(qs)
 
-        func = partial(
-            libgroupby.group_quantile,
-            labels=ids,
-            qs=qs,
-            interpolation=interpolation,
-            starts=starts,
-            ends=ends,
-        )
+        if method == "approx":
+
+            def func(
+                out: np.ndarray,
+                values: np.ndarray,
+                mask: npt.NDArray[np.bool_],
+                result_mask: np.ndarray | None,
+                is_datetimelike: bool,
+            ) -> None:
+                # missing values, including NaT, are in the mask
+                libsketches.group_quantile_approx(
+                    out,
+                    values=values.astype(np.float64, copy=False),
+                    mask=mask,
+                    qs=qs,
+                    starts=starts,
+                    ends=ends,
+                    result_mask=result_mask,
+                )
+
+        else:
+            func = partial(
+                libgroupby.group_quantile,
+                labels=ids,
+                qs=qs,
+                interpolation=interpolation,
+                starts=starts,
+                ends=ends,
+            )
 
         def blk_func(values: ArrayLike) -> ArrayLike:
             orig_vals = values
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import collections
 import functools
+import itertools
 from typing import (
     TYPE_CHECKING,
     Generic,
@@ -66,6 +67,10 @@ from pandas.core.sorting import (
     get_group_index_sorter,
     get_indexer_dict,
 )
+from pandas.core.util.parallel import (
+    get_num_threads,
+    thread_map,
+)
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -78,6 +83,10 @@ if TYPE_CHECKING:
     from pandas.core.generic import NDFrame
 
 
+# minimal number of elements of a column chunk aggregated by a thread
+_MIN_CHUNK_SIZE = 100_000
+
+
 def check_result_array(obj, dtype) -> None:
     # Our operation is supposed to be an aggregation/reduction. If
     #  it returns an ndarray, this likely means an invalid operation has
@@ -401,12 +410,95 @@ class WrappedCythonOp:
             if result_mask is not None:
                 result_mask = result_mask.T
 
-        out_shape = self._get_output_shape(ngroups, values)
         func = self._get_cython_function(self.kind, self.how, values.dtype, is_numeric)
         values = self._get_cython_vals(values)
+
+        def call_func(
+            chunk: np.ndarray,
+        ) -> tuple[np.ndarray, npt.NDArray[np.int64] | None]:
+            return self._call_cython_func(
+                func,
+                chunk,
+                ngroups=ngroups,
+                comp_ids=comp_ids,
+                min_count=min_count,
+                mask=mask,
+                result_mask=result_mask,
+                is_datetimelike=is_datetimelike,
+                orig_dtype=dtype,
+                **kwargs,
+            )
+
+        nchunks = self._get_num_column_chunks(values, mask, result_mask)
+        if nchunks > 1:
+            # the kernels release the GIL, so column chunks are aggregated
+            #  concurrently. Group counts do not depend on the columns.
+            bounds = np.linspace(0, values.shape[1], nchunks + 1).astype(np.intp)
+            chunks = [
+                values[:, start:stop] for start, stop in itertools.pairwise(bounds)
+            ]
+            results = thread_map(call_func, chunks)
+            result = np.concatenate([res for res, _ in results], axis=1)
+            counts = results[0][1]
+        else:
+            result, counts = call_func(values)
+
+        if self.kind == "aggregate" and self.how not in ["idxmin", "idxmax"]:
+            # i.e. counts is defined.  Locations where count<min_count
+            # need to have the result set to np.nan, which may require casting,
+            # see GH#40767. For idxmin/idxmax is handled specially via post-processing
+            assert counts is not None
+            if result.dtype.kind in "iu" and not is_datetimelike:
+                # if the op keeps the int dtypes, we have to use 0
+                cutoff = max(0 if self.how in ["sum", "prod"] else 1, min_count)
+                empty_groups = counts < cutoff
+                if empty_groups.any():
+                    if result_mask is not None:
+                        assert result_mask[empty_groups].all()
+                    else:
+                        # Note: this conversion could be lossy, see GH#40767
+                        result = result.astype("float64")
+                        result[empty_groups] = np.nan
+
+        result = result.T
+
+        if self.how not in self.cast_blocklist:
+            # e.g. if we are int64 and need to restore to datetime64/timedelta64
+            # "rank" is the only member of cast_blocklist we get here
+            # Casting only needed for float16, bool, datetimelike,
+            #  and self.how in ["sum", "prod", "ohlc", "cumprod"]
+            res_dtype = self._get_result_dtype(orig_values.dtype)
+            op_result = maybe_downcast_to_dtype(result, res_dtype)
+        else:
+            op_result = result
+
+        return op_result
+
+    @final
+    def _call_cython_func(
+        self,
+        func: Callable,
+        values: np.ndarray,  # np.ndarray[ndim=2]
+        *,
+        ngroups: int,
+        comp_ids: np.ndarray,
+        min_count: int,
+        mask: npt.NDArray[np.bool_] | None,
+        result_mask: npt.NDArray[np.bool_] | None,
+        is_datetimelike: bool,
+        orig_dtype: np.dtype,
+        **kwargs,
+    ) -> tuple[np.ndarray, npt.NDArray[np.int64] | None]:
+        """
+        Call the cython function on the values transposed by _call_cython_op.
+
+        Returns the result and, for aggregations, the number of rows per group.
+        """
+        out_shape = self._get_output_shape(ngroups, values)
         out_dtype = self._get_out_dtype(values.dtype)
 
         result = maybe_fill(np.empty(out_shape, dtype=out_dtype))
+        counts = None
         if self.kind == "aggregate":
             counts = np.zeros(ngroups, dtype=np.int64)
             if self.how in [
@@ -464,7 +556,7 @@ class WrappedCythonOp:
                     result_mask=result_mask,
                     **kwargs,
                 )
-                if dtype == object:
+                if orig_dtype == object:
                     result = result.astype(object)
 
             else:
@@ -484,35 +576,30 @@ class WrappedCythonOp:
                 **kwargs,
             )
 
-        if self.kind == "aggregate" and self.how not in ["idxmin", "idxmax"]:
-            # i.e. counts is defined.  Locations where count<min_count
-            # need to have the result set to np.nan, which may require casting,
-            # see GH#40767. For idxmin/idxmax is handled specially via post-processing
-            if result.dtype.kind in "iu" and not is_datetimelike:
-                # if the op keeps the int dtypes, we have to use 0
-                cutoff = max(0 if self.how in ["sum", "prod"] else 1, min_count)
-                empty_groups = counts < cutoff
-                if empty_groups.any():
-                    if result_mask is not None:
-                        assert result_mask[empty_groups].all()
-                    else:
-                        # Note: this conversion could be lossy, see GH#40767
-                        result = result.astype("float64")
-                        result[empty_groups] = np.nan
-
-        result = result.T
-
-        if self.how not in self.cast_blocklist:
-            # e.g. if we are int64 and need to restore to datetime64/timedelta64
-            # "rank" is the only member of cast_blocklist we get here
-            # Casting only needed for float16, bool, datetimelike,
-            #  and self.how in ["sum", "prod", "ohlc", "cumprod"]
-            res_dtype = self._get_result_dtype(orig_values.dtype)
-            op_result = maybe_downcast_to_dtype(result, res_dtype)
-        else:
-            op_result = result
+        return result, counts
 
-        return op_result
+    @final
+    def _get_num_column_chunks(
+        self,
+        values: np.ndarray,
+        mask: npt.NDArray[np.bool_] | None,
+        result_mask: npt.NDArray[np.bool_] | None,
+    ) -> int:
+        """
+        Number of column chunks to process in the ``compute.num_threads`` pool.
+        """
+        num_threads = get_num_threads()
+        if (
+            num_threads <= 1
+            or values.dtype == object
+            or mask is not None
+            or result_mask is not None
+            or self.how == "ohlc"
+        ):
+            # masks are required to be C-contiguous by some kernels, and
+            #  object kernels hold the GIL
+            return 1
+        return min(num_threads, values.shape[1], values.size // _MIN_CHUNK_SIZE)
 
     @final
     def _validate_axis(self, axis: AxisInt, values: ArrayLike) -> None:
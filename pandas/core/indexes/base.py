@@ -16,6 +16,7 @@ from typing import (
     overload,
 )
 import warnings
+import weakref
 
 import numpy as np
 
@@ -156,6 +157,7 @@ from pandas.core.array_algos.putmask import (
 )
 from pandas.core.arrays import (
     ArrowExtensionArray,
+    ArrowStringArray,
     BaseMaskedArray,
     Categorical,
     DatetimeArray,
@@ -233,6 +235,53 @@ str_t = str
 
 _dtype_obj = np.dtype("object")
 
+# Engines of indexes whose engine target is the same ndarray (same memory,
+#  shape, strides and dtype), e.g. an Index and Index(index). Entries are only
+#  kept while an index holds the engine, which holds the values.
+_shared_engines: weakref.WeakValueDictionary[tuple, Any] = weakref.WeakValueDictionary()
+# The references of the index that built each shared engine
+_shared_engine_refs: weakref.WeakKeyDictionary[Any, BlockValuesRefs] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _array_identity(values: np.ndarray) -> tuple:
+    return (values.__array_interface__["data"][0], values.shape, values.strides)
+
+
+def _shared_engine_key(
+    prefix: tuple, arrays: tuple[np.ndarray, ...], refs: BlockValuesRefs
+) -> tuple:
+    """
+    Key of the engine built on ``arrays`` in ``_shared_engines``.
+
+    A writeable array can be changed in place by whoever else holds it, e.g.
+    the array passed to ``Index(values, copy=False)``, and a new index over the
+    changed memory must not find the hash table of the old contents. Engines
+    on writeable arrays are therefore only shared between indexes derived from
+    one another, which share their ``refs``.
+    """
+    key = prefix + tuple((arr.dtype, _array_identity(arr)) for arr in arrays)
+    if any(arr.flags.writeable for arr in arrays):
+        return (*key, id(refs))
+    return (*key, None)
+
+
+def _get_shared_engine(key: tuple, refs: BlockValuesRefs):
+    engine = _shared_engines.get(key)
+    if engine is not None and key[-1] is not None:
+        # the id of refs may have been reused after the index that built the
+        #  engine was collected
+        if _shared_engine_refs.get(engine) is not refs:
+            return None
+    return engine
+
+
+def _set_shared_engine(key: tuple, refs: BlockValuesRefs, engine) -> None:
+    _shared_engines[key] = engine
+    _shared_engine_refs[engine] = refs
+
+
 _masked_engines = {
     "Complex128": libindex.MaskedComplex128Engine,
     "Complex64": libindex.MaskedComplex64Engine,
@@ -838,9 +887,39 @@ class Index(IndexOpsMixin, PandasObject):
     def _engine(
         self,
     ) -> libindex.IndexEngine | libindex.ExtensionEngine | libindex.MaskedIndexEngine:
-        # For base class (object dtype) we get ObjectEngine
+        if type(self) is Index and isinstance(self._values, ArrowStringArray):
+            # hash the Arrow buffers instead of converting to object dtype
+            return libindex.ArrowStringEngine(
+                self._values, *self._values._utf8_buffers()
+            )
+
         target_values = self._get_engine_target()
 
+        # Share the engine, and so its hash table, with the other indexes
+        #  backed by the same array
+        key = None
+        if isinstance(target_values, np.ndarray):
+            key = _shared_engine_key(
+                (type(self), self.dtype), (target_values,), self._references
+            )
+            engine = _get_shared_engine(key, self._references)
+            if engine is not None:
+                return engine
+
+        engine = self._make_engine(target_values)
+        if (
+            key is not None
+            and isinstance(engine, libindex.IndexEngine)
+            and _array_identity(engine.values) == _array_identity(target_values)
+        ):
+            # otherwise the engine does not keep the memory of the key alive
+            _set_shared_engine(key, self._references, engine)
+        return engine
+
+    def _make_engine(
+        self, target_values: ArrayLike
+    ) -> libindex.IndexEngine | libindex.ExtensionEngine | libindex.MaskedIndexEngine:
+        # For base class (object dtype) we get ObjectEngine
         if isinstance(self._values, ArrowExtensionArray) and self.dtype.kind in "Mm":
             import pyarrow as pa
 
@@ -3765,7 +3844,7 @@ class Index(IndexOpsMixin, PandasObject):
                     target
                 )
             else:
-                tgt_values = target._get_engine_target()
+                tgt_values = self._get_engine_lookup_target(target)
 
             indexer = self._engine.get_indexer(tgt_values)
 
@@ -5025,6 +5104,18 @@ class Index(IndexOpsMixin, PandasObject):
             return self._values.astype(object)
         return vals
 
+    @final
+    def _get_engine_lookup_target(self, target: Index) -> ArrayLike:
+        """
+        Get the values of ``target`` to look up in our engine.
+        """
+        if isinstance(self._engine, libindex.ArrowStringEngine) and isinstance(
+            target._values, ArrowStringArray
+        ):
+            # compare the Arrow buffers directly
+            return target._values
+        return target._get_engine_target()
+
     @final
     def _get_join_target(self) -> np.ndarray:
         """
@@ -6008,7 +6099,7 @@ class Index(IndexOpsMixin, PandasObject):
             # no attribute "_extract_level_codes"
             tgt_values = engine._extract_level_codes(target)  # type: ignore[union-attr]
         else:
-            tgt_values = target._get_engine_target()
+            tgt_values = self._get_engine_lookup_target(target)
 
         indexer, missing = self._engine.get_indexer_non_unique(tgt_values)
         return ensure_platform_int(indexer), ensure_platform_int(missing)
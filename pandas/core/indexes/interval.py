@@ -59,6 +59,7 @@ from pandas.core.dtypes.dtypes import (
     DatetimeTZDtype,
     IntervalDtype,
 )
+from pandas.core.dtypes.generic import ABCSeries
 from pandas.core.dtypes.missing import is_valid_na_for_dtype
 
 from pandas.core.algorithms import unique
@@ -89,6 +90,10 @@ from pandas.core.indexes.timedeltas import (
     TimedeltaIndex,
     timedelta_range,
 )
+from pandas.core.util.parallel import (
+    get_num_threads,
+    thread_map,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Hashable
@@ -102,6 +107,9 @@ if TYPE_CHECKING:
     )
 _index_doc_kwargs = dict(ibase._index_doc_kwargs)
 
+# minimal number of targets queried in the IntervalTree by a thread
+_MIN_CHUNK_SIZE = 100_000
+
 _index_doc_kwargs.update(
     {
         "klass": "IntervalIndex",
@@ -243,7 +251,11 @@ class IntervalIndex(ExtensionIndex):
                 verify_integrity=verify_integrity,
             )
 
-        return cls._simple_new(array, name)
+        refs = None
+        if not copy and isinstance(data, (Index, ABCSeries)):
+            refs = data._references
+
+        return cls._simple_new(array, name, refs=refs)
 
     @classmethod
     @Appender(
@@ -356,10 +368,53 @@ class IntervalIndex(ExtensionIndex):
     def _engine(self) -> IntervalTree:  # type: ignore[override]
         # IntervalTree does not supports numpy array unless they are 64 bit
         left = self._maybe_convert_i8(self.left)
-        left = maybe_upcast_numeric_to_64bit(left)
+        left = np.asarray(maybe_upcast_numeric_to_64bit(left))
         right = self._maybe_convert_i8(self.right)
-        right = maybe_upcast_numeric_to_64bit(right)
-        return IntervalTree(left, right, closed=self.closed)
+        right = np.asarray(maybe_upcast_numeric_to_64bit(right))
+
+        # Share the tree with the other indexes with the same bounds, see
+        #  Index._engine
+        key = ibase._shared_engine_key(
+            (IntervalTree, self.closed), (left, right), self._references
+        )
+        engine = ibase._get_shared_engine(key, self._references)
+        if engine is not None:
+            return engine
+
+        engine = IntervalTree(left, right, closed=self.closed)
+        if ibase._array_identity(engine.left) == ibase._array_identity(
+            left
+        ) and ibase._array_identity(engine.right) == ibase._array_identity(right):
+            ibase._set_shared_engine(key, self._references, engine)
+        return engine
+
+    def _query_engine(self, values: np.ndarray, unique: bool):
+        """
+        Query the IntervalTree with scalar targets.
+
+        Large targets are split in chunks which are queried in the threads of
+        ``compute.num_threads``, as the IntervalTree releases the GIL.
+        """
+        engine = self._engine
+        nchunks = min(get_num_threads(), len(values) // _MIN_CHUNK_SIZE)
+        if nchunks <= 1:
+            if unique:
+                return engine.get_indexer(values)
+            return engine.get_indexer_non_unique(values)
+
+        # flatten the tree before querying from the threads
+        engine.get_indexer(values[:0])
+        chunks = np.array_split(values, nchunks)
+        if unique:
+            return np.concatenate(thread_map(engine.get_indexer, chunks))
+
+        results = thread_map(engine.get_indexer_non_unique, chunks)
+        starts = np.cumsum([0] + [len(chunk) for chunk in chunks[:-1]])
+        indexer = np.concatenate([result[0] for result in results])
+        missing = np.concatenate(
+            [result[1] + start for result, start in zip(results, starts)]
+        )
+        return indexer, missing
 
     def __contains__(self, key: Any) -> bool:
         """
@@ -718,7 +773,7 @@ class IntervalIndex(ExtensionIndex):
             # homogeneous scalar index: use IntervalTree
             # we should always have self._should_partial_index(target) here
             target = self._maybe_convert_i8(target)
-            indexer = self._engine.get_indexer(target.values)
+            indexer = self._query_engine(target.values, unique=True)
         else:
             # heterogeneous scalar index: defer elementwise to get_loc
             # we should always have self._should_partial_index(target) here
@@ -753,7 +808,7 @@ class IntervalIndex(ExtensionIndex):
             # Note: this case behaves differently from other Index subclasses
             #  because IntervalIndex does partial-int indexing
             target = self._maybe_convert_i8(target)
-            indexer, missing = self._engine.get_indexer_non_unique(target.values)
+            indexer, missing = self._query_engine(target.values, unique=False)
 
         return ensure_platform_int(indexer), ensure_platform_int(missing)
 
@@ -27,7 +27,10 @@ from pandas._libs import (
     index as libindex,
     lib,
 )
-from pandas._libs.hashtable import duplicated
+from pandas._libs.hashtable import (
+    UInt64HashTable,
+    duplicated,
+)
 from pandas._typing import (
     AnyAll,
     AnyArrayLike,
@@ -165,6 +168,99 @@ class MultiIndexUInt8Engine(libindex.BaseMultiIndexCodesEngine, libindex.UInt8En
     _codes_dtype = "uint8"
 
 
+class MultiIndexUInt64WideEngine(
+    libindex.BaseMultiIndexCodesEngine, libindex.UInt64Engine
+):
+    """Manages a MultiIndex by mapping label combinations to positive integers.
+
+    This class manages the cases in which the number of possible label
+    combinations overflows the 64 bits integers, but the number of labels does
+    not overflow 32 bits. The levels are split in words of at most 64 bits,
+    and the words are folded into a single uint64 using their ranks among the
+    words present in the index, which preserves the lexicographic order.
+    """
+
+    _base = libindex.UInt64Engine
+    _codes_dtype = "uint64"
+
+    def __init__(self, levels, labels, sizes: np.ndarray) -> None:
+        """
+        Parameters
+        ----------
+        levels : list-like of numpy arrays
+            Levels of the MultiIndex.
+        labels : list-like of numpy arrays of integer dtype
+            Labels of the MultiIndex.
+        sizes : numpy array of int dtype
+            Number of bits needed for the codes of each level.
+        """
+        # Group the levels, starting from the right, in words of at most 64 bits
+        words: list[list[int]] = [[]]
+        word_bits = 0
+        for i in range(len(sizes) - 1, -1, -1):
+            if word_bits + sizes[i] > 64:
+                words.append([])
+                word_bits = 0
+            words[-1].insert(0, i)
+            word_bits += sizes[i]
+        words.reverse()
+        self._words = words
+
+        # Offsets of each level within its word
+        offsets = np.zeros(len(sizes), dtype="uint64")
+        for word in words:
+            offsets[word] = np.cumsum(sizes[word][::-1])[::-1] - sizes[word]
+
+        # For each folding step, the hash tables mapping the (folded) words of
+        # the index to their rank, set from the codes of the index itself
+        self._rank_tables: list[tuple[UInt64HashTable, UInt64HashTable, int]] = []
+        super().__init__(levels, labels, offsets)
+
+    def _codes_to_ints(self, codes: np.ndarray) -> np.ndarray:
+        if codes.ndim == 1:
+            # Single key, combinations with a word not in the index map to 0
+            values = codes.tolist()
+            offsets = self.offsets.tolist()
+            words = [sum(values[i] << offsets[i] for i in word) for word in self._words]
+            key = words[0]
+            for (left, right, bits), word in zip(self._rank_tables, words[1:]):
+                try:
+                    key = (left.get_item(key) + 1) << bits | right.get_item(word) + 1
+                except KeyError:
+                    return np.uint64(0)
+            return np.uint64(key)
+
+        codes = codes.astype(self._codes_dtype, copy=False)
+        codes <<= self.offsets
+        words = [np.bitwise_or.reduce(codes[:, word], axis=1) for word in self._words]
+        fit = not self._rank_tables
+        result = words[0]
+        for step, word in enumerate(words[1:]):
+            if fit:
+                left, right = _rank_table(result), _rank_table(word)
+                bits = len(right).bit_length()
+                self._rank_tables.append((left, right, bits))
+            else:
+                left, right, bits = self._rank_tables[step]
+            # 1-based ranks, 0 if not in the index
+            left_ranks = (left.lookup(result) + 1).astype("uint64")
+            right_ranks = (right.lookup(word) + 1).astype("uint64")
+            result = (left_ranks << np.uint64(bits)) | right_ranks
+            result[(left_ranks == 0) | (right_ranks == 0)] = 0
+        return result
+
+
+def _rank_table(values: np.ndarray) -> UInt64HashTable:
+    """
+    Hash table mapping each of the unique values to its rank among them.
+    """
+    uniques = UInt64HashTable(len(values)).unique(values)
+    uniques.sort()
+    table = UInt64HashTable(len(uniques))
+    table.map_locations(uniques)
+    return table
+
+
 class MultiIndexPyIntEngine(libindex.BaseMultiIndexCodesEngine, libindex.ObjectEngine):
     """Manages a MultiIndex by mapping label combinations to positive integers.
 
@@ -1267,6 +1363,12 @@ class MultiIndex(Index):
 
         # Check the total number of bits needed for our representation:
         if lev_bits[0] > 64:
+            if 2 * len(self).bit_length() <= 64:
+                # The levels would overflow a 64 bit uint, but the ranks of the
+                # 64 bit words do not - fold them in a uint64
+                return MultiIndexUInt64WideEngine(
+                    self.levels, self.codes, sizes.astype("uint64")
+                )
             # The levels would overflow a 64 bit uint - use Python integers:
             return MultiIndexPyIntEngine(self.levels, self.codes, offsets)
         if lev_bits[0] > 32:
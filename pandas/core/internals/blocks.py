@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import inspect
+import os
 import re
+import tempfile
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -118,6 +120,7 @@ from pandas.core.construction import (
 )
 from pandas.core.indexers import check_setitem_lengths
 from pandas.core.indexes.base import get_values_for_csv
+from pandas.core.internals.copy_tracking import record_copy
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -645,7 +648,7 @@ class Block(PandasObject, libinternals.Block):
         values = self.values
         refs: BlockValuesRefs | None
         if deep:
-            values = values.copy()
+            values = copy_values(values)
             refs = None
         else:
             refs = self.refs
@@ -657,6 +660,8 @@ class Block(PandasObject, libinternals.Block):
     def _maybe_copy(self, inplace: bool) -> Self:
         if inplace:
             deep = self.refs.has_reference()
+            if deep:
+                record_copy(self.values, self.dtype)
             return self.copy(deep=deep)
         return self.copy()
 
@@ -666,6 +671,7 @@ class Block(PandasObject, libinternals.Block):
         copy = not inplace
         if inplace:
             if self.refs.has_reference():
+                record_copy(self.values, self.dtype)
                 copy = True
             else:
                 refs = self.refs
@@ -925,6 +931,7 @@ class Block(PandasObject, libinternals.Block):
                         nb = nb.copy()
                     elif inplace and has_ref and nb.refs.has_reference():
                         # no copy in astype and we had refs before
+                        record_copy(nb.values, nb.dtype)
                         nb = nb.copy()
                     putmask_inplace(nb.values, mask, value)
                     return [nb]
@@ -989,7 +996,8 @@ class Block(PandasObject, libinternals.Block):
         Caller is responsible for checking values.dtype == self.dtype.
         """
         if copy:
-            self.values = self.values.copy()
+            record_copy(self.values, self.dtype)
+            self.values = copy_values(self.values)
         self.values[locs] = values
 
     @final
@@ -1936,6 +1944,7 @@ class ExtensionBlock(EABackedBlock):
         # When an ndarray, we should have locs.tolist() == [0]
         # When a BlockPlacement we should have list(locs) == [0]
         if copy:
+            record_copy(self.values, self.dtype)
             self.values = self.values.copy()
         self.values[:] = values
 
@@ -2362,3 +2371,77 @@ def external_values(values: ArrayLike) -> ArrayLike:
     # TODO(CoW) we should also mark our ExtensionArrays as read-only
 
     return values
+
+
+# -----------------------------------------------------------------
+# Spilling to disk
+
+
+def can_spill(values: ArrayLike) -> bool:
+    """
+    Whether the values can be stored in a memory-mapped file.
+    """
+    if isinstance(values, (DatetimeArray, TimedeltaArray)):
+        values = values._ndarray
+    return (
+        isinstance(values, np.ndarray)
+        and values.dtype != _dtype_obj
+        and values.nbytes > 0
+    )
+
+
+class _SpillMap(np.memmap):
+    """
+    Memory map created by ``spill_values``.
+
+    Distinguishes the files pandas spills to from memory maps of the user,
+    such as those of ``np.load(..., mmap_mode="r")``, which are never copied
+    to disk.
+    """
+
+
+def spill_directory(values: ArrayLike) -> str | None:
+    """
+    The directory of the file the values are spilled to, if any.
+    """
+    if isinstance(values, (DatetimeArray, TimedeltaArray)):
+        values = values._ndarray
+    # the values are a plain ndarray view on the memory map, see spill_values
+    base = values.base if isinstance(values, np.ndarray) else None
+    while isinstance(base, np.ndarray):
+        if isinstance(base, _SpillMap):
+            return os.path.dirname(base.filename)
+        base = base.base
+    return None
+
+
+def spill_values(values: ArrayLike, directory: str) -> ArrayLike:
+    """
+    Copy the values to a new memory-mapped file in the given directory.
+
+    The file is removed from the directory once it is no longer used, i.e.
+    when the returned array and all views on it are garbage collected.
+    """
+    if isinstance(values, (DatetimeArray, TimedeltaArray)):
+        return values._from_backing_data(spill_values(values._ndarray, directory))
+    values = cast(np.ndarray, values)
+
+    with tempfile.NamedTemporaryFile(
+        dir=directory, prefix="pandas-spill-", suffix=".bin"
+    ) as handle:
+        # the mapping stays valid after the temporary file is closed
+        mmap = _SpillMap(handle, dtype=values.dtype, mode="w+", shape=values.shape)
+    mmap[...] = values
+    # a plain ndarray view, such that the Block values are of the usual type,
+    #  while views on them keep the np.memmap as base
+    return mmap.view(np.ndarray)
+
+
+def copy_values(values: ArrayLike) -> ArrayLike:
+    """
+    Copy the values of a Block, keeping copies of spilled values on disk.
+    """
+    directory = spill_directory(values)
+    if directory is not None:
+        return spill_values(values, directory)
+    return values.copy()
@@ -14,9 +14,13 @@ from typing import (
 import numpy as np
 from numpy import ma
 
-from pandas._config import using_string_dtype
+from pandas._config import (
+    get_option,
+    using_string_dtype,
+)
 
 from pandas._libs import lib
+from pandas.compat import pa_version_under10p1
 
 from pandas.core.dtypes.astype import astype_is_view
 from pandas.core.dtypes.cast import (
@@ -45,7 +49,10 @@ from pandas.core import (
     algorithms,
     common as com,
 )
-from pandas.core.arrays import ExtensionArray
+from pandas.core.arrays import (
+    ArrowExtensionArray,
+    ExtensionArray,
+)
 from pandas.core.arrays.string_ import StringDtype
 from pandas.core.construction import (
     array as pd_array,
@@ -74,6 +81,9 @@ from pandas.core.internals.managers import (
     create_block_manager_from_column_arrays,
 )
 
+if not pa_version_under10p1:
+    import pyarrow as pa
+
 if TYPE_CHECKING:
     from collections.abc import (
         Hashable,
@@ -149,6 +159,36 @@ def arrays_to_mgr(
     )
 
 
+def column_arrays_to_mgr(
+    arrays: list,
+    columns: Index,
+    index,
+    *,
+    copy: bool = False,
+    consolidate: bool = False,
+) -> Manager:
+    """
+    Create a manager from arrays, storing each array in its own block.
+
+    Unlike dict_to_mgr, arrays are neither copied (unless ``copy=True``) nor
+    consolidated into 2D blocks (unless ``consolidate=True``). pyarrow arrays
+    are wrapped in an ArrowExtensionArray without conversion.
+    """
+    # stacking the numpy arrays into 2D blocks already copies them, but the
+    #  manager only consolidates when the mode.consolidate option is enabled
+    stacked = consolidate and get_option("mode.consolidate")
+    result = []
+    for arr in arrays:
+        if not pa_version_under10p1 and isinstance(arr, (pa.Array, pa.ChunkedArray)):
+            arr = ArrowExtensionArray(arr)
+        elif copy and isinstance(arr, (np.ndarray, ExtensionArray)):
+            if not (stacked and isinstance(arr, np.ndarray)):
+                arr = arr.copy()
+        result.append(arr)
+
+    return arrays_to_mgr(result, columns, index, consolidate=consolidate)
+
+
 def rec_array_to_mgr(
     data: np.rec.recarray | np.ndarray,
     index,
@@ -0,0 +1,162 @@
+"""
+Instrumentation of the copies triggered by Copy-on-Write.
+
+The Block and BlockManager methods call ``record_copy`` whenever values are
+copied because they are shared with another object, i.e. when a lazy copy
+has to be materialized before modifying the values. This is a no-op unless a
+``CopyTracker`` is active.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import sys
+from typing import (
+    TYPE_CHECKING,
+    NamedTuple,
+)
+
+if TYPE_CHECKING:
+    from types import (
+        FrameType,
+        TracebackType,
+    )
+
+    from pandas._typing import (
+        DtypeObj,
+        Self,
+    )
+
+    from pandas import DataFrame
+
+
+class CopyEvent(NamedTuple):
+    """A single copy triggered by Copy-on-Write."""
+
+    nbytes: int
+    dtype: DtypeObj
+    method: str
+    location: str
+    stack: tuple[str, ...]
+
+
+_active_trackers: contextvars.ContextVar[tuple[CopyTracker, ...]] = (
+    contextvars.ContextVar("pandas_copy_trackers", default=())
+)
+
+
+class CopyTracker:
+    """
+    Record the copies triggered by Copy-on-Write.
+
+    Use as a context manager, see :func:`pandas.api.internals.track_copies`.
+
+    Attributes
+    ----------
+    events : list of CopyEvent
+        The recorded copies, in the order they happened. Each event has the
+        ``nbytes`` and ``dtype`` of the copied block values, the public pandas
+        ``method`` that triggered the copy, the ``location`` of the calling
+        code outside of pandas and the ``stack`` of pandas functions from the
+        method to the copy.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[CopyEvent] = []
+        self._token: contextvars.Token | None = None
+
+    def __enter__(self) -> Self:
+        self._token = _active_trackers.set((*_active_trackers.get(), self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._token is not None:
+            _active_trackers.reset(self._token)
+            self._token = None
+
+    @property
+    def total_bytes(self) -> int:
+        """Total number of bytes copied."""
+        return sum(event.nbytes for event in self.events)
+
+    def report(self) -> DataFrame:
+        """
+        Summarize the copies by triggering method, dtype and calling location.
+
+        Returns
+        -------
+        DataFrame
+            With the columns ``method``, ``dtype``, ``location``, ``count``
+            and ``nbytes``, sorted by the number of bytes copied.
+        """
+        from pandas import DataFrame
+
+        columns = ["method", "dtype", "location", "count", "nbytes"]
+        summary: dict[tuple[str, str, str], list[int]] = {}
+        for event in self.events:
+            key = (event.method, str(event.dtype), event.location)
+            entry = summary.setdefault(key, [0, 0])
+            entry[0] += 1
+            entry[1] += event.nbytes
+        rows = [(*key, count, nbytes) for key, (count, nbytes) in summary.items()]
+        result = DataFrame(rows, columns=columns).astype(
+            {"count": "int64", "nbytes": "int64"}
+        )
+        return result.sort_values(
+            "nbytes", ascending=False, kind="stable", ignore_index=True
+        )
+
+
+def _summarize_stack(frame: FrameType | None) -> tuple[str, str, tuple[str, ...]]:
+    """
+    Walk the stack up to the first frame outside of pandas (tests
+    notwithstanding), returning the pandas method called from there,
+    the calling location and the pandas frames in between.
+    """
+    import pandas as pd
+
+    pkg_dir = os.path.dirname(pd.__file__)
+    test_dir = os.path.join(pkg_dir, "tests")
+
+    stack: list[str] = []
+    method = "<unknown>"
+    location = "<unknown>"
+    try:
+        while frame:
+            code = frame.f_code
+            filename = code.co_filename
+            if not filename.startswith(pkg_dir) or filename.startswith(test_dir):
+                location = f"{filename}:{frame.f_lineno}"
+                break
+            method = getattr(code, "co_qualname", code.co_name)
+            stack.append(f"{method} ({filename}:{frame.f_lineno})")
+            frame = frame.f_back
+    finally:
+        del frame
+    return method, location, tuple(reversed(stack))
+
+
+def record_copy(values, dtype: DtypeObj) -> None:
+    """
+    Record a copy of ``values`` triggered by Copy-on-Write.
+
+    Parameters
+    ----------
+    values : ndarray or ExtensionArray
+        The values which are copied.
+    dtype : np.dtype or ExtensionDtype
+        The dtype of the Block.
+    """
+    trackers = _active_trackers.get()
+    if not trackers:
+        return
+    method, location, stack = _summarize_stack(sys._getframe(1))
+    event = CopyEvent(values.nbytes, dtype, method, location, stack)
+    for tracker in trackers:
+        tracker.events.append(event)
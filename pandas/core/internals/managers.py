@@ -32,6 +32,7 @@ from pandas._libs.internals import (
 from pandas._libs.tslibs import Timestamp
 from pandas.errors import (
     AbstractMethodError,
+    LossySetitemError,
     PerformanceWarning,
 )
 from pandas.util._decorators import cache_readonly
@@ -79,17 +80,26 @@ from pandas.core.indexes.api import (
 from pandas.core.internals.blocks import (
     Block,
     NumpyBlock,
+    can_spill,
+    copy_values,
     ensure_block_shape,
     extend_blocks,
     get_block_type,
     maybe_coerce_values,
     new_block,
     new_block_2d,
+    spill_directory,
+    spill_values,
 )
+from pandas.core.internals.copy_tracking import record_copy
 from pandas.core.internals.ops import (
     blockwise_all,
     operate_blockwise,
 )
+from pandas.core.util.parallel import (
+    get_num_threads,
+    thread_map,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -418,24 +428,28 @@ class BaseBlockManager(PandasObject):
 
         aligned_args = {k: kwargs[k] for k in align_keys}
 
-        for b in self.blocks:
+        def apply_block(b: Block) -> list[Block] | Block:
+            blk_kwargs = kwargs
             if aligned_args:
+                blk_kwargs = kwargs.copy()
                 for k, obj in aligned_args.items():
                     if isinstance(obj, (ABCSeries, ABCDataFrame)):
                         # The caller is responsible for ensuring that
                         #  obj.axes[-1].equals(self.items)
                         if obj.ndim == 1:
-                            kwargs[k] = obj.iloc[b.mgr_locs.indexer]._values
+                            blk_kwargs[k] = obj.iloc[b.mgr_locs.indexer]._values
                         else:
-                            kwargs[k] = obj.iloc[:, b.mgr_locs.indexer]._values
+                            blk_kwargs[k] = obj.iloc[:, b.mgr_locs.indexer]._values
                     else:
                         # otherwise we have an ndarray
-                        kwargs[k] = obj[b.mgr_locs.indexer]
+                        blk_kwargs[k] = obj[b.mgr_locs.indexer]
 
             if callable(f):
-                applied = b.apply(f, **kwargs)
-            else:
-                applied = getattr(b, f)(**kwargs)
+                return b.apply(f, **blk_kwargs)
+            return getattr(b, f)(**blk_kwargs)
+
+        # independent blocks may be processed in a thread pool
+        for applied in thread_map(apply_block, self.blocks):
             result_blocks = extend_blocks(applied, result_blocks)
 
         out = type(self).from_blocks(result_blocks, self.axes)
@@ -566,7 +580,11 @@ class BaseBlockManager(PandasObject):
 
                 values = self.blocks[0].values
                 if values.ndim == 2:
+                    directory = spill_directory(values)
                     values = values[blk_loc]
+                    if directory is not None:
+                        values = spill_values(values, directory)
+                    record_copy(values, self.blocks[0].dtype)
                     # "T" has no attribute "_iset_split_block"
                     self._iset_split_block(  # type: ignore[attr-defined]
                         0, blk_loc, values
@@ -576,6 +594,8 @@ class BaseBlockManager(PandasObject):
                     return self
             # No need to split if we either set all columns or on a single block
             # manager
+            for blk in self.blocks:
+                record_copy(blk.values, blk.dtype)
             self = self.copy()
 
         return self.apply("setitem", indexer=indexer, value=value)
@@ -740,7 +760,7 @@ class BaseBlockManager(PandasObject):
         -------
         y : BlockManager
         """
-        if self.is_consolidated():
+        if self.is_consolidated() or not get_option("mode.consolidate"):
             return self
 
         bm = type(self)(self.blocks, self.axes, verify_integrity=False)
@@ -1134,7 +1154,12 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
             result = np.empty(n, dtype=dtype)
             result = ensure_wrapped_if_datetimelike(result)
 
+        # numpy values can be set per block when they are cast to a numpy dtype
+        by_block = isinstance(result, np.ndarray) and result.dtype != object
         for blk in self.blocks:
+            if by_block and isinstance(blk.values, np.ndarray):
+                result[blk.mgr_locs.indexer] = blk.values[:, loc]
+                continue
             # Such assignment may incorrectly coerce NaT to None
             # result[blk.mgr_locs] = blk._slice((slice(None), loc))
             for i, rl in enumerate(blk.mgr_locs):
@@ -1378,6 +1403,10 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
             self._rebuild_blknos_and_blklocs()
 
         nbs_tup = tuple(blk.delete(blk_locs))
+        for nb in nbs_tup:
+            if not nb.is_view:
+                # the remaining columns could not be split off as views
+                record_copy(nb.values, nb.dtype)
         if value is not None:
             locs = blk.mgr_locs.as_array[blk_locs]
             first_nb = new_block_2d(value, BlockPlacement(locs), refs=refs)
@@ -1446,12 +1475,11 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
             blk_loc = self.blklocs[loc]
             # Copy our values
             values = self.blocks[blkno].values
-            if values.ndim == 1:
-                values = values.copy()
-            else:
-                # Use [blk_loc] as indexer to keep ndim=2, this already results in a
-                # copy
-                values = values[[blk_loc]]
+            if values.ndim == 2:
+                # Slice with blk_loc to keep ndim=2
+                values = values[blk_loc : blk_loc + 1]
+            values = copy_values(values)
+            record_copy(values, self.blocks[blkno].dtype)
             self._iset_split_block(blkno, [blk_loc], values)
 
         # this manager is only created temporarily to mutate the values in place
@@ -1463,6 +1491,72 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
             new_mgr = col_mgr.setitem((idx,), value)
             self.iset(loc, new_mgr._block.values, inplace=True)
 
+    def setitem_cells(
+        self,
+        rows: npt.NDArray[np.intp],
+        cols: npt.NDArray[np.intp],
+        values: npt.NDArray[np.object_],
+    ) -> None:
+        """
+        Set the scalars ``values`` at the positions ``(rows[i], cols[i])``.
+
+        The cells of a numpy-backed block which can hold the values without
+        changing dtype are set in place with a single setitem. The other cells
+        are set column by column with ``column_setitem``, which takes care of
+        Copy-on-Write and of upcasting.
+
+        All values are validated before any cell is set, such that the
+        manager is unchanged if one of them cannot be set.
+
+        Parameters
+        ----------
+        rows : np.ndarray[intp]
+        cols : np.ndarray[intp]
+        values : np.ndarray[object]
+            The positions are assumed to be unique.
+        """
+        inplace = []
+        by_column = []
+        blknos = self.blknos[cols]
+        for blkno in np.unique(blknos):
+            sel = blknos == blkno
+            blk = self.blocks[blkno]
+            blk_rows = rows[sel]
+            blk_cols = cols[sel]
+            blk_values = values[sel]
+            if blk.dtype != object:
+                blk_values = lib.maybe_convert_objects(blk_values)
+
+            if isinstance(blk.values, np.ndarray):
+                try:
+                    casted = np_can_hold_element(blk.dtype, blk_values)
+                except LossySetitemError:
+                    pass
+                else:
+                    if self._has_no_reference_block(blkno):
+                        inplace.append((blk, blk_rows, self.blklocs[blk_cols], casted))
+                    else:
+                        by_column.append((blk_rows, blk_cols, blk_values))
+                    continue
+
+            for loc in np.unique(blk_cols):
+                mask = blk_cols == loc
+                # set the values into a copy of the cells, which raises the
+                #  same errors as setting them into the column
+                cells = self.iget_values(loc)[blk_rows[mask]]
+                SingleBlockManager.from_array(cells, default_index(len(cells))).setitem(
+                    (np.arange(len(cells)),), blk_values[mask]
+                )
+            by_column.append((blk_rows, blk_cols, blk_values))
+
+        for blk, blk_rows, blk_locs, casted in inplace:
+            blk.values[blk_locs, blk_rows] = casted
+        # setting columns can split or replace blocks, so is done last
+        for blk_rows, blk_cols, blk_values in by_column:
+            for loc in np.unique(blk_cols):
+                mask = blk_cols == loc
+                self.column_setitem(loc, blk_rows[mask], blk_values[mask])
+
     def insert(self, loc: int, item: Hashable, value: ArrayLike, refs=None) -> None:
         """
         Insert item at selected position.
@@ -1504,6 +1598,7 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
         if (
             get_option("performance_warnings")
             and sum(not block.is_extension for block in self.blocks) > 100
+            and get_option("mode.consolidate")
         ):
             warnings.warn(
                 "DataFrame is highly fragmented.  This is usually the result "
@@ -1578,16 +1673,19 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
         """
         result_blocks: list[Block] = []
 
+        blocks: list[Block] = []
         for blk in self.blocks:
             if blk.is_object:
                 # split on object-dtype blocks bc some columns may raise
                 #  while others do not.
-                for sb in blk._split():
-                    applied = sb.apply(func)
-                    result_blocks = extend_blocks(applied, result_blocks)
+                blocks.extend(blk._split())
             else:
-                applied = blk.apply(func)
-                result_blocks = extend_blocks(applied, result_blocks)
+                blocks.append(blk)
+
+        for applied in thread_map(
+            lambda blk: blk.apply(func), _split_blocks_for_threads(blocks)
+        ):
+            result_blocks = extend_blocks(applied, result_blocks)
 
         if len(result_blocks) == 0:
             nrows = 0
@@ -1613,8 +1711,9 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
         assert self.ndim == 2
 
         res_blocks: list[Block] = []
-        for blk in self.blocks:
-            nbs = blk.reduce(func)
+        for nbs in thread_map(
+            lambda blk: blk.reduce(func), _split_blocks_for_threads(self.blocks)
+        ):
             res_blocks.extend(nbs)
 
         index = Index([None])  # placeholder
@@ -1662,9 +1761,9 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
         new_axes = list(self.axes)
         new_axes[1] = Index(qs, dtype=np.float64)
 
-        blocks = [
-            blk.quantile(qs=qs, interpolation=interpolation) for blk in self.blocks
-        ]
+        blocks = thread_map(
+            lambda blk: blk.quantile(qs=qs, interpolation=interpolation), self.blocks
+        )
 
         return type(self)(blocks, new_axes)
 
@@ -1875,6 +1974,41 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
     # ----------------------------------------------------------------
     # Consolidation
 
+    def spill(self, directory: str, memory_limit: int | None = None) -> Self:
+        """
+        Move the values of the blocks to memory-mapped files in ``directory``.
+
+        Blocks are spilled from the largest to the smallest until the values
+        remaining in memory take at most ``memory_limit`` bytes. Object and
+        extension blocks, apart from datetime-like blocks, are kept in memory.
+        """
+        self._consolidate_inplace()
+
+        in_memory = sum(
+            blk.values.nbytes
+            for blk in self.blocks
+            if spill_directory(blk.values) is None
+        )
+        candidates = [
+            blkno
+            for blkno, blk in enumerate(self.blocks)
+            if can_spill(blk.values) and spill_directory(blk.values) is None
+        ]
+        candidates.sort(
+            key=lambda blkno: self.blocks[blkno].values.nbytes, reverse=True
+        )
+
+        blocks = [blk.copy(deep=False) for blk in self.blocks]
+        for blkno in candidates:
+            if memory_limit is not None and in_memory <= memory_limit:
+                break
+            blk = self.blocks[blkno]
+            values = spill_values(blk.values, directory)
+            blocks[blkno] = blk.make_block_same_class(values)
+            in_memory -= blk.values.nbytes
+
+        return type(self).from_blocks(blocks, self.axes)
+
     def is_consolidated(self) -> bool:
         """
         Return True if more than one block with the same dtype
@@ -1898,7 +2032,7 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
         #  DataFrame._consolidate_inplace, otherwise we will fail to invalidate
         #  the DataFrame's _item_cache. The exception is for newly-created
         #  BlockManager objects not yet attached to a DataFrame.
-        if not self.is_consolidated():
+        if not self.is_consolidated() and get_option("mode.consolidate"):
             self.blocks = _consolidate(self.blocks)
             self._is_consolidated = True
             self._known_consolidated = True
@@ -2153,6 +2287,7 @@ class SingleBlockManager(BaseBlockManager):
         the dtype.
         """
         if not self._has_no_reference(0):
+            record_copy(self._block.values, self._block.dtype)
             self.blocks = (self._block.copy(),)
             self._reset_cache()
 
@@ -2223,6 +2358,43 @@ class SingleBlockManager(BaseBlockManager):
         return mgr
 
 
+def _split_blocks_for_threads(blocks: Sequence[Block]) -> Sequence[Block]:
+    """
+    Split large numpy blocks into column chunks to be processed in a thread pool.
+
+    Only used for operations that do not modify the blocks, such as reductions,
+    as the chunks do not track references to the original values.
+    """
+    num_threads = get_num_threads()
+    if num_threads <= 1 or len(blocks) >= num_threads:
+        return blocks
+
+    result: list[Block] = []
+    for blk in blocks:
+        if not isinstance(blk, NumpyBlock) or blk.ndim != 2:
+            result.append(blk)
+            continue
+        nchunks = min(num_threads, len(blk), blk.values.size // _MIN_CHUNK_SIZE)
+        if nchunks <= 1:
+            result.append(blk)
+            continue
+        locs = blk.mgr_locs.as_array
+        bounds = np.linspace(0, len(blk), nchunks + 1).astype(np.intp)
+        for start, stop in itertools.pairwise(bounds):
+            result.append(
+                type(blk)(
+                    blk.values[start:stop],
+                    placement=BlockPlacement(locs[start:stop]),
+                    ndim=2,
+                )
+            )
+    return result
+
+
+# minimal number of elements of a column chunk processed by a thread
+_MIN_CHUNK_SIZE = 100_000
+
+
 # --------------------------------------------------------------------
 # Constructor Helpers
 
@@ -2270,6 +2442,7 @@ def create_block_manager_from_column_arrays(
     # These last three are sufficient to allow us to safely pass
     #  verify_integrity=False below.
 
+    consolidate = consolidate and get_option("mode.consolidate")
     try:
         blocks = _form_blocks(arrays, consolidate, refs)
         mgr = BlockManager(blocks, axes, verify_integrity=False)
@@ -2436,6 +2609,13 @@ def _merge_blocks(
         new_values = new_values[argsort]
         new_mgr_locs = new_mgr_locs[argsort]
 
+        # keep the merged values on disk if any of the blocks was spilled
+        for blk in blocks:
+            directory = spill_directory(blk.values)
+            if directory is not None:
+                new_values = spill_values(new_values, directory)
+                break
+
         bp = BlockPlacement(new_mgr_locs)
         return [new_block_2d(new_values, placement=bp)], True
 
@@ -7,6 +7,8 @@ from typing import (
 
 from pandas.core.dtypes.common import is_1d_only_ea_dtype
 
+from pandas.core.util.parallel import thread_map
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
@@ -60,8 +62,8 @@ def operate_blockwise(
     # At this point we have already checked the parent DataFrames for
     #  assert rframe._indexed_same(lframe)
 
-    res_blks: list[Block] = []
-    for lvals, rvals, locs, left_ea, right_ea, rblk in _iter_block_pairs(left, right):
+    def op(info: BlockPairInfo) -> list[Block]:
+        lvals, rvals, locs, left_ea, right_ea, rblk = info
         res_values = array_op(lvals, rvals)
         if (
             left_ea
@@ -79,7 +81,10 @@ def operate_blockwise(
         #    assert res_values.shape == lvals.shape, (res_values.shape, lvals.shape)
 
         _reset_block_mgr_locs(nbs, locs)
+        return nbs
 
+    res_blks: list[Block] = []
+    for nbs in thread_map(op, list(_iter_block_pairs(left, right))):
         res_blks.extend(nbs)
 
     # Assertions are disabled for performance, but should hold:
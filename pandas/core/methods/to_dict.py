@@ -233,26 +233,18 @@ def to_dict(
 
     elif orient == "records":
         columns = df.columns.tolist()
-        if are_all_object_dtype_cols:
-            return [
-                into_c(zip(columns, map(maybe_box_native, row)))
-                for row in df.itertuples(index=False, name=None)
-            ]
-        else:
-            data = [
-                into_c(zip(columns, t)) for t in df.itertuples(index=False, name=None)
-            ]
-            if box_native_indices:
-                object_dtype_indices_as_set = set(box_native_indices)
-                object_dtype_cols = {
-                    col
-                    for i, col in enumerate(df.columns)
-                    if i in object_dtype_indices_as_set
-                }
-                for row in data:
-                    for col in object_dtype_cols:
-                        row[col] = maybe_box_native(row[col])
-            return data  # type: ignore[return-value]
+        data = []
+        # build the rows one batch at a time from the boxed column values
+        for batch in df._iter_column_batches(index=False):
+            for i in box_native_indices:
+                batch[i] = list(map(maybe_box_native, batch[i]))
+            if into_c is dict:
+                data.extend(lib.rows_from_columns(batch, keys=columns))
+            else:
+                data.extend(
+                    into_c(zip(columns, row)) for row in lib.rows_from_columns(batch)
+                )
+        return data
 
     elif orient == "index":
         if not df.index.is_unique:
@@ -2518,7 +2518,10 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
 
     @overload
     def quantile(
-        self, q: float = ..., interpolation: QuantileInterpolation = ...
+        self,
+        q: float = ...,
+        interpolation: QuantileInterpolation = ...,
+        method: Literal["single", "approx"] = ...,
     ) -> float: ...
 
     @overload
@@ -2526,6 +2529,7 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         self,
         q: Sequence[float] | AnyArrayLike,
         interpolation: QuantileInterpolation = ...,
+        method: Literal["single", "approx"] = ...,
     ) -> Series: ...
 
     @overload
@@ -2533,12 +2537,14 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         self,
         q: float | Sequence[float] | AnyArrayLike = ...,
         interpolation: QuantileInterpolation = ...,
+        method: Literal["single", "approx"] = ...,
     ) -> float | Series: ...
 
     def quantile(
         self,
         q: float | Sequence[float] | AnyArrayLike = 0.5,
         interpolation: QuantileInterpolation = "linear",
+        method: Literal["single", "approx"] = "single",
     ) -> float | Series:
         """
         Return value at the given quantile.
@@ -2557,6 +2563,13 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
                 * higher: `j`.
                 * nearest: `i` or `j` whichever is nearest.
                 * midpoint: (`i` + `j`) / 2.
+        method : {'single', 'approx'}, default 'single'
+            Whether to compute the exact quantiles ('single') or to estimate
+            them with a t-digest ('approx'), which is accurate to a fraction of
+            a percent of the ranks, most of all for quantiles close to 0 and 1.
+            'approx' ignores ``interpolation``.
+
+            .. versionadded:: 3.0.0
 
         Returns
         -------
@@ -2582,12 +2595,19 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         dtype: float64
         """
         validate_percentile(q)
+        valid_method = {"single", "approx"}
+        if method not in valid_method:
+            raise ValueError(
+                f"Invalid method: {method}. Method must be in {valid_method}."
+            )
 
         # We dispatch to DataFrame so that core.internals only has to worry
         #  about 2D cases.
         df = self.to_frame()
 
-        result = df.quantile(q=q, interpolation=interpolation, numeric_only=False)
+        result = df.quantile(
+            q=q, interpolation=interpolation, numeric_only=False, method=method
+        )
         if result.ndim == 2:
             result = result.iloc[:, 0]
 
@@ -5208,7 +5228,9 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         values : set or list-like
             The sequence of values to test. Passing in a single string will
             raise a ``TypeError``. Instead, turn a single string into a
-            list of one element.
+            list of one element. A numeric :class:`Index` keeps the hash table
+            of its values, so that testing many Series against the same
+            ``Index`` builds it only once.
 
         Returns
         -------
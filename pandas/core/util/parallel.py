@@ -0,0 +1,118 @@
+"""Common utilities for running operations in a thread pool"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import os
+import threading
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Sequence,
+    )
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+GLOBAL_NUM_THREADS: int = 1
+
+# the shared pool, replaced when a different number of threads is requested
+_executor: ThreadPoolExecutor | None = None
+_executor_num_threads: int = 0
+_executor_lock = threading.Lock()
+
+# set in the threads of the pool, where nested calls run serially to avoid
+# waiting on tasks which cannot be scheduled
+_in_worker: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pandas_in_worker", default=False
+)
+
+
+def set_num_threads(num_threads: int | None = 1) -> None:
+    """Set the number of threads, using all CPUs for ``None`` or ``0``."""
+    global GLOBAL_NUM_THREADS
+    if not num_threads:
+        num_threads = os.cpu_count() or 1
+    GLOBAL_NUM_THREADS = num_threads
+    with _executor_lock:
+        if _executor_num_threads != num_threads:
+            _shutdown_executor()
+
+
+def get_num_threads() -> int:
+    """Return the number of threads set by ``compute.num_threads``."""
+    return GLOBAL_NUM_THREADS
+
+
+def _run_in_worker(func: Callable[[_T], _R], item: _T) -> _R:
+    _in_worker.set(True)
+    return func(item)
+
+
+def _shutdown_executor() -> None:
+    # tasks already submitted still run, the threads exit once they are done
+    global _executor, _executor_num_threads
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+        _executor_num_threads = 0
+
+
+def _get_executor(num_threads: int) -> ThreadPoolExecutor:
+    # must be called with _executor_lock held
+    global _executor, _executor_num_threads
+    if _executor is None or _executor_num_threads != num_threads:
+        _shutdown_executor()
+        _executor = ThreadPoolExecutor(
+            max_workers=num_threads, thread_name_prefix="pandas"
+        )
+        _executor_num_threads = num_threads
+    return _executor
+
+
+def thread_map(
+    func: Callable[[_T], _R],
+    items: Sequence[_T],
+    num_threads: int | None = None,
+) -> list[_R]:
+    """
+    Apply ``func`` to each of ``items``, using a thread pool if enabled.
+
+    The items are processed in a shared pool of ``num_threads`` threads, which
+    defaults to the ``compute.num_threads`` option. This only pays off for
+    functions which release the GIL, such as most NumPy and Cython kernels.
+    Context variables of the caller, such as the ``numpy.errstate``, are
+    visible to ``func``.
+
+    Parameters
+    ----------
+    func : callable
+        Function to apply, must be safe to call concurrently.
+    items : sequence
+    num_threads : int, optional
+        Number of threads. Defaults to ``compute.num_threads``.
+
+    Returns
+    -------
+    list
+        The results in the order of ``items``. If any call raises, the
+        exception of the first such item is raised.
+    """
+    if num_threads is None:
+        num_threads = GLOBAL_NUM_THREADS
+    if num_threads <= 1 or len(items) <= 1 or _in_worker.get():
+        return [func(item) for item in items]
+
+    with _executor_lock:
+        executor = _get_executor(num_threads)
+        futures = [
+            executor.submit(contextvars.copy_context().run, _run_in_worker, func, item)
+            for item in items
+        ]
+    return [future.result() for future in futures]
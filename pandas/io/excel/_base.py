@@ -7,10 +7,20 @@ from collections.abc import (
     Mapping,
     Sequence,
 )
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 import datetime
 from decimal import Decimal
 from functools import partial
+from io import BytesIO
+import itertools
 import os
+import pickle
+import shutil
+import tempfile
 from textwrap import fill
 from typing import (
     IO,
@@ -58,6 +68,8 @@ from pandas.util.version import Version
 from pandas.io.common import (
     IOHandles,
     get_handle,
+    is_fsspec_url,
+    is_url,
     stringify_path,
     validate_header_arg,
 )
@@ -1232,6 +1244,57 @@ class ExcelWriter(Generic[_WorkbookT]):
         """
         raise NotImplementedError
 
+    def _write_columns(
+        self,
+        header_cells: list,
+        batches: Iterable[list[list]],
+        bodyrow: int,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Write formatted header cells followed by the frame body given by column.
+
+        Used for unstyled frames so that engines can write the body without
+        creating an ``ExcelCell`` per value. The default implementation turns
+        the columns back into cells and defers to ``_write_cells``.
+
+        Parameters
+        ----------
+        header_cells : list
+            cells of the formatted header and index labels
+        batches : iterable of lists of lists
+            batches of consecutive rows, each given as the formatted values of
+            the index levels and the data columns
+        bodyrow : int
+            row of the first body value, relative to ``startrow``
+        sheet_name : str, default None
+            Name of Excel sheet, if None, then use self.cur_sheet
+        startrow : upper left cell row to dump data frame
+        startcol : upper left cell column to dump data frame
+        freeze_panes: int tuple of length 2
+            contains the bottom-most row and right-most column to freeze
+        """
+        from pandas.io.formats.excel import ExcelCell
+
+        def body_cells():
+            row = bodyrow
+            for columns in batches:
+                for j, values in enumerate(columns):
+                    for i, val in enumerate(values):
+                        yield ExcelCell(row + i, j, val)
+                row += len(columns[0])
+
+        self._write_cells(
+            itertools.chain(header_cells, body_cells()),
+            sheet_name,
+            startrow=startrow,
+            startcol=startcol,
+            freeze_panes=freeze_panes,
+        )
+
     def _save(self) -> None:
         """
         Save workbook to disk.
@@ -1606,6 +1669,7 @@ class ExcelFile:
         assert engine is not None
         self.engine = engine
         self.storage_options = storage_options
+        self._engine_kwargs = engine_kwargs
 
         self._reader = self._engines[engine](
             self._io,
@@ -1635,6 +1699,7 @@ class ExcelFile:
         comment: str | None = None,
         skipfooter: int = 0,
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+        max_workers: int | None = None,
         **kwds,
     ) -> DataFrame | dict[str, DataFrame] | dict[int, DataFrame]:
         """
@@ -1745,6 +1810,17 @@ class ExcelFile:
               :class:`ArrowDtype` :class:`DataFrame`
 
             .. versionadded:: 2.0
+        max_workers : int, optional
+            When more than one sheet is requested, parse the sheets concurrently
+            in a pool of at most ``max_workers`` workers, each of which opens
+            its own copy of the workbook. The "calamine" engine releases the
+            GIL and uses threads. The other engines are implemented in pure
+            Python and use worker processes, unless the arguments cannot be
+            pickled (e.g. a lambda in ``converters``), in which case the sheets
+            are parsed one after another. The default of ``None`` parses the
+            sheets one after another.
+
+            .. versionadded:: 3.0.0
         **kwds : dict, optional
             Arbitrary keyword arguments passed to excel engine.
 
@@ -1765,27 +1841,118 @@ class ExcelFile:
         >>> df.to_excel("myfile.xlsx")  # doctest: +SKIP
         >>> file = pd.ExcelFile("myfile.xlsx")  # doctest: +SKIP
         >>> file.parse()  # doctest: +SKIP
+
+        Parse all sheets of a large workbook in up to four worker processes
+
+        >>> file.parse(sheet_name=None, max_workers=4)  # doctest: +SKIP
         """
-        return self._reader.parse(
-            sheet_name=sheet_name,
-            header=header,
-            names=names,
-            index_col=index_col,
-            usecols=usecols,
-            converters=converters,
-            true_values=true_values,
-            false_values=false_values,
-            skiprows=skiprows,
-            nrows=nrows,
-            na_values=na_values,
-            parse_dates=parse_dates,
-            date_format=date_format,
-            thousands=thousands,
-            comment=comment,
-            skipfooter=skipfooter,
-            dtype_backend=dtype_backend,
+        kwds = {
+            "header": header,
+            "names": names,
+            "index_col": index_col,
+            "usecols": usecols,
+            "converters": converters,
+            "true_values": true_values,
+            "false_values": false_values,
+            "skiprows": skiprows,
+            "nrows": nrows,
+            "na_values": na_values,
+            "parse_dates": parse_dates,
+            "date_format": date_format,
+            "thousands": thousands,
+            "comment": comment,
+            "skipfooter": skipfooter,
+            "dtype_backend": dtype_backend,
             **kwds,
-        )
+        }
+        if max_workers is not None:
+            max_workers = validate_integer("max_workers", max_workers, 1)
+            if isinstance(sheet_name, list) or sheet_name is None:
+                return self._parse_concurrently(sheet_name, max_workers, kwds)
+        return self._reader.parse(sheet_name=sheet_name, **kwds)
+
+    def _parse_concurrently(
+        self,
+        sheet_name: list[int] | list[str] | None,
+        max_workers: int,
+        kwds: dict[str, Any],
+    ) -> dict[str, DataFrame] | dict[int, DataFrame]:
+        """
+        Parse each of the requested sheets in its own worker.
+
+        Engines which release the GIL parse in a thread pool, the others in a
+        process pool. Falls back to sequential parsing if fewer than two sheets
+        are requested, if the workbook source cannot be reopened by a worker,
+        e.g. an already loaded engine workbook object, or if the arguments
+        cannot be sent to a worker process.
+        """
+        sheets: list[int] | list[str]
+        if sheet_name is None:
+            sheets = self.sheet_names
+        else:
+            # handle same-type duplicates.
+            sheets = cast(
+                Union[list[int], list[str]], list(dict.fromkeys(sheet_name).keys())
+            )
+
+        use_threads = self.engine in _GIL_RELEASING_ENGINES
+        path: str | None = None
+        handle = None
+        if isinstance(self._io, str) and not (
+            is_url(self._io) or is_fsspec_url(self._io)
+        ):
+            path = self._io
+        elif hasattr(self._reader.handles.handle, "read"):
+            handle = self._reader.handles.handle
+
+        if (path is None and handle is None) or len(sheets) < 2 or max_workers == 1:
+            return self._reader.parse(sheet_name=sheets, **kwds)
+        if not use_threads:
+            try:
+                pickle.dumps((self._engine_kwargs, kwds))
+            except (pickle.PicklingError, AttributeError, TypeError):
+                # e.g. lambdas as converters or usecols
+                return self._reader.parse(sheet_name=sheets, **kwds)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source: str | bytes
+            if path is not None:
+                source = path
+            else:
+                assert handle is not None
+                handle.seek(0)
+                if use_threads:
+                    # the threads share the bytes
+                    source = handle.read()
+                else:
+                    # the worker processes read the workbook from a file
+                    #  instead of receiving a copy of the buffer each
+                    source = os.path.join(tmpdir, "workbook")
+                    with open(source, "wb") as f:
+                        shutil.copyfileobj(handle, f)
+
+            nworkers = min(max_workers, len(sheets))
+            pool: Executor
+            if use_threads:
+                pool = ThreadPoolExecutor(max_workers=nworkers)
+            else:
+                pool = ProcessPoolExecutor(max_workers=nworkers)
+            with pool:
+                futures = [
+                    pool.submit(
+                        _parse_sheet_in_worker,
+                        source,
+                        self.engine,
+                        self._engine_kwargs,
+                        asheetname,
+                        kwds,
+                    )
+                    for asheetname in sheets
+                ]
+                return {
+                    asheetname: future.result()
+                    for asheetname, future in zip(sheets, futures)
+                }
 
     @property
     def book(self):
@@ -1858,3 +2025,27 @@ class ExcelFile:
         traceback: TracebackType | None,
     ) -> None:
         self.close()
+
+
+# engines implemented in native code which release the GIL while parsing, so
+#  that sheets can be parsed concurrently in threads instead of processes
+_GIL_RELEASING_ENGINES = frozenset(["calamine"])
+
+
+def _parse_sheet_in_worker(
+    source: str | bytes,
+    engine: str,
+    engine_kwargs: dict,
+    sheet_name: str | int,
+    kwds: dict[str, Any],
+) -> DataFrame:
+    """
+    Open ``source`` with ``engine`` and parse a single sheet.
+
+    Module level so that it can be pickled and run in a worker process by
+    :meth:`ExcelFile.parse` with ``max_workers``. Each worker opens its own
+    workbook, as the engine workbooks are not safe to share between threads.
+    """
+    io = BytesIO(source) if isinstance(source, bytes) else source
+    with ExcelFile(io, engine=engine, engine_kwargs=engine_kwargs) as xlsx:
+        return xlsx.parse(sheet_name=sheet_name, **kwds)
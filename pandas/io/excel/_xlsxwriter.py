@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 import json
 from typing import (
     TYPE_CHECKING,
@@ -13,6 +14,8 @@ from pandas.io.excel._util import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pandas._typing import (
         ExcelWriterIfSheetExists,
         FilePath,
@@ -282,3 +285,55 @@ class XlsxWriter(ExcelWriter):
                 )
             else:
                 wks.write(startrow + cell.row, startcol + cell.col, val, style)
+
+    def _write_columns(
+        self,
+        header_cells: list,
+        batches: Iterable[list[list]],
+        bodyrow: int,
+        sheet_name: str | None = None,
+        startrow: int = 0,
+        startcol: int = 0,
+        freeze_panes: tuple[int, int] | None = None,
+    ) -> None:
+        sheet_name = self._get_sheet_name(sheet_name)
+
+        # The worksheet is written row by row so that workbooks opened with
+        # ``{"constant_memory": True}`` receive the cells in the required order.
+        self._write_cells(
+            sorted(header_cells, key=lambda cell: cell.row),
+            sheet_name,
+            startrow=startrow,
+            startcol=startcol,
+            freeze_panes=freeze_panes,
+        )
+        wks = self.book.get_worksheet_by_name(sheet_name)
+
+        style_dict: dict[str, Any] = {}
+        row = startrow + bodyrow
+        for columns in batches:
+            # number formats of the values which need one, by row and column
+            fmts: dict[int, dict[int, str]] = defaultdict(dict)
+            for j, values in enumerate(columns):
+                for i, val in enumerate(values):
+                    if type(val) in (float, int, bool):
+                        continue
+                    values[i], fmt = self._value_with_fmt(val)
+                    if fmt:
+                        fmts[i][j] = fmt
+
+            for i, values in enumerate(zip(*columns)):
+                if i not in fmts:
+                    wks.write_row(row + i, startcol, values)
+                    continue
+                for j, val in enumerate(values):
+                    fmt = fmts[i].get(j)
+                    if fmt is None:
+                        wks.write(row + i, startcol + j, val)
+                        continue
+                    if fmt not in style_dict:
+                        style_dict[fmt] = self.book.add_format(
+                            _XlsxStyler.convert(None, fmt)
+                        )
+                    wks.write(row + i, startcol + j, val, style_dict[fmt])
+            row += len(columns[0])
@@ -8,6 +8,7 @@ from collections.abc import (
     Callable,
     Hashable,
     Iterable,
+    Iterator,
     Mapping,
     Sequence,
 )
@@ -59,7 +60,10 @@ if TYPE_CHECKING:
         WriteExcelBuffer,
     )
 
-    from pandas import ExcelWriter
+    from pandas import (
+        ExcelWriter,
+        Series,
+    )
 
 
 class ExcelCell:
@@ -541,6 +545,8 @@ class ExcelFormatter:
 
     max_rows = 2**20
     max_cols = 2**14
+    # number of body values formatted at once when writing by column
+    batch_size = 2**16
 
     def __init__(
         self,
@@ -712,13 +718,13 @@ class ExcelFormatter:
                 self.rowcounter += 1
         return itertools.chain(gen, gen2)
 
-    def _format_body(self) -> Iterable[ExcelCell]:
+    def _format_body(self, include_values: bool = True) -> Iterable[ExcelCell]:
         if isinstance(self.df.index, MultiIndex):
-            return self._format_hierarchical_rows()
+            return self._format_hierarchical_rows(include_values)
         else:
-            return self._format_regular_rows()
+            return self._format_regular_rows(include_values)
 
-    def _format_regular_rows(self) -> Iterable[ExcelCell]:
+    def _format_regular_rows(self, include_values: bool = True) -> Iterable[ExcelCell]:
         if self._has_aliases or self.header:
             self.rowcounter += 1
 
@@ -742,6 +748,9 @@ class ExcelFormatter:
             if index_label and self.header is not False:
                 yield ExcelCell(self.rowcounter - 1, 0, index_label, None)
 
+            if not include_values:
+                return
+
             # write index_values
             index_values = self.df.index
             if isinstance(self.df.index, PeriodIndex):
@@ -759,12 +768,16 @@ class ExcelFormatter:
                     css_converter=self.style_converter,
                 )
             coloffset = 1
+        elif not include_values:
+            return
         else:
             coloffset = 0
 
         yield from self._generate_body(coloffset)
 
-    def _format_hierarchical_rows(self) -> Iterable[ExcelCell]:
+    def _format_hierarchical_rows(
+        self, include_values: bool = True
+    ) -> Iterable[ExcelCell]:
         if self._has_aliases or self.header:
             self.rowcounter += 1
 
@@ -789,6 +802,9 @@ class ExcelFormatter:
                 for cidx, name in enumerate(index_labels):
                     yield ExcelCell(self.rowcounter - 1, cidx, name, None)
 
+            if not include_values:
+                return
+
             if self.merge_cells and self.merge_cells != "columns":
                 # Format hierarchical rows as merged cells.
                 level_strs = self.df.index._format_multi(
@@ -847,6 +863,9 @@ class ExcelFormatter:
                         )
                     gcolidx += 1
 
+        elif not include_values:
+            return
+
         yield from self._generate_body(gcolidx)
 
     @property
@@ -875,6 +894,92 @@ class ExcelFormatter:
             cell.val = self._format_value(cell.val)
             yield cell
 
+    @property
+    def _can_format_columns(self) -> bool:
+        """
+        Whether the body can be formatted by column instead of by cell.
+
+        Requires an unstyled frame whose index cells are not merged.
+        """
+        merge_index = bool(self.merge_cells) and self.merge_cells != "columns"
+        return self.styler is None and not (
+            self.index and isinstance(self.df.index, MultiIndex) and merge_index
+        )
+
+    def get_formatted_header_cells(self) -> list[ExcelCell]:
+        """
+        Format the header and the index labels, without the body.
+
+        Afterwards ``rowcounter`` holds the row of the first body value.
+        """
+        cells = list(itertools.chain(self._format_header(), self._format_body(False)))
+        for cell in cells:
+            cell.val = self._format_value(cell.val)
+        return cells
+
+    def get_formatted_columns(self) -> Iterator[list[list]]:
+        """
+        Format the index levels (if written) and the data columns.
+
+        Yields batches of consecutive rows of about ``batch_size`` values, each
+        given as one list of values per Excel column, starting at the leftmost
+        column of the frame.
+        """
+        columns: list[Index | Series] = []
+        if self.index:
+            index = self.df.index
+            if isinstance(index, MultiIndex):
+                levels = [index.get_level_values(i) for i in range(index.nlevels)]
+            else:
+                levels = [index]
+            for level in levels:
+                if isinstance(level, PeriodIndex):
+                    level = level.to_timestamp()
+                columns.append(level)
+        columns.extend(self.df.iloc[:, i] for i in range(len(self.columns)))
+        if not columns:
+            return
+
+        nrows = len(self.df)
+        step = max(self.batch_size // len(columns), 1)
+        for start in range(0, nrows, step):
+            yield [
+                self._format_column(
+                    values[start : start + step]
+                    if isinstance(values, Index)
+                    else values.iloc[start : start + step]
+                )
+                for values in columns
+            ]
+
+    def _format_column(self, values: Index | Series) -> list:
+        """
+        Equivalent of applying ``_format_value`` to each element of ``values``,
+        vectorized for NumPy numeric and boolean dtypes.
+        """
+        dtype = values.dtype
+        if not isinstance(dtype, np.dtype) or dtype.kind not in "iufb":
+            return [self._format_value(val) for val in values]
+
+        result = values.tolist()
+        if dtype.kind != "f":
+            return result
+
+        arr = np.asarray(values)
+        if self.float_format is not None:
+            finite = np.isfinite(arr)
+            result = [
+                float(self.float_format % val) if ok else val
+                for val, ok in zip(result, finite)
+            ]
+        for i in np.flatnonzero(np.isnan(arr)):
+            result[i] = self.na_rep
+        for i in np.flatnonzero(np.isposinf(arr)):
+            result[i] = self.inf_rep
+        for i in np.flatnonzero(np.isneginf(arr)):
+            result[i] = f"-{self.inf_rep}"
+        return result
+
     @doc(storage_options=_shared_docs["storage_options"])
     def write(
         self,
@@ -921,7 +1026,17 @@ class ExcelFormatter:
         if engine_kwargs is None:
             engine_kwargs = {}
 
-        formatted_cells = self.get_formatted_cells()
+        if self._can_format_columns:
+            # format the header and the first rows of every column before opening
+            #  the writer, such that formatting errors do not leave a workbook
+            #  without sheets behind
+            header_cells = self.get_formatted_header_cells()
+            bodyrow = self.rowcounter
+            batches = self.get_formatted_columns()
+            first = next(batches, None)
+            if first is not None:
+                batches = itertools.chain([first], batches)
+
         if isinstance(writer, ExcelWriter):
             need_save = False
         else:
@@ -934,13 +1049,24 @@ class ExcelFormatter:
             need_save = True
 
         try:
-            writer._write_cells(
-                formatted_cells,
-                sheet_name,
-                startrow=startrow,
-                startcol=startcol,
-                freeze_panes=freeze_panes,
-            )
+            if self._can_format_columns:
+                writer._write_columns(
+                    header_cells,
+                    batches,
+                    bodyrow,
+                    sheet_name,
+                    startrow=startrow,
+                    startcol=startcol,
+                    freeze_panes=freeze_panes,
+                )
+            else:
+                writer._write_cells(
+                    self.get_formatted_cells(),
+                    sheet_name,
+                    startrow=startrow,
+                    startcol=startcol,
+                    freeze_panes=freeze_panes,
+                )
         finally:
             # make sure to close opened file handles
             if need_save:
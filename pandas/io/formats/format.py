@@ -17,6 +17,7 @@ from csv import QUOTE_NONE
 from decimal import Decimal
 from functools import partial
 from io import StringIO
+from itertools import repeat
 import math
 import re
 from shutil import get_terminal_size
@@ -1382,7 +1383,7 @@ class FloatArrayFormatter(_GenericArrayFormatter):
             threshold = None
 
         # if we have a fixed_width, we'll need to try different float_format
-        def format_values_with(float_format):
+        def format_values_with(float_format, format_spec: str | None = None):
             formatter = self._value_formatter(float_format, threshold)
 
             # default formatter leaves a space to the left when formatting
@@ -1397,6 +1398,11 @@ class FloatArrayFormatter(_GenericArrayFormatter):
             # separate the wheat from the chaff
             if is_complex:
                 values = format_complex_with_na_rep(values, formatter, na_rep)
+            elif format_spec is not None and values.dtype.kind == "f":
+                # the default formats are applied in bulk
+                values = _format_floats_with_spec(
+                    values, format_spec, na_rep, threshold, self.decimal
+                )
             else:
                 values = format_with_na_rep(values, formatter, na_rep)
 
@@ -1412,19 +1418,18 @@ class FloatArrayFormatter(_GenericArrayFormatter):
         # There is a special default string when we are fixed-width
         # The default is otherwise to use str instead of a formatting string
         float_format: FloatFormatType | None
+        format_spec: str | None = None
         if self.float_format is None:
             if self.fixed_width:
-                if self.leading_space is True:
-                    fmt_str = "{value: .{digits:d}f}"
-                else:
-                    fmt_str = "{value:.{digits:d}f}"
-                float_format = partial(fmt_str.format, digits=self.digits)
+                sign = " " if self.leading_space is True else ""
+                format_spec = f"{sign}.{self.digits:d}f"
+                float_format = partial("{value:{spec}}".format, spec=format_spec)
             else:
                 float_format = self.float_format
         else:
             float_format = lambda value: self.float_format % value
 
-        formatted_values = format_values_with(float_format)
+        formatted_values = format_values_with(float_format, format_spec)
 
         if not self.fixed_width:
             return formatted_values
@@ -1447,12 +1452,10 @@ class FloatArrayFormatter(_GenericArrayFormatter):
         has_small_values = ((abs_vals < 10 ** (-self.digits)) & (abs_vals > 0)).any()
 
         if has_small_values or (too_long and has_large_values):
-            if self.leading_space is True:
-                fmt_str = "{value: .{digits:d}e}"
-            else:
-                fmt_str = "{value:.{digits:d}e}"
-            float_format = partial(fmt_str.format, digits=self.digits)
-            formatted_values = format_values_with(float_format)
+            sign = " " if self.leading_space is True else ""
+            format_spec = f"{sign}.{self.digits:d}e"
+            float_format = partial("{value:{spec}}".format, spec=format_spec)
+            formatted_values = format_values_with(float_format, format_spec)
 
         return formatted_values
 
@@ -1462,13 +1465,11 @@ class FloatArrayFormatter(_GenericArrayFormatter):
 
 class _IntArrayFormatter(_GenericArrayFormatter):
     def _format_strings(self) -> list[str]:
-        if self.leading_space is False:
-            formatter_str = lambda x: f"{x:d}".format(x=x)
-        else:
-            formatter_str = lambda x: f"{x: d}".format(x=x)
-        formatter = self.formatter or formatter_str
-        fmt_values = [formatter(x) for x in self.values]
-        return fmt_values
+        if self.formatter is not None:
+            return [self.formatter(x) for x in self.values]
+
+        format_spec = "d" if self.leading_space is False else " d"
+        return list(map(format, self.values.tolist(), repeat(format_spec)))
 
 
 class _Datetime64Formatter(_GenericArrayFormatter):
@@ -1778,6 +1779,32 @@ def _trim_zeros_complex(str_complexes: ArrayLike, decimal: str = ".") -> list[st
     return padded
 
 
+def _format_floats_with_spec(
+    values: np.ndarray,
+    format_spec: str,
+    na_rep: str,
+    threshold: float | None = None,
+    decimal: str = ".",
+) -> np.ndarray:
+    """
+    Format an array of floats with a format spec in bulk.
+
+    Equivalent to applying ``FloatArrayFormatter._value_formatter`` to each
+    value, without the per-value function calls and missing value checks.
+    """
+    mask = isna(values).ravel()
+    if threshold is not None:
+        values = np.where(np.abs(values) > threshold, values, 0.0)
+
+    formatted = list(map(format, values.ravel().tolist(), repeat(format_spec)))
+    if decimal != ".":
+        formatted = [x.replace(".", decimal, 1) for x in formatted]
+
+    result = np.array(formatted, dtype=object)
+    result[mask] = na_rep
+    return result.reshape(values.shape)
+
+
 def _trim_zeros_single_float(str_float: str) -> str:
     """
     Trims trailing zeros after a decimal point,
@@ -1798,31 +1825,24 @@ def _trim_zeros_float(
     all numbers containing decimals, leaving just one if
     necessary.
     """
-    trimmed = str_floats
     number_regex = re.compile(rf"^\s*[\+-]?[0-9]+\{decimal}[0-9]*$")
+    is_number = [number_regex.match(x) is not None for x in str_floats]
 
-    def is_number_with_decimal(x) -> bool:
-        return re.match(number_regex, x) is not None
-
-    def should_trim(values: ArrayLike | list[str]) -> bool:
-        """
-        Determine if an array of strings should be trimmed.
-
-        Returns True if all numbers containing decimals (defined by the
-        above regular expression) within the array end in a zero, otherwise
-        returns False.
-        """
-        numbers = [x for x in values if is_number_with_decimal(x)]
-        return len(numbers) > 0 and all(x.endswith("0") for x in numbers)
-
-    while should_trim(trimmed):
-        trimmed = [x[:-1] if is_number_with_decimal(x) else x for x in trimmed]
-
-    # leave one 0 after the decimal points if need be.
-    result = [
-        x + "0" if is_number_with_decimal(x) and x.endswith(decimal) else x
-        for x in trimmed
-    ]
+    # trailing zeros can be trimmed while all numbers containing decimals
+    # (defined by the above regular expression) end in a zero
+    n_trim = min(
+        (len(x) - len(x.rstrip("0")) for x, num in zip(str_floats, is_number) if num),
+        default=0,
+    )
+    result = []
+    for x, num in zip(str_floats, is_number):
+        if num:
+            if n_trim:
+                x = x[:-n_trim]
+            # leave one 0 after the decimal points if need be.
+            if x.endswith(decimal):
+                x += "0"
+        result.append(x)
     return result
 
 
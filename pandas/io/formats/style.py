@@ -4,6 +4,7 @@ Module for applying conditional formatting to DataFrames and Series.
 
 from __future__ import annotations
 
+from collections import defaultdict
 import copy
 from functools import partial
 import operator
@@ -28,6 +29,8 @@ from pandas import (
     IndexSlice,
     RangeIndex,
 )
+from pandas.core.dtypes.common import is_integer
+
 import pandas.core.common as com
 from pandas.core.frame import (
     DataFrame,
@@ -1354,6 +1357,8 @@ class Styler(StylerRenderer):
         caption: str | None = ...,
         max_rows: int | None = ...,
         max_columns: int | None = ...,
+        start_row: int | None = ...,
+        start_column: int | None = ...,
         encoding: str | None = ...,
         doctype_html: bool = ...,
         exclude_styles: bool = ...,
@@ -1373,6 +1378,8 @@ class Styler(StylerRenderer):
         caption: str | None = ...,
         max_rows: int | None = ...,
         max_columns: int | None = ...,
+        start_row: int | None = ...,
+        start_column: int | None = ...,
         encoding: str | None = ...,
         doctype_html: bool = ...,
         exclude_styles: bool = ...,
@@ -1392,6 +1399,8 @@ class Styler(StylerRenderer):
         caption: str | None = None,
         max_rows: int | None = None,
         max_columns: int | None = None,
+        start_row: int | None = None,
+        start_column: int | None = None,
         encoding: str | None = None,
         doctype_html: bool = False,
         exclude_styles: bool = False,
@@ -1451,6 +1460,19 @@ class Styler(StylerRenderer):
             which is 262144 (18 bit browser rendering).
 
             .. versionadded:: 1.4.0
+        start_row : int, optional
+            Position of the first row to render. If ``start_row`` or ``start_column``
+            is given, only the viewport of ``max_rows`` rows and ``max_columns``
+            columns starting at these positions is translated and rendered, which is
+            much faster for large tables. Hierarchical labels are sparsified within
+            the viewport and the element ids and classes keep their positions in the
+            whole table. Defaults to the first row.
+
+            .. versionadded:: 3.0.0
+        start_column : int, optional
+            Position of the first column to render. Defaults to the first column.
+
+            .. versionadded:: 3.0.0
         %(encoding)s
         doctype_html : bool, default False
             Whether to output a fully structured HTML file including all
@@ -1473,6 +1495,12 @@ class Styler(StylerRenderer):
         --------
         DataFrame.to_html: Write a DataFrame to a file, buffer or string in HTML format.
 
+        Notes
+        -----
+        Styles are computed once and kept on the ``Styler``, so that repeated
+        renders, for example of consecutive viewports, only execute the styling
+        functions added since the previous render.
+
         Examples
         --------
         >>> df = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
@@ -1488,7 +1516,14 @@ class Styler(StylerRenderer):
             </tr>
         ...
         """
-        obj = self._copy(deepcopy=True)  # manipulate table_styles on obj, not self
+        for name, start in [("start_row", start_row), ("start_column", start_column)]:
+            if start is not None and (not is_integer(start) or start < 0):
+                raise ValueError(f"`{name}` must be a non-negative integer.")
+
+        self._compute()  # keep computed styles on self for subsequent renders
+        # manipulate table_styles on obj, not self. The html translation only reads
+        #  ctx, but the styles of concatenated stylers are added to the ctx of obj
+        obj = self._copy(deepcopy=True, copy_ctx=bool(self.concatenated))
 
         if table_uuid:
             obj.set_uuid(table_uuid)
@@ -1515,6 +1550,8 @@ class Styler(StylerRenderer):
             sparse_columns=sparse_columns,
             max_rows=max_rows,
             max_cols=max_columns,
+            start_row=start_row,
+            start_col=start_column,
             exclude_styles=exclude_styles,
             encoding=encoding or get_option("styler.render.encoding"),
             doctype_html=doctype_html,
@@ -1765,7 +1802,7 @@ class Styler(StylerRenderer):
                 else:
                     self.ctx_columns[(j, i)].extend(css_list)
 
-    def _copy(self, deepcopy: bool = False) -> Styler:
+    def _copy(self, deepcopy: bool = False, copy_ctx: bool = True) -> Styler:
         """
         Copies a Styler, allowing for deepcopy or shallow copy
 
@@ -1788,6 +1825,8 @@ class Styler(StylerRenderer):
           - table_styles
           - applied styles (_todo)
 
+        With ``copy_ctx=False`` a deep copy shares the computed styles (ctx) with
+        the original, for rendering copies which only read them.
         """
         # GH 40675, 52728
         styler = type(self)(
@@ -1818,9 +1857,6 @@ class Styler(StylerRenderer):
             "_display_funcs_column_names",
             "hidden_rows",
             "hidden_columns",
-            "ctx",
-            "ctx_index",
-            "ctx_columns",
             "cell_context",
             "_todo",
             "table_styles",
@@ -1834,6 +1870,18 @@ class Styler(StylerRenderer):
             val = getattr(self, attr)
             setattr(styler, attr, copy.deepcopy(val) if deepcopy else val)
 
+        for attr in ["ctx", "ctx_index", "ctx_columns"]:
+            val = getattr(self, attr)
+            if deepcopy and copy_ctx:  # lists of immutable css tuples
+                val = defaultdict(list, {k: list(v) for k, v in val.items()})
+            setattr(styler, attr, val)
+
+        if deepcopy:
+            # the computed styles are copied so need not be computed again, whereas
+            # a shallow copy shares them and must recompute if styles are added
+            styler._todo_computed = self._todo_computed
+            styler._data_computed = self._data_computed
+
         return styler
 
     def __copy__(self) -> Styler:
@@ -133,6 +133,8 @@ class StylerRenderer:
         self.ctx_columns: DefaultDict[tuple[int, int], CSSList] = defaultdict(list)
         self.cell_context: DefaultDict[tuple[int, int], str] = defaultdict(str)
         self._todo: list[tuple[Callable, tuple, dict]] = []
+        self._todo_computed: int = 0  # number of ``_todo`` entries applied to ctx
+        self._data_computed: tuple | None = None  # snapshot of the data styled in ctx
         self.tooltips: Tooltips | None = None
         precision = (
             get_option("styler.format.precision") if precision is None else precision
@@ -160,6 +162,8 @@ class StylerRenderer:
         max_rows: int | None = None,
         max_cols: int | None = None,
         blank: str = "",
+        start_row: int | None = None,
+        start_col: int | None = None,
     ):
         """
         Computes and applies styles and then generates the general render dicts.
@@ -182,7 +186,12 @@ class StylerRenderer:
                 "foot": f"{foot}_foot",
             }
             dx = concatenated._render(
-                sparse_index, sparse_columns, max_rows, max_cols, blank
+                sparse_index,
+                sparse_columns,
+                max_rows,
+                max_cols,
+                blank,
+                start_col=start_col,
             )
             dxs.append(dx)
 
@@ -194,7 +203,14 @@ class StylerRenderer:
             ctx_len += len(concatenated.index)
 
         d = self._translate(
-            sparse_index, sparse_columns, max_rows, max_cols, blank, dxs
+            sparse_index,
+            sparse_columns,
+            max_rows,
+            max_cols,
+            blank,
+            dxs,
+            start_row=start_row,
+            start_col=start_col,
         )
         return d
 
@@ -204,13 +220,23 @@ class StylerRenderer:
         sparse_columns: bool,
         max_rows: int | None = None,
         max_cols: int | None = None,
+        start_row: int | None = None,
+        start_col: int | None = None,
         **kwargs,
     ) -> str:
         """
         Renders the ``Styler`` including all applied styles to HTML.
         Generates a dict with necessary kwargs passed to jinja2 template.
         """
-        d = self._render(sparse_index, sparse_columns, max_rows, max_cols, "&nbsp;")
+        d = self._render(
+            sparse_index,
+            sparse_columns,
+            max_rows,
+            max_cols,
+            "&nbsp;",
+            start_row=start_row,
+            start_col=start_col,
+        )
         d.update(kwargs)
         return self.template_html.render(
             **d,
@@ -271,15 +297,48 @@ class StylerRenderer:
         .apply or .map. The append styles to apply as tuples of
 
         (application method, *args, **kwargs)
+
+        Computed styles are kept between renders: only the style functions added
+        since the last call are executed, unless ``self.data`` has changed.
         """
-        self.ctx.clear()
-        self.ctx_index.clear()
-        self.ctx_columns.clear()
+        if self._todo_computed > len(self._todo) or self._data_changed():
+            self._todo_computed = 0
+        if self._todo_computed == 0:
+            self.ctx.clear()
+            self.ctx_index.clear()
+            self.ctx_columns.clear()
         r = self
-        for func, args, kwargs in self._todo:
+        for func, args, kwargs in self._todo[self._todo_computed :]:
             r = func(self)(*args, **kwargs)
+        self._todo_computed = len(self._todo)
+        data = self.data
+        # the shallow copy references the arrays of data, so that changing data in
+        #  place copies the changed blocks under Copy-on-Write
+        self._data_computed = (data, data.index, data.columns, data.copy(deep=False))
         return r
 
+    def _data_changed(self) -> bool:
+        """
+        Whether ``self.data`` was replaced or changed since styles were computed.
+
+        Only compares the identity of the labels and the arrays of the blocks, so
+        the cost does not depend on the number of cells.
+        """
+        if self._data_computed is None:
+            return True
+        data, index, columns, snapshot = self._data_computed
+        if (
+            self.data is not data
+            or data.index is not index
+            or data.columns is not columns
+        ):
+            return True
+        blocks, computed = data._mgr.blocks, snapshot._mgr.blocks
+        return len(blocks) != len(computed) or any(
+            blk.values is not old.values or blk.mgr_locs is not old.mgr_locs
+            for blk, old in zip(blocks, computed)
+        )
+
     def _translate(
         self,
         sparse_index: bool,
@@ -288,6 +347,8 @@ class StylerRenderer:
         max_cols: int | None = None,
         blank: str = "&nbsp;",
         dxs: list[dict] | None = None,
+        start_row: int | None = None,
+        start_col: int | None = None,
     ):
         """
         Process Styler data and settings into a dict for template rendering.
@@ -309,6 +370,9 @@ class StylerRenderer:
             Entry to top-left blank cells.
         dxs : list[dict]
             The render dicts of the concatenated Stylers.
+        start_row, start_col : int, optional
+            Positions of the first row and column of a viewport to render. If given,
+            only the elements of the viewport are translated.
 
         Returns
         -------
@@ -331,8 +395,8 @@ class StylerRenderer:
         max_rows = max_rows if max_rows else get_option("styler.render.max_rows")
         max_cols = max_cols if max_cols else get_option("styler.render.max_columns")
         max_rows, max_cols = _get_trimming_maximums(
-            len(self.data.index),
-            len(self.data.columns),
+            max(len(self.data.index) - (start_row or 0), 0),
+            max(len(self.data.columns) - (start_col or 0), 0),
             max_elements,
             max_rows,
             max_cols,
@@ -341,12 +405,12 @@ class StylerRenderer:
         self.cellstyle_map_columns: DefaultDict[tuple[CSSPair, ...], list[str]] = (
             defaultdict(list)
         )
-        head = self._translate_header(sparse_cols, max_cols)
+        head = self._translate_header(sparse_cols, max_cols, start_col)
         d.update({"head": head})
 
         # for sparsifying a MultiIndex and for use with latex clines
         idx_lengths = _get_level_lengths(
-            self.index, sparse_index, max_rows, self.hidden_rows
+            self.index, sparse_index, max_rows, self.hidden_rows, start=start_row
         )
         d.update({"index_lengths": idx_lengths})
 
@@ -356,7 +420,9 @@ class StylerRenderer:
         self.cellstyle_map_index: DefaultDict[tuple[CSSPair, ...], list[str]] = (
             defaultdict(list)
         )
-        body: list = self._translate_body(idx_lengths, max_rows, max_cols)
+        body: list = self._translate_body(
+            idx_lengths, max_rows, max_cols, start_row, start_col
+        )
         d.update({"body": body})
 
         ctx_maps = {
@@ -390,11 +456,20 @@ class StylerRenderer:
         d.update({"table_attributes": table_attr})
 
         if self.tooltips:
+            if self.tooltips.as_title_attribute and not (
+                start_row is None and start_col is None
+            ):
+                raise NotImplementedError(
+                    "Tooltips as title attributes are not supported when rendering "
+                    "a viewport."
+                )
             d = self.tooltips._translate(self, d)
 
         return d
 
-    def _translate_header(self, sparsify_cols: bool, max_cols: int):
+    def _translate_header(
+        self, sparsify_cols: bool, max_cols: int, start_col: int | None = None
+    ):
         """
         Build each <tr> within table <head> as a list
 
@@ -413,6 +488,8 @@ class StylerRenderer:
             Whether column_headers section will add colspan attributes (>1) to elements.
         max_cols : int
             Maximum number of columns to render. If exceeded will contain `...` filler.
+        start_col : int, optional
+            Position of the first column of a viewport to render.
 
         Returns
         -------
@@ -421,10 +498,16 @@ class StylerRenderer:
         """
         # for sparsifying a MultiIndex
         col_lengths = _get_level_lengths(
-            self.columns, sparsify_cols, max_cols, self.hidden_columns
+            self.columns, sparsify_cols, max_cols, self.hidden_columns, start=start_col
         )
 
-        clabels = self.data.columns.tolist()
+        columns = self.data.columns
+        col_start = start_col or 0
+        if start_col is not None:
+            columns = columns[
+                col_start : col_start + max_cols + len(self.hidden_columns) + 1
+            ]
+        clabels = columns.tolist()
         if self.data.columns.nlevels == 1:
             clabels = [[x] for x in clabels]
         clabels = list(zip(*clabels))
@@ -436,7 +519,7 @@ class StylerRenderer:
                 continue
 
             header_row = self._generate_col_header_row(
-                (r, clabels), max_cols, col_lengths
+                (r, clabels), max_cols, col_lengths, col_start
             )
             head.append(header_row)
 
@@ -448,14 +531,14 @@ class StylerRenderer:
             and not self.hide_index_names
         ):
             index_names_row = self._generate_index_names_row(
-                clabels, max_cols, col_lengths
+                clabels, max_cols, col_lengths, col_start
             )
             head.append(index_names_row)
 
         return head
 
     def _generate_col_header_row(
-        self, iter: Sequence, max_cols: int, col_lengths: dict
+        self, iter: Sequence, max_cols: int, col_lengths: dict, col_start: int = 0
     ):
         """
         Generate the row containing column headers:
@@ -472,6 +555,8 @@ class StylerRenderer:
             Permissible number of columns
         col_lengths :
             c
+        col_start : int
+            Position of the first column in ``clabels``.
 
         Returns
         -------
@@ -508,7 +593,7 @@ class StylerRenderer:
 
         column_headers: list = []
         visible_col_count: int = 0
-        for c, value in enumerate(clabels[r]):
+        for c, value in enumerate(clabels[r], start=col_start):
             header_element_visible = _is_visible(c, r, col_lengths)
             if header_element_visible:
                 visible_col_count += col_lengths.get((r, c), 0)
@@ -555,7 +640,7 @@ class StylerRenderer:
         return index_blanks + column_name + column_headers
 
     def _generate_index_names_row(
-        self, iter: Sequence, max_cols: int, col_lengths: dict
+        self, iter: Sequence, max_cols: int, col_lengths: dict, col_start: int = 0
     ):
         """
         Generate the row containing index names
@@ -570,6 +655,8 @@ class StylerRenderer:
             Looping variables from outer scope
         max_cols : int
             Permissible number of columns
+        col_start : int
+            Position of the first column in ``iter``.
 
         Returns
         -------
@@ -595,7 +682,7 @@ class StylerRenderer:
         visible_col_count: int = 0
         if clabels:
             last_level = self.columns.nlevels - 1  # use last level since never sparsed
-            for c, value in enumerate(clabels[last_level]):
+            for c, value in enumerate(clabels[last_level], start=col_start):
                 header_element_visible = _is_visible(c, last_level, col_lengths)
                 if header_element_visible:
                     visible_col_count += 1
@@ -620,7 +707,14 @@ class StylerRenderer:
 
         return index_names + column_blanks
 
-    def _translate_body(self, idx_lengths: dict, max_rows: int, max_cols: int):
+    def _translate_body(
+        self,
+        idx_lengths: dict,
+        max_rows: int,
+        max_cols: int,
+        start_row: int | None = None,
+        start_col: int | None = None,
+    ):
         """
         Build each <tr> within table <body> as a list
 
@@ -636,20 +730,33 @@ class StylerRenderer:
         ----------
         sparsify_index : bool
             Whether index_headers section will add rowspan attributes (>1) to elements.
+        start_row, start_col : int, optional
+            Positions of the first row and column of a viewport to render.
 
         Returns
         -------
         body : list
             The associated HTML elements needed for template rendering.
         """
-        rlabels = self.data.index.tolist()
-        if not isinstance(self.data.index, MultiIndex):
+        data = self.data
+        row_start, col_start = start_row or 0, start_col or 0
+        if start_row is not None or start_col is not None:
+            # only the viewport, allowing for hidden elements and trimming indicators
+            data = data.iloc[
+                row_start : row_start + max_rows + len(self.hidden_rows) + 1,
+                col_start : col_start + max_cols + len(self.hidden_columns) + 1,
+            ]
+
+        rlabels = data.index.tolist()
+        if not isinstance(data.index, MultiIndex):
             rlabels = [[x] for x in rlabels]
 
         body: list = []
         visible_row_count: int = 0
         for r, row_tup in [
-            z for z in enumerate(self.data.itertuples()) if z[0] not in self.hidden_rows
+            z
+            for z in enumerate(data.itertuples(), start=row_start)
+            if z[0] not in self.hidden_rows
         ]:
             visible_row_count += 1
             if self._check_trim(
@@ -657,11 +764,12 @@ class StylerRenderer:
                 max_rows,
                 body,
                 "row",
+                col_start=col_start,
             ):
                 break
 
             body_row = self._generate_body_row(
-                (r, row_tup, rlabels), max_cols, idx_lengths
+                (r, row_tup, rlabels[r - row_start]), max_cols, idx_lengths, col_start
             )
             body.append(body_row)
         return body
@@ -674,6 +782,7 @@ class StylerRenderer:
         element: str,
         css: str | None = None,
         value: str = "...",
+        col_start: int = 0,
     ) -> bool:
         """
         Indicates whether to break render loops and append a trimming indicator
@@ -692,6 +801,8 @@ class StylerRenderer:
             The css to add to the trimming indicator element.
         value : str, optional
             The value of the elements display if necessary.
+        col_start : int, optional
+            Position of the first rendered column, used by a trimming row.
 
         Returns
         -------
@@ -700,13 +811,13 @@ class StylerRenderer:
         """
         if count > max:
             if element == "row":
-                obj.append(self._generate_trimmed_row(max))
+                obj.append(self._generate_trimmed_row(max, col_start))
             else:
                 obj.append(_element(element, css, value, True, attributes=""))
             return True
         return False
 
-    def _generate_trimmed_row(self, max_cols: int) -> list:
+    def _generate_trimmed_row(self, max_cols: int, col_start: int = 0) -> list:
         """
         When a render has too many rows we generate a trimming row containing "..."
 
@@ -714,6 +825,8 @@ class StylerRenderer:
         ----------
         max_cols : int
             Number of permissible columns
+        col_start : int
+            Position of the first rendered column.
 
         Returns
         -------
@@ -735,7 +848,7 @@ class StylerRenderer:
 
         data: list = []
         visible_col_count: int = 0
-        for c, _ in enumerate(self.columns):
+        for c in range(col_start, len(self.columns)):
             data_element_visible = c not in self.hidden_columns
             if data_element_visible:
                 visible_col_count += 1
@@ -765,6 +878,7 @@ class StylerRenderer:
         iter: tuple,
         max_cols: int,
         idx_lengths: dict,
+        col_start: int = 0,
     ):
         """
         Generate a regular row for the body section of appropriate format.
@@ -781,6 +895,8 @@ class StylerRenderer:
             Number of permissible columns.
         idx_lengths : dict
             A map of the sparsification structure of the index
+        col_start : int
+            Position of the first column in the row data tuple.
 
         Returns
         -------
@@ -789,7 +905,7 @@ class StylerRenderer:
         r, row_tup, rlabels = iter
 
         index_headers = []
-        for c, value in enumerate(rlabels[r]):
+        for c, value in enumerate(rlabels):
             header_element_visible = (
                 _is_visible(r, c, idx_lengths) and not self.hide_index_[c]
             )
@@ -828,7 +944,7 @@ class StylerRenderer:
 
         data: list = []
         visible_col_count: int = 0
-        for c, value in enumerate(row_tup[1:]):
+        for c, value in enumerate(row_tup[1:], start=col_start):
             data_element_visible = (
                 c not in self.hidden_columns and r not in self.hidden_rows
             )
@@ -1801,6 +1917,7 @@ def _get_level_lengths(
     sparsify: bool,
     max_index: int,
     hidden_elements: Sequence[int] | None = None,
+    start: int | None = None,
 ):
     """
     Given an index, find the level length for each element.
@@ -1816,20 +1933,34 @@ def _get_level_lengths(
     hidden_elements : sequence of int
         Index positions of elements hidden from display in the index affecting
         length
+    start : int, optional
+        Position of the first element of a viewport. If given, only the elements
+        which can be displayed from this position are analysed and sections are
+        restarted at ``start``.
 
     Returns
     -------
     Dict :
         Result is a dictionary of (level, initial_position): span
     """
+    if hidden_elements is None:
+        hidden_elements = []
+
+    if start is not None:
+        stop = start + max_index + len(hidden_elements) + 1
+        lengths = _get_level_lengths(
+            index[start:stop],
+            sparsify,
+            max_index,
+            [i - start for i in hidden_elements if start <= i < stop],
+        )
+        return {(i, j + start): length for (i, j), length in lengths.items()}
+
     if isinstance(index, MultiIndex):
         levels = index._format_multi(sparsify=lib.no_default, include_names=False)
     else:
         levels = index._format_flat(include_name=False)
 
-    if hidden_elements is None:
-        hidden_elements = []
-
     lengths = {}
     if not isinstance(index, MultiIndex):
         for i, value in enumerate(levels):
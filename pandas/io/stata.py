@@ -12,18 +12,23 @@ https://www.statsmodels.org/devel/
 
 from __future__ import annotations
 
-from collections import abc
+from collections import (
+    abc,
+    deque,
+)
 from datetime import (
     datetime,
     timedelta,
 )
 from io import BytesIO
+import mmap
 import os
 import struct
 import sys
 from typing import (
     IO,
     TYPE_CHECKING,
+    Any,
     AnyStr,
     Final,
     cast,
@@ -63,13 +68,21 @@ from pandas import (
     isna,
     to_datetime,
 )
+from pandas.core.algorithms import factorize
 from pandas.core.frame import DataFrame
 from pandas.core.indexes.base import Index
 from pandas.core.indexes.range import RangeIndex
 from pandas.core.series import Series
 from pandas.core.shared_docs import _shared_docs
+from pandas.core.util.parallel import (
+    get_num_threads,
+    thread_map,
+)
 
-from pandas.io.common import get_handle
+from pandas.io.common import (
+    _IOWrapper,
+    get_handle,
+)
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -129,6 +142,15 @@ _iterator_params = """\
 iterator : bool, default False
     Return StataReader object."""
 
+_memory_map_params = """\
+memory_map : bool, default False
+    If a filepath is provided for ``filepath_or_buffer``, map the file object
+    directly onto memory and view the data records from there instead of
+    reading them into an intermediate buffer. When iterating over chunks,
+    up to ``compute.num_threads`` chunks are then converted concurrently.
+
+    .. versionadded:: 3.0.0"""
+
 _reader_notes = """\
 Notes
 -----
@@ -158,6 +180,7 @@ filepath_or_buffer : str, path object or file-like object
 {_iterator_params}
 {_shared_docs["decompression_options"] % "filepath_or_buffer"}
 {_shared_docs["storage_options"]}
+{_memory_map_params}
 
 Returns
 -------
@@ -224,6 +247,7 @@ path_or_buf : path (string), buffer or path object
 {_chunksize_params}
 {_shared_docs["decompression_options"]}
 {_shared_docs["storage_options"]}
+{_memory_map_params}
 
 {_reader_notes}
 """
@@ -1106,6 +1130,7 @@ class StataReader(StataParser, abc.Iterator):
         chunksize: int | None = None,
         compression: CompressionOptions = "infer",
         storage_options: StorageOptions | None = None,
+        memory_map: bool = False,
     ) -> None:
         super().__init__()
 
@@ -1121,6 +1146,7 @@ class StataReader(StataParser, abc.Iterator):
         self._original_path_or_buf = path_or_buf
         self._compression = compression
         self._storage_options = storage_options
+        self._memory_map = memory_map
         self._encoding = ""
         self._chunksize = chunksize
         self._using_iterator = False
@@ -1132,11 +1158,14 @@ class StataReader(StataParser, abc.Iterator):
 
         # State variables for the file
         self._close_file: Callable[[], None] | None = None
+        self._mmap: mmap.mmap | None = None
         self._column_selector_set = False
         self._value_label_dict: dict[str, dict[int, str]] = {}
         self._value_labels_read = False
+        self._strls_read = False
         self._dtype: np.dtype | None = None
         self._lines_read = 0
+        self._converted_chunks: deque[DataFrame] = deque()
 
         self._native_byteorder = _set_endianness(sys.byteorder)
 
@@ -1164,11 +1193,16 @@ class StataReader(StataParser, abc.Iterator):
             storage_options=self._storage_options,
             is_text=False,
             compression=self._compression,
+            memory_map=self._memory_map,
         )
         if hasattr(handles.handle, "seekable") and handles.handle.seekable():
             # If the handle is directly seekable, use it without an extra copy.
             self._path_or_buf = handles.handle
             self._close_file = handles.close
+            if isinstance(handles.handle, _IOWrapper) and isinstance(
+                handles.handle.buffer, mmap.mmap
+            ):
+                self._mmap = handles.handle.buffer
         else:
             # Copy to memory, and ensure no encoding.
             with handles:
@@ -1532,6 +1566,17 @@ the string values returned are correct."""
             )
             return s.decode("latin-1")
 
+    def _decode_column(self, values: np.ndarray) -> np.ndarray:
+        """
+        Decode an array of fixed width byte strings.
+
+        Stata string variables typically contain few distinct values, so
+        each distinct value is decoded once and the result is broadcast.
+        """
+        codes, uniques = factorize(values)
+        decoded = np.array([self._decode(val) for val in uniques], dtype=object)
+        return decoded.take(codes)
+
     def _read_new_value_labels(self) -> None:
         """Reads value labels with variable length strings (108 and later format)"""
         if self._format_version >= 117:
@@ -1645,10 +1690,33 @@ the string values returned are correct."""
                 decoded_va = str(va)
                 # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
             self.GSO[str(v_o)] = decoded_va
+        self._strls_read = True
 
     def __next__(self) -> DataFrame:
         self._using_iterator = True
-        return self.read(nrows=self._chunksize)
+        self._ensure_open()
+        num_threads = get_num_threads()
+        if self._mmap is None or num_threads <= 1:
+            return self.read(nrows=self._chunksize)
+
+        # Records viewed in the mapped file are converted independently, so
+        # convert the next few chunks concurrently and hand them out in order.
+        if not self._converted_chunks:
+            options = self._resolve_read_options()
+            records = []
+            while len(records) < num_threads:
+                try:
+                    records.append(self._read_records(self._chunksize, options))
+                except StopIteration:
+                    break
+            self._converted_chunks.extend(
+                thread_map(
+                    lambda record: self._convert_records(*record, **options), records
+                )
+            )
+        if not self._converted_chunks:
+            raise StopIteration
+        return self._converted_chunks.popleft()
 
     def get_chunk(self, size: int | None = None) -> DataFrame:
         """
@@ -1681,21 +1749,15 @@ the string values returned are correct."""
     ) -> DataFrame:
         self._ensure_open()
 
-        # Handle options
-        if convert_dates is None:
-            convert_dates = self._convert_dates
-        if convert_categoricals is None:
-            convert_categoricals = self._convert_categoricals
-        if convert_missing is None:
-            convert_missing = self._convert_missing
-        if preserve_dtypes is None:
-            preserve_dtypes = self._preserve_dtypes
-        if columns is None:
-            columns = self._columns
-        if order_categoricals is None:
-            order_categoricals = self._order_categoricals
-        if index_col is None:
-            index_col = self._index_col
+        options = self._resolve_read_options(
+            convert_dates=convert_dates,
+            convert_categoricals=convert_categoricals,
+            index_col=index_col,
+            convert_missing=convert_missing,
+            preserve_dtypes=preserve_dtypes,
+            columns=columns,
+            order_categoricals=order_categoricals,
+        )
         if nrows is None:
             nrows = self._nobs
 
@@ -1710,11 +1772,39 @@ the string values returned are correct."""
                 if isinstance(dt, np.dtype):
                     if dt.char != "S":
                         data[col] = data[col].astype(dt)
-            if columns is not None:
-                data = self._do_select_columns(data, columns)
+            if options["columns"] is not None:
+                data = self._do_select_columns(data, options["columns"])
             return data
 
-        if (self._format_version >= 117) and (not self._value_labels_read):
+        raw_data, start = self._read_records(nrows, options)
+        return self._convert_records(raw_data, start, **options)
+
+    def _resolve_read_options(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Fill the options of ``read`` that are None with those of the reader.
+        """
+        options = {
+            "convert_dates": self._convert_dates,
+            "convert_categoricals": self._convert_categoricals,
+            "index_col": self._index_col,
+            "convert_missing": self._convert_missing,
+            "preserve_dtypes": self._preserve_dtypes,
+            "columns": self._columns,
+            "order_categoricals": self._order_categoricals,
+        }
+        options.update((key, val) for key, val in kwargs.items() if val is not None)
+        return options
+
+    def _read_records(
+        self, nrows: int, options: dict[str, Any]
+    ) -> tuple[np.ndarray, int]:
+        """
+        Read the next ``nrows`` records and everything needed to convert them.
+
+        Returns the structured array of the records, which views the mapped
+        file if memory mapping is used, and the number of the first record.
+        """
+        if (self._format_version >= 117) and (not self._strls_read):
             self._read_strls()
 
         # Read data
@@ -1726,46 +1816,78 @@ the string values returned are correct."""
         if read_len <= 0:
             # Iterator has finished, should never be here unless
             # we are reading the file incrementally
-            if convert_categoricals:
+            if options["convert_categoricals"]:
                 self._read_value_labels()
             raise StopIteration
         offset = self._lines_read * dtype.itemsize
-        self._path_or_buf.seek(self._data_location + offset)
         read_lines = min(nrows, self._nobs - self._lines_read)
-        raw_data = np.frombuffer(
-            self._path_or_buf.read(read_len), dtype=dtype, count=read_lines
-        )
+        if self._mmap is not None:
+            # View the records directly in the mapped file
+            raw_data = np.frombuffer(
+                self._mmap,
+                dtype=dtype,
+                count=read_lines,
+                offset=self._data_location + offset,
+            )
+        else:
+            self._path_or_buf.seek(self._data_location + offset)
+            raw_data = np.frombuffer(
+                self._path_or_buf.read(read_len), dtype=dtype, count=read_lines
+            )
 
+        start = self._lines_read
         self._lines_read += read_lines
 
-        # if necessary, swap the byte order to native here
-        if self._byteorder != self._native_byteorder:
-            raw_data = raw_data.byteswap().view(raw_data.dtype.newbyteorder())
-
-        if convert_categoricals:
+        if options["convert_categoricals"]:
             self._read_value_labels()
 
-        if len(raw_data) == 0:
-            data = DataFrame(columns=self._varlist)
-        else:
-            data = DataFrame.from_records(raw_data)
-            data.columns = Index(self._varlist)
+        if options["columns"] is not None:
+            # validate the selection and subset the variable information
+            self._do_select_columns(
+                DataFrame(columns=self._varlist), options["columns"]
+            )
+
+        return raw_data, start
+
+    def _convert_records(
+        self,
+        raw_data: np.ndarray,
+        start: int,
+        convert_dates: bool,
+        convert_categoricals: bool,
+        index_col: str | None,
+        convert_missing: bool,
+        preserve_dtypes: bool,
+        columns: Sequence[str] | None,
+        order_categoricals: bool,
+    ) -> DataFrame:
+        """
+        Convert records read by ``_read_records`` into a DataFrame.
+
+        Only the fields of the selected columns are copied out of
+        ``raw_data``, swapping their byte order to native where needed, and
+        string fields are decoded straight from ``raw_data``.
+        """
+        if columns is None:
+            columns = self._varlist
+        field_names = raw_data.dtype.names
+        assert field_names is not None
+        arrays = {}
+        for col, typ in zip(columns, self._typlist):
+            values = raw_data[field_names[self._varlist.index(col)]]
+            if isinstance(typ, int):
+                arrays[col] = self._decode_column(values)
+            else:
+                arrays[col] = values.astype(values.dtype.newbyteorder("="))
+        data = DataFrame(arrays, columns=Index(columns), copy=False)
 
         # If index is not specified, use actual row number rather than
         # restarting at 0 for each chunk.
         if index_col is None:
             data.index = RangeIndex(
-                self._lines_read - read_lines, self._lines_read
+                start, start + len(raw_data)
             )  # set attr instead of set_index to avoid copy
 
-        if columns is not None:
-            data = self._do_select_columns(data, columns)
-
-        # Decode strings
-        for col, typ in zip(data, self._typlist):
-            if isinstance(typ, int):
-                data[col] = data[col].apply(self._decode)
-
         data = self._insert_strls(data)
 
         # Convert columns (if needed) to match input type
@@ -1883,8 +2005,11 @@ the string values returned are correct."""
         for i, typ in enumerate(self._typlist):
             if typ != "Q":
                 continue
+            # Look up each distinct (v, o) key once
+            codes, uniques = factorize(data.iloc[:, i].to_numpy())
             # Wrap v_o in a string to allow uint64 values as keys on 32bit OS
-            data.isetitem(i, [self.GSO[str(k)] for k in data.iloc[:, i]])
+            strls = np.array([self.GSO[str(k)] for k in uniques], dtype=object)
+            data.isetitem(i, strls.take(codes))
         return data
 
     def _do_select_columns(self, data: DataFrame, columns: Sequence[str]) -> DataFrame:
@@ -2139,6 +2264,7 @@ def read_stata(
     iterator: bool = False,
     compression: CompressionOptions = "infer",
     storage_options: StorageOptions | None = None,
+    memory_map: bool = False,
 ) -> DataFrame | StataReader:
     reader = StataReader(
         filepath_or_buffer,
@@ -2152,6 +2278,7 @@ def read_stata(
         chunksize=chunksize,
         storage_options=storage_options,
         compression=compression,
+        memory_map=memory_map,
     )
 
     if iterator or chunksize:
@@ -9,6 +9,7 @@ from os import PathLike
 from typing import (
     TYPE_CHECKING,
     Any,
+    overload,
 )
 
 from pandas._libs import lib
@@ -22,6 +23,7 @@ from pandas.util._validators import check_dtype_backend
 
 from pandas.core.dtypes.common import is_list_like
 
+from pandas.core.indexes.range import RangeIndex
 from pandas.core.shared_docs import _shared_docs
 
 from pandas.io.common import (
@@ -32,10 +34,12 @@ from pandas.io.common import (
     stringify_path,
 )
 from pandas.io.parsers import TextParser
+from pandas.io.parsers.readers import validate_integer
 
 if TYPE_CHECKING:
     from collections.abc import (
         Callable,
+        Iterator,
         Sequence,
     )
     from xml.etree.ElementTree import Element
@@ -134,6 +138,7 @@ class _XMLFrameParser:
     -----
     To subclass this class effectively you must override the following methods:`
         * :func:`parse_data`
+        * :func:`parse_data_chunks`
         * :func:`_parse_nodes`
         * :func:`_iterparse_nodes`
         * :func:`_parse_doc`
@@ -187,6 +192,18 @@ class _XMLFrameParser:
 
         raise AbstractMethodError(self)
 
+    def parse_data_chunks(
+        self, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        """
+        Parse xml data with ``iterparse`` in chunks of ``chunksize`` rows.
+
+        This method will validate names and return an iterator over lists
+        of at most ``chunksize`` row dicts.
+        """
+
+        raise AbstractMethodError(self)
+
     def _parse_nodes(self, elems: list[Any]) -> list[dict[str, str | None]]:
         """
         Parse xml nodes.
@@ -296,8 +313,86 @@ class _XMLFrameParser:
         will have optional keys filled with None values.
         """
 
+        row_node = self._validate_iterparse()
+        dicts = list(self._iterparse_rows(iterparse, row_node))
+
+        if dicts == []:
+            raise ParserError("No result from selected items in iterparse.")
+
+        keys = list(dict.fromkeys([k for d in dicts for k in d.keys()]))
+        return self._align_iterparse_rows(dicts, keys)
+
+    def _iterparse_chunks(
+        self, iterparse: Callable, row_node: str, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        """
+        Iterparse xml nodes in chunks of at most ``chunksize`` rows.
+
+        Rows are yielded as soon as a chunk is complete, so that only a single
+        chunk of rows is held in memory at a time. All chunks share the keys of
+        the first chunk, followed by any selected items not found in it.
+
+        Raises
+        ------
+        ParserError
+            * If no data is returned from selected items in ``iterparse``.
+        """
+        keys: list[str] | None = None
         dicts: list[dict[str, str | None]] = []
-        row: dict[str, str | None] | None = None
+
+        for row in self._iterparse_rows(iterparse, row_node):
+            dicts.append(row)
+            if len(dicts) == chunksize:
+                if keys is None:
+                    keys = self._iterparse_chunk_keys(dicts, row_node)
+                yield self._align_iterparse_rows(dicts, keys)
+                dicts = []
+
+        if keys is None:
+            if dicts == []:
+                raise ParserError("No result from selected items in iterparse.")
+            keys = self._iterparse_chunk_keys(dicts, row_node)
+        if dicts:
+            yield self._align_iterparse_rows(dicts, keys)
+
+    def _iterparse_chunk_keys(
+        self, dicts: list[dict[str, str | None]], row_node: str
+    ) -> list[str]:
+        """
+        Keys of the first chunk in order of appearance, followed by the
+        remaining selected items of ``iterparse``.
+        """
+        assert self.iterparse is not None
+        selected = list(self.iterparse[row_node])
+        if self.names and len(selected) != len(set(selected)):
+            # repeated items are stored under their names
+            selected = list(self.names)
+        return list(dict.fromkeys([k for d in dicts for k in d.keys()] + selected))
+
+    def _align_iterparse_rows(
+        self, dicts: list[dict[str, str | None]], keys: list[str]
+    ) -> list[dict[str, str | None]]:
+        """
+        Fill missing keys of iterparsed rows with None and apply ``names``.
+        """
+        dicts = [{k: d[k] if k in d.keys() else None for k in keys} for d in dicts]
+
+        if self.names:
+            dicts = [dict(zip(self.names, d.values())) for d in dicts]
+
+        return dicts
+
+    def _validate_iterparse(self) -> str:
+        """
+        Validate ``iterparse`` and ``path_or_buffer`` and return the row element.
+
+        Raises
+        ------
+        TypeError
+            * If ``iterparse`` is not a dict or its dict value is not list-like.
+        ParserError
+            * If ``path_or_buffer`` is not a physical file on disk or file-like object.
+        """
 
         if not isinstance(self.iterparse, dict):
             raise TypeError(
@@ -326,6 +421,24 @@ class _XMLFrameParser:
                 "local disk and not as compressed files or online sources."
             )
 
+        return row_node
+
+    def _iterparse_rows(
+        self, iterparse: Callable, row_node: str
+    ) -> Iterator[dict[str, str | None]]:
+        """
+        Yield the selected items of each ``row_node`` element as it is parsed.
+
+        Parsed elements are cleared and detached from their parents so that
+        memory use does not grow with the size of the document.
+        """
+        assert self.iterparse is not None
+
+        row: dict[str, str | None] | None = None
+        # open elements, used to detach finished elements when the parser
+        # does not provide parent access (xml.etree)
+        parents: list[Any] = []
+
         iterparse_repeats = len(self.iterparse[row_node]) != len(
             set(self.iterparse[row_node])
         )
@@ -334,6 +447,7 @@ class _XMLFrameParser:
             curr_elem = elem.tag.split("}")[1] if "}" in elem.tag else elem.tag
 
             if event == "start":
+                parents.append(elem)
                 if curr_elem == row_node:
                     row = {}
 
@@ -357,26 +471,18 @@ class _XMLFrameParser:
 
             if event == "end":
                 if curr_elem == row_node and row is not None:
-                    dicts.append(row)
+                    yield row
                     row = None
 
                 elem.clear()
+                parents.pop()
                 if hasattr(elem, "getprevious"):
                     while (
                         elem.getprevious() is not None and elem.getparent() is not None
                     ):
                         del elem.getparent()[0]
-
-        if dicts == []:
-            raise ParserError("No result from selected items in iterparse.")
-
-        keys = list(dict.fromkeys([k for d in dicts for k in d.keys()]))
-        dicts = [{k: d[k] if k in d.keys() else None for k in keys} for d in dicts]
-
-        if self.names:
-            dicts = [dict(zip(self.names, d.values())) for d in dicts]
-
-        return dicts
+                elif parents:
+                    parents[-1].remove(elem)
 
     def _validate_path(self) -> list[Any]:
         """
@@ -449,6 +555,21 @@ class _EtreeFrameParser(_XMLFrameParser):
 
         return xml_dicts
 
+    def parse_data_chunks(
+        self, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        from xml.etree.ElementTree import iterparse
+
+        if self.stylesheet is not None:
+            raise ValueError(
+                "To use stylesheet, you need lxml installed and selected as parser."
+            )
+
+        self._validate_names()
+        row_node = self._validate_iterparse()
+
+        return self._iterparse_chunks(iterparse, row_node, chunksize)
+
     def _validate_path(self) -> list[Any]:
         """
         Notes
@@ -568,6 +689,19 @@ class _LxmlFrameParser(_XMLFrameParser):
 
         return xml_dicts
 
+    def parse_data_chunks(
+        self, chunksize: int
+    ) -> Iterator[list[dict[str, str | None]]]:
+        """
+        Parse xml data with ``iterparse`` in chunks of ``chunksize`` rows.
+        """
+        from lxml.etree import iterparse
+
+        self._validate_names()
+        row_node = self._validate_iterparse()
+
+        return self._iterparse_chunks(iterparse, row_node, chunksize)
+
     def _validate_path(self) -> list[Any]:
         msg = (
             "xpath does not return any nodes or attributes. "
@@ -734,6 +868,24 @@ def _data_to_frame(data, **kwargs) -> DataFrame:
         ) from err
 
 
+def _chunks_to_frames(
+    chunks: Iterator[list[dict[str, str | None]]], **kwargs
+) -> Iterator[DataFrame]:
+    """
+    Convert chunks of parsed data to Data Frames.
+
+    Each Data Frame is indexed by the position of its rows in the
+    document, so that concatenating all chunks matches a single read.
+    """
+
+    start = 0
+    for data in chunks:
+        df = _data_to_frame(data=data, **kwargs)
+        df.index = RangeIndex(start, start + len(df))
+        start += len(df)
+        yield df
+
+
 def _parse(
     path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
     xpath: str,
@@ -751,8 +903,9 @@ def _parse(
     compression: CompressionOptions,
     storage_options: StorageOptions,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+    chunksize: int | None = None,
     **kwargs,
-) -> DataFrame:
+) -> DataFrame | Iterator[DataFrame]:
     """
     Call internal parsers.
 
@@ -766,8 +919,14 @@ def _parse(
 
     ValueError
         * If parser is not lxml or etree.
+        * If chunksize is used without iterparse.
     """
 
+    if chunksize is not None:
+        chunksize = validate_integer("chunksize", chunksize, 1)
+        if iterparse is None:
+            raise ValueError("chunksize is only supported with iterparse.")
+
     p: _EtreeFrameParser | _LxmlFrameParser
 
     if parser == "lxml":
@@ -813,6 +972,16 @@ def _parse(
     else:
         raise ValueError("Values for parser can only be lxml or etree.")
 
+    if chunksize is not None:
+        return _chunks_to_frames(
+            p.parse_data_chunks(chunksize),
+            dtype=dtype,
+            converters=converters,
+            parse_dates=parse_dates,
+            dtype_backend=dtype_backend,
+            **kwargs,
+        )
+
     data_dicts = p.parse_data()
 
     return _data_to_frame(
@@ -825,6 +994,75 @@ def _parse(
     )
 
 
+@overload
+def read_xml(
+    path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
+    *,
+    xpath: str = ...,
+    namespaces: dict[str, str] | None = ...,
+    elems_only: bool = ...,
+    attrs_only: bool = ...,
+    names: Sequence[str] | None = ...,
+    dtype: DtypeArg | None = ...,
+    converters: ConvertersArg | None = ...,
+    parse_dates: ParseDatesArg | None = ...,
+    encoding: str | None = ...,
+    parser: XMLParsers = ...,
+    stylesheet: FilePath | ReadBuffer[bytes] | ReadBuffer[str] | None = ...,
+    iterparse: dict[str, list[str]] | None = ...,
+    compression: CompressionOptions = ...,
+    storage_options: StorageOptions | None = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    chunksize: None = ...,
+) -> DataFrame: ...
+
+
+@overload
+def read_xml(
+    path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
+    *,
+    xpath: str = ...,
+    namespaces: dict[str, str] | None = ...,
+    elems_only: bool = ...,
+    attrs_only: bool = ...,
+    names: Sequence[str] | None = ...,
+    dtype: DtypeArg | None = ...,
+    converters: ConvertersArg | None = ...,
+    parse_dates: ParseDatesArg | None = ...,
+    encoding: str | None = ...,
+    parser: XMLParsers = ...,
+    stylesheet: FilePath | ReadBuffer[bytes] | ReadBuffer[str] | None = ...,
+    iterparse: dict[str, list[str]] | None = ...,
+    compression: CompressionOptions = ...,
+    storage_options: StorageOptions | None = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    chunksize: int,
+) -> Iterator[DataFrame]: ...
+
+
+@overload
+def read_xml(
+    path_or_buffer: FilePath | ReadBuffer[bytes] | ReadBuffer[str],
+    *,
+    xpath: str = ...,
+    namespaces: dict[str, str] | None = ...,
+    elems_only: bool = ...,
+    attrs_only: bool = ...,
+    names: Sequence[str] | None = ...,
+    dtype: DtypeArg | None = ...,
+    converters: ConvertersArg | None = ...,
+    parse_dates: ParseDatesArg | None = ...,
+    encoding: str | None = ...,
+    parser: XMLParsers = ...,
+    stylesheet: FilePath | ReadBuffer[bytes] | ReadBuffer[str] | None = ...,
+    iterparse: dict[str, list[str]] | None = ...,
+    compression: CompressionOptions = ...,
+    storage_options: StorageOptions | None = ...,
+    dtype_backend: DtypeBackend | lib.NoDefault = ...,
+    chunksize: int | None = ...,
+) -> DataFrame | Iterator[DataFrame]: ...
+
+
 @doc(
     storage_options=_shared_docs["storage_options"],
     decompression_options=_shared_docs["decompression_options"] % "path_or_buffer",
@@ -848,7 +1086,8 @@ def read_xml(
     compression: CompressionOptions = "infer",
     storage_options: StorageOptions | None = None,
     dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
-) -> DataFrame:
+    chunksize: int | None = None,
+) -> DataFrame | Iterator[DataFrame]:
     r"""
     Read XML document into a :class:`~pandas.DataFrame` object.
 
@@ -971,10 +1210,21 @@ def read_xml(
 
         .. versionadded:: 2.0
 
+    chunksize : int, optional
+        Number of rows of the repeating element in ``iterparse`` to include in
+        each chunk. If specified, return an iterator of DataFrames, each holding
+        at most ``chunksize`` rows, instead of a single DataFrame. Rows are
+        converted as soon as a chunk is complete, so that only a single chunk
+        is held in memory at a time. All chunks share the columns found in the
+        first chunk and the index continues across chunks. Requires
+        ``iterparse``.
+
+        .. versionadded:: 3.0.0
+
     Returns
     -------
     df
-        A DataFrame.
+        A DataFrame, or an iterator of DataFrames if ``chunksize`` is specified.
 
     See Also
     --------
@@ -1137,4 +1387,5 @@ def read_xml(
         compression=compression,
         storage_options=storage_options,
         dtype_backend=dtype_backend,
+        chunksize=chunksize,
     )
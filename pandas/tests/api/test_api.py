@@ -94,6 +94,7 @@ class TestPDApi(Base):
         "Float32Dtype",
         "Float64Dtype",
         "NamedAgg",
+        "ValueCountsAccumulator",
     ]
 
     # these are already deprecated; awaiting removal
@@ -432,5 +433,6 @@ def test_set_module():
     assert pd.bdate_range.__module__ == "pandas"
     assert pd.timedelta_range.__module__ == "pandas"
     assert pd.NamedAgg.__module__ == "pandas"
+    assert pd.ValueCountsAccumulator.__module__ == "pandas"
     assert api.typing.SeriesGroupBy.__module__ == "pandas.api.typing"
     assert api.typing.DataFrameGroupBy.__module__ == "pandas.api.typing"
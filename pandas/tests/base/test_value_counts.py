@@ -339,3 +339,65 @@ def test_value_counts_object_inference_deprecated():
     exp = dti.value_counts()
     exp.index = exp.index.astype(object)
     tm.assert_series_equal(res, exp)
+
+
+@pytest.mark.filterwarnings(r"ignore:PeriodDtype\[B\] is deprecated:FutureWarning")
+def test_value_counts_accumulator(index_or_series_obj, dropna):
+    obj = index_or_series_obj
+    obj = np.repeat(obj, range(1, len(obj) + 1))
+    if obj.dtype == np.float16:
+        pytest.skip("float16 indexes are not supported")
+
+    acc = pd.ValueCountsAccumulator(dropna=dropna)
+    other = pd.ValueCountsAccumulator(dropna=dropna)
+    for start in range(0, len(obj), 7):
+        acc.update(obj[start : start + 7])
+    other.update(obj[:0])
+    acc.merge(other)
+    result = acc.result()
+
+    expected = obj.value_counts(dropna=dropna)
+    tm.assert_series_equal(result.sort_index(), expected.sort_index())
+
+
+@pytest.mark.parametrize("normalize", [True, False])
+def test_value_counts_accumulator_merge(dropna, normalize):
+    values = Series(["a", "b", None, "c", "a", np.nan, "a", "b"], name="key")
+    acc = pd.ValueCountsAccumulator(dropna=dropna)
+    acc.update(values[:3])
+    other = pd.ValueCountsAccumulator(dropna=dropna)
+    other.update(values[3:5])
+    other.update(values[5:])
+    acc.merge(other)
+
+    result = acc.result(normalize=normalize)
+    expected = values.value_counts(dropna=dropna, normalize=normalize)
+    tm.assert_series_equal(result, expected)
+
+
+def test_value_counts_accumulator_categorical():
+    cat = pd.Categorical(["x", "y", "x"], categories=["x", "y", "z"])
+    acc = pd.ValueCountsAccumulator()
+    acc.update(Series(cat[:2]))
+    acc.update(Series(cat[2:]))
+    result = acc.result(sort=False)
+    expected = Series(
+        [2, 1, 0], index=pd.CategoricalIndex(cat.categories, dtype=cat.dtype)
+    )
+    expected.name = "count"
+    tm.assert_series_equal(result, expected)
+
+
+def test_value_counts_accumulator_empty():
+    acc = pd.ValueCountsAccumulator()
+    result = acc.result()
+    expected = Series([], index=Index([], dtype=object), dtype=np.int64, name="count")
+    tm.assert_series_equal(result, expected)
+
+
+def test_value_counts_accumulator_merge_invalid():
+    acc = pd.ValueCountsAccumulator(dropna=True)
+    with pytest.raises(ValueError, match="different 'dropna'"):
+        acc.merge(pd.ValueCountsAccumulator(dropna=False))
+    with pytest.raises(TypeError, match="Can only merge a ValueCountsAccumulator"):
+        acc.merge(Series([1]))
@@ -0,0 +1,118 @@
+import numpy as np
+
+from pandas import (
+    DataFrame,
+    Series,
+)
+import pandas._testing as tm
+from pandas.api.internals import track_copies
+
+
+def test_track_copies_setitem():
+    df = DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]})
+    subset = df[["a", "b"]]
+
+    with track_copies() as tracker:
+        subset.iloc[0, 1] = 10.0
+
+    assert len(tracker.events) == 1
+    event = tracker.events[0]
+    assert event.nbytes == 24
+    assert event.dtype == np.dtype("float64")
+    assert event.method == "_LocationIndexer.__setitem__"
+    assert event.location.startswith(__file__)
+    assert event.stack[0].startswith("_LocationIndexer.__setitem__")
+    assert tracker.total_bytes == 24
+
+
+def test_track_copies_split_block():
+    df = DataFrame(np.ones((3, 3)), columns=["a", "b", "c"])
+    view = df[:]
+
+    with track_copies() as tracker:
+        # only the modified column is copied, the others are split off as views
+        view.iloc[0, 1] = 10.0
+
+    assert [event.nbytes for event in tracker.events] == [24]
+    assert df.iloc[0, 1] == 1.0
+
+
+def test_track_copies_manager_setitem_all_blocks():
+    df = DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]})
+    view = df[:]
+
+    with track_copies() as tracker:
+        # the whole manager is copied, not only its first block
+        view._mgr.setitem(slice(None), 0)
+
+    assert [event.dtype for event in tracker.events] == [
+        np.dtype("int64"),
+        np.dtype("float64"),
+    ]
+    assert tracker.total_bytes == 48
+
+
+def test_track_copies_no_copy():
+    df = DataFrame({"a": [1, 2, 3]})
+
+    with track_copies() as tracker:
+        # no other reference to the data -> no copy
+        df.iloc[0, 0] = 10
+        df.fillna(0, inplace=True)
+        df.loc[1, "a"] = 20
+
+    assert tracker.events == []
+    assert tracker.total_bytes == 0
+
+
+def test_track_copies_inplace_method():
+    ser = Series([1.0, np.nan, 3.0])
+    view = ser[:]
+
+    with track_copies() as tracker:
+        view.fillna(0, inplace=True)
+        view.clip(0, 1, inplace=True)
+
+    # only the first modification copies
+    assert len(tracker.events) == 1
+    assert tracker.events[0].method == "NDFrame.fillna"
+    tm.assert_series_equal(ser, Series([1.0, np.nan, 3.0]))
+
+
+def test_track_copies_nested_and_outside():
+    df = DataFrame({"a": [1, 2, 3]})
+
+    with track_copies() as outer:
+        view = df[:]
+        view.iloc[0, 0] = 10
+        with track_copies() as inner:
+            view2 = view[:]
+            view2.iloc[0, 0] = 20
+
+    # copies outside of the context manager are not recorded
+    view3 = df[:]
+    view3.iloc[0, 0] = 30
+
+    assert len(outer.events) == 2
+    assert len(inner.events) == 1
+
+
+def test_track_copies_report():
+    df = DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]})
+
+    with track_copies() as tracker:
+        for _ in range(2):
+            view = df[:]
+            view.iloc[0, 0] = 10
+        view = df[:]
+        view.iloc[0, 1] = 10.0
+
+    result = tracker.report()
+    assert list(result.columns) == ["method", "dtype", "location", "count", "nbytes"]
+    assert result["count"].sum() == 3
+    assert result["nbytes"].sum() == tracker.total_bytes == 72
+    assert (result["nbytes"].diff().dropna() <= 0).all()
+
+    empty = track_copies().report()
+    assert len(empty) == 0
+    assert list(empty.columns) == list(result.columns)
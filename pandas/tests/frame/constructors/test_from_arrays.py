@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+import pandas.util._test_decorators as td
+
+import pandas as pd
+from pandas import (
+    DataFrame,
+    Index,
+    RangeIndex,
+    Series,
+)
+import pandas._testing as tm
+from pandas.tests.copy_view.util import get_array
+
+
+def column_array(df, col):
+    return df._get_column_array(df.columns.get_loc(col))
+
+
+class TestFromArrays:
+    def test_from_arrays_dict(self):
+        arrays = {
+            "a": np.arange(3),
+            "b": np.arange(3, dtype="f8"),
+            "c": np.arange(3, dtype="f8") * 2,
+            "d": pd.array([1, None, 3], dtype="Int64"),
+        }
+        result = DataFrame.from_arrays(arrays)
+        expected = DataFrame(arrays)
+        tm.assert_frame_equal(result, expected)
+
+        # no copy, one block per column
+        assert len(result._mgr.blocks) == 4
+        for key, arr in arrays.items():
+            assert tm.shares_memory(column_array(result, key), arr)
+
+    def test_from_arrays_list(self):
+        a = np.arange(3)
+        result = DataFrame.from_arrays([a, a * 2], index=Index(list("xyz")))
+        expected = DataFrame({0: a, 1: a * 2}, index=Index(list("xyz")))
+        tm.assert_frame_equal(result, expected)
+        tm.assert_index_equal(result.columns, RangeIndex(2))
+
+        result = DataFrame.from_arrays([a, [1, 2, 3]], columns=["p", "q"])
+        expected = DataFrame({"p": a, "q": [1, 2, 3]})
+        tm.assert_frame_equal(result, expected)
+
+    def test_from_arrays_columns_select(self):
+        arrays = {"a": np.arange(3), "b": np.arange(3, dtype="f8")}
+        result = DataFrame.from_arrays(arrays, columns=["b"])
+        tm.assert_frame_equal(result, DataFrame({"b": arrays["b"]}))
+
+        with pytest.raises(KeyError, match="'c'"):
+            DataFrame.from_arrays(arrays, columns=["c"])
+
+    @pytest.mark.parametrize("consolidate", [True, False])
+    def test_from_arrays_copy(self, consolidate):
+        arrays = {"a": np.arange(3), "b": pd.array([1, None, 3], dtype="Int64")}
+        result = DataFrame.from_arrays(arrays, copy=True, consolidate=consolidate)
+        tm.assert_frame_equal(result, DataFrame(arrays))
+        for key, arr in arrays.items():
+            assert not tm.shares_memory(column_array(result, key), arr)
+
+    def test_from_arrays_copy_consolidate_disabled(self):
+        # with mode.consolidate disabled the arrays are not stacked
+        arr = np.arange(3)
+        with pd.option_context("mode.consolidate", False):
+            result = DataFrame.from_arrays([arr], copy=True, consolidate=True)
+        result.iloc[0, 0] = 100
+        assert arr[0] == 0
+
+    def test_from_arrays_consolidate(self):
+        arrays = {"a": np.arange(3.0), "b": np.arange(3.0)}
+        result = DataFrame.from_arrays(arrays, consolidate=True)
+        assert len(result._mgr.blocks) == 1
+        tm.assert_frame_equal(result, DataFrame(arrays))
+
+    def test_from_arrays_series_aligned(self):
+        ser = Series([1, 2, 3], index=[2, 1, 0])
+        result = DataFrame.from_arrays({"a": ser}, index=[0, 1, 2])
+        expected = DataFrame({"a": [3, 2, 1]})
+        tm.assert_frame_equal(result, expected)
+
+    def test_from_arrays_series_copy_on_write(self):
+        ser = Series([1, 2, 3])
+        result = DataFrame.from_arrays({"a": ser})
+        assert np.shares_memory(get_array(result, "a"), get_array(ser))
+
+        result.iloc[0, 0] = 100
+        tm.assert_series_equal(ser, Series([1, 2, 3]))
+
+    def test_from_arrays_length_mismatch(self):
+        with pytest.raises(ValueError, match="All arrays must be of the same length"):
+            DataFrame.from_arrays([np.arange(3), np.arange(4)])
+        with pytest.raises(ValueError, match="len\\(columns\\) must match"):
+            DataFrame.from_arrays([np.arange(3)], columns=["a", "b"])
+        with pytest.raises(ValueError, match="Length of values"):
+            DataFrame.from_arrays([np.arange(3)], index=[0, 1])
+
+    def test_from_arrays_empty(self):
+        result = DataFrame.from_arrays({})
+        tm.assert_frame_equal(result, DataFrame(), check_column_type=False)
+
+    @td.skip_if_no("pyarrow")
+    def test_from_arrays_pyarrow(self):
+        import pyarrow as pa
+
+        arr = pa.array([1, None, 3])
+        chunked = pa.chunked_array([["a"], ["b", "c"]])
+        result = DataFrame.from_arrays({"a": arr, "b": chunked})
+        assert result["a"].dtype == pd.ArrowDtype(pa.int64())
+        assert result["b"].dtype == pd.ArrowDtype(pa.string())
+        assert result["b"].array._pa_array is chunked
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from pandas import (
+    DataFrame,
+    array,
+)
+import pandas._testing as tm
+
+
+class TestSetValues:
+    def test_set_values_matches_at(self):
+        df = DataFrame(
+            {
+                "A": [1.0, 2.0, 3.0],
+                "B": ["x", "y", "z"],
+                "C": [1, 2, 3],
+                "D": array([1, 2, 3], dtype="Int64"),
+            },
+            index=["a", "b", "c"],
+        )
+        expected = df.copy()
+        rows = ["a", "c", "b", "a", "c", "b"]
+        cols = ["A", "A", "B", "C", "D", "A"]
+        values = [10.0, 30.0, "w", 7, None, 1.5]
+        for row, col, value in zip(rows, cols, values):
+            expected.at[row, col] = value
+
+        df.set_values(rows, cols, values)
+        tm.assert_frame_equal(df, expected)
+
+    def test_set_values_last_value_wins(self):
+        df = DataFrame({"A": [1, 2, 3]})
+        df.set_values([0, 1, 0], ["A", "A", "A"], [10, 20, 30])
+        tm.assert_frame_equal(df, DataFrame({"A": [30, 20, 3]}))
+
+    def test_set_values_scalar(self):
+        df = DataFrame(np.zeros((2, 2)), columns=["a", "b"])
+        df.set_values([0, 1], ["b", "a"], 1.5)
+        tm.assert_frame_equal(
+            df, DataFrame([[0.0, 1.5], [1.5, 0.0]], columns=["a", "b"])
+        )
+
+    def test_set_values_copy_on_write(self):
+        df = DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]})
+        view = df[:]
+        expected = view.copy()
+        df.set_values([0, 1], ["A", "B"], [10.0, 40.0])
+        tm.assert_frame_equal(view, expected)
+        tm.assert_frame_equal(df, DataFrame({"A": [10.0, 2.0], "B": [3.0, 40.0]}))
+
+    def test_set_values_non_unique(self):
+        df = DataFrame(np.zeros((3, 2)), index=[0, 0, 1])
+        df.set_values([0, 1], [1, 0], [9.0, 8.0])
+        expected = DataFrame([[0.0, 9.0], [0.0, 9.0], [8.0, 0.0]], index=[0, 0, 1])
+        tm.assert_frame_equal(df, expected)
+
+    def test_set_values_invalid(self):
+        df = DataFrame({"A": [1, 2]})
+        with pytest.raises(KeyError, match=r"\['q'\] not in index"):
+            df.set_values(["q"], ["A"], [1])
+        with pytest.raises(KeyError, match=r"\['B'\] not in index"):
+            df.set_values([0], ["B"], [1])
+        with pytest.raises(ValueError, match="must have the same length"):
+            df.set_values([0, 1], ["A"], [1, 2])
+        with pytest.raises(TypeError, match="Invalid value"):
+            df.set_values([0], ["A"], [1.5])
+        tm.assert_frame_equal(df, DataFrame({"A": [1, 2]}))
+
+    @pytest.mark.parametrize("copy_on_write", [True, False])
+    def test_set_values_invalid_unchanged(self, copy_on_write):
+        # an invalid value in a later block does not leave earlier cells set
+        df = DataFrame(
+            {"f": [1.0, 2.0], "a": [1, 2], "e": array([1, 2], dtype="Int64")}
+        )
+        expected = df.copy()
+        view = df[:] if copy_on_write else None
+        with pytest.raises(TypeError, match="Invalid value"):
+            df.set_values([0, 0], ["f", "a"], [9.0, 1.5])
+        with pytest.raises(TypeError, match="cannot safely cast"):
+            df.set_values([0, 1, 0], ["f", "e", "e"], [9.0, 3, 1.5])
+        tm.assert_frame_equal(df, expected)
+        if view is not None:
+            tm.assert_frame_equal(view, expected)
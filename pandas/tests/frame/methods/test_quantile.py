@@ -741,6 +741,31 @@ class TestDataFrameQuantile:
         with pytest.raises(ValueError, match="Invalid method: foo"):
             DataFrame(range(1)).quantile(0.5, method="foo")
 
+    def test_quantile_approx(self):
+        df = DataFrame(
+            {
+                "A": np.arange(1000) % 7,
+                "B": np.random.default_rng(2).standard_normal(1000),
+                "C": pd.date_range("2020-01-01", periods=1000, freq="h"),
+            }
+        )
+        result = df.quantile([0.1, 0.9], method="approx", numeric_only=True)
+        expected = df.quantile([0.1, 0.9], numeric_only=True)
+        tm.assert_frame_equal(result, expected, atol=0.05)
+
+        result = df.quantile(0.5, method="approx")
+        expected = df.quantile(0.5)
+        assert abs(result["C"] - expected["C"]) <= pd.Timedelta(hours=10)
+
+    @pytest.mark.parametrize("values", [[0.0, 1.0, 2.0], [0.0, np.nan, 2.0]])
+    def test_quantile_approx_float32(self, values):
+        # same result dtype as the exact method
+        df = DataFrame({"a": np.array(values, dtype=np.float32)})
+        result = df.quantile([0.5], method="approx")
+        expected = df.quantile([0.5])
+        assert result.dtypes["a"] == expected.dtypes["a"]
+        tm.assert_frame_equal(result, expected)
+
     def test_table_invalid_interpolation(self):
         with pytest.raises(ValueError, match="Invalid interpolation: foo"):
             DataFrame(range(1)).quantile(0.5, method="table", interpolation="foo")
@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+import pytest
+
+from pandas import (
+    DataFrame,
+    date_range,
+)
+import pandas._testing as tm
+from pandas.core.internals.blocks import spill_directory
+
+
+def is_spilled(df, col):
+    return spill_directory(df._mgr.iget_values(df.columns.get_loc(col))) is not None
+
+
+class TestSpill:
+    @pytest.fixture
+    def df(self):
+        return DataFrame(
+            {
+                "a": np.arange(5),
+                "b": np.arange(5, dtype="f8"),
+                "c": list("abcde"),
+                "d": date_range("2020-01-01", periods=5),
+                "e": np.arange(5, dtype="f8") * 2,
+            }
+        )
+
+    def test_spill(self, df, tmp_path):
+        result = df.spill(tmp_path)
+        tm.assert_frame_equal(result, df)
+
+        for col in ["a", "b", "d", "e"]:
+            assert is_spilled(result, col)
+        # object columns are kept in memory
+        assert not is_spilled(result, "c")
+        # the files are removed from the directory right away
+        assert os.listdir(tmp_path) == []
+
+    def test_spill_default_path(self, df):
+        result = df.spill()
+        tm.assert_frame_equal(result, df)
+        assert is_spilled(result, "a")
+
+    def test_spill_operations(self, df, tmp_path):
+        result = df.spill(tmp_path)
+
+        tm.assert_series_equal(result.sum(numeric_only=True), df.sum(numeric_only=True))
+        tm.assert_frame_equal(result[["a", "b"]] * 2, df[["a", "b"]] * 2)
+        tm.assert_frame_equal(
+            result.groupby("c").mean(), df.groupby("c").mean(), check_exact=True
+        )
+        tm.assert_frame_equal(result.sort_values("e", ascending=False), df[::-1])
+
+    def test_spill_copy_on_write(self, df, tmp_path):
+        df_orig = df.copy()
+        result = df.spill(tmp_path)
+        subset = result[["b", "e"]]
+        ser = result["a"]
+
+        subset.iloc[0, 0] = 100.0
+        ser.iloc[0] = 100
+        result.loc[1, "d"] = df.loc[0, "d"]
+
+        # the copies made by Copy-on-Write are spilled as well
+        assert is_spilled(subset, "b")
+        assert spill_directory(ser._values) == str(tmp_path)
+        assert is_spilled(result, "d")
+        assert result.loc[0, "b"] == 0.0
+        assert result.loc[0, "a"] == 0
+        tm.assert_frame_equal(df, df_orig)
+
+        assert is_spilled(result.copy(), "a")
+
+    def test_spill_memory_limit(self, tmp_path):
+        df = DataFrame(
+            {
+                "a": np.arange(10, dtype="i8"),
+                "b": np.arange(10, dtype="f8"),
+                "c": np.arange(10, dtype="f8"),
+                "d": np.arange(10, dtype="i2"),
+            }
+        )
+        result = df.spill(tmp_path, memory_limit=100)
+        tm.assert_frame_equal(result, df)
+        # the float block is the largest, spilling it is enough
+        assert is_spilled(result, "b")
+        assert is_spilled(result, "c")
+        assert not is_spilled(result, "a")
+        assert not is_spilled(result, "d")
+
+        result = df.spill(tmp_path, memory_limit=0)
+        assert all(is_spilled(result, col) for col in df.columns)
+
+    def test_spill_invalid(self, df, tmp_path):
+        with pytest.raises(FileNotFoundError, match="does not exist"):
+            df.spill(tmp_path / "missing")
+        with pytest.raises(ValueError, match="memory_limit must be"):
+            df.spill(tmp_path, memory_limit=-1)
+
+    def test_user_memmap_not_spilled(self, tmp_path):
+        # a memory map of the user is copied into memory, not into a new file
+        path = tmp_path / "values.npy"
+        np.save(path, np.arange(5, dtype="f8"))
+        df = DataFrame({"a": np.load(path, mmap_mode="r")}, copy=False)
+        view = df[:]
+
+        assert not is_spilled(df, "a")
+        view.iloc[0, 0] = 100.0
+        assert not is_spilled(view, "a")
+        assert df.iloc[0, 0] == 0.0
+        assert os.listdir(tmp_path) == ["values.npy"]
@@ -207,6 +207,26 @@ class TestDataFrameToDict:
         assert isinstance(item_getter(result, "a", 0), int)
         assert isinstance(item_getter(result, "b", 0), float)
 
+    @pytest.mark.parametrize("into", [dict, OrderedDict])
+    def test_to_dict_records_batched(self, monkeypatch, into):
+        monkeypatch.setattr(DataFrame, "_row_batch_size", staticmethod(lambda n: 2))
+        df = DataFrame(
+            {
+                "a": [1, 2, 3],
+                "b": np.array([np.int64(4), "x", 5.5], dtype=object),
+                "c": Series([1, None, 3], dtype="Int64"),
+            }
+        )
+        result = df.to_dict(orient="records", into=into)
+        expected = [
+            into(a=1, b=4, c=1),
+            into(a=2, b="x", c=None),
+            into(a=3, b=5.5, c=3),
+        ]
+        assert result == expected
+        assert all(type(row) is into for row in result)
+        assert type(result[0]["b"]) is int
+
     def test_to_dict_tz(self):
         # GH#18372 When converting to dict with orient='records' columns of
         # datetime that are tz-aware were not converted to required arrays
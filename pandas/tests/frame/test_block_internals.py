@@ -408,3 +408,41 @@ def test_nonconsolidated_item_cache_take():
     expected = DataFrame({"col1": ["A"], "col2": [0]}, dtype=object)
     tm.assert_frame_equal(df, expected)
     assert df.at[0, "col1"] == "A"
+
+
+def test_consolidate_option_disabled():
+    arrays = {i: np.arange(3, dtype=np.float64) + i for i in range(150)}
+    with option_context("mode.consolidate", False):
+        df = DataFrame(arrays)
+        assert df._mgr.nblocks == 150
+
+        # no fragmentation warning when columns are inserted one at a time
+        with tm.assert_produces_warning(None):
+            for i in range(150, 300):
+                df[i] = np.arange(3, dtype=np.float64) + i
+        assert df._mgr.nblocks == 300
+
+        assert df.copy()._mgr.nblocks == 300
+        assert df._consolidate()._mgr.nblocks == 300
+
+    expected = DataFrame({i: np.arange(3, dtype=np.float64) + i for i in range(300)})
+    assert expected._mgr.nblocks == 1
+    tm.assert_frame_equal(df, expected)
+    tm.assert_series_equal(df.iloc[1], expected.iloc[1])
+    tm.assert_series_equal(df.sum(), expected.sum())
+
+
+@pytest.mark.parametrize("name", ["sum", "prod", "min", "max"])
+@pytest.mark.parametrize("skipna", [True, False])
+@pytest.mark.parametrize("dtype", ["float64", "int64"])
+def test_reduce_axis1_non_consolidated(name, skipna, dtype):
+    values = np.array([[1, np.nan, 3], [4, 5, 6], [-1, 2, 0]])
+    if dtype == "int64":
+        values = np.nan_to_num(values).astype(dtype)
+    with option_context("mode.consolidate", False):
+        df = DataFrame({i: values[:, i] for i in range(3)})
+    assert df._mgr.nblocks == 3
+
+    result = getattr(df, name)(axis=1, skipna=skipna)
+    expected = getattr(df._consolidate(), name)(axis=1, skipna=skipna)
+    tm.assert_series_equal(result, expected)
@@ -136,6 +136,45 @@ class TestIteration:
         assert isinstance(result, tuple)
         assert hasattr(result, "_fields")
 
+    def test_itertuples_batched(self, monkeypatch):
+        # rows are built from batches of boxed column values
+        monkeypatch.setattr(DataFrame, "_row_batch_size", staticmethod(lambda n: 2))
+        df = DataFrame(
+            {
+                "a": [1, 2, 3, 4, 5],
+                "b": [1.5, 2.5, np.nan, 4.5, 5.5],
+                "c": date_range("2020-01-01", periods=5, tz="UTC"),
+                "d": Categorical(list("xyzxy")),
+                "e": Series([1, None, 3, 4, 5], dtype="Int64"),
+            },
+            index=list("pqrst"),
+        )
+        # same values as zipping the columns
+        expected = list(zip(df.index, *(df.iloc[:, i] for i in range(df.shape[1]))))
+        result = list(df.itertuples())
+        assert len(result) == 5
+        for tup, exp in zip(result, expected):
+            assert type(tup).__name__ == "Pandas"
+            tm.assert_almost_equal(list(tup), list(exp))
+            assert [type(x) for x in tup] == [type(x) for x in exp]
+
+        result = list(df.itertuples(index=False, name=None))
+        for tup, exp in zip(result, expected):
+            assert type(tup) is tuple
+            tm.assert_almost_equal(list(tup), list(exp[1:]))
+
+    def test_iterrows_batched(self, monkeypatch):
+        monkeypatch.setattr(DataFrame, "_row_batch_size", staticmethod(lambda n: 2))
+        df = DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]}, index=list("xyz"))
+        for i, (k, v) in enumerate(df.iterrows()):
+            expected = df.iloc[i]
+            assert k == expected.name
+            tm.assert_series_equal(v, expected)
+
+        df = DataFrame({"a": [1, 2, 3], "b": list("pqr")})
+        for i, (k, v) in enumerate(df.iterrows()):
+            tm.assert_series_equal(v, df.iloc[i])
+
     def test_sequence_like_with_categorical(self):
         # GH#7839
         # make sure can iterate
@@ -475,6 +475,9 @@ class TestDataFrameAnalytics:
         )
         tm.assert_series_equal(df.nunique(axis=1), Series([1, 2, 2]))
         tm.assert_series_equal(df.nunique(axis=1, dropna=False), Series([1, 3, 2]))
+        tm.assert_series_equal(
+            df.nunique(dropna=False, approx=True), Series({"A": 1, "B": 3, "C": 3})
+        )
 
     @pytest.mark.parametrize("tz", [None, "UTC"])
     def test_mean_mixed_datetime_numeric(self, tz):
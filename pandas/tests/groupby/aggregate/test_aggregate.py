@@ -320,6 +320,45 @@ def test_agg_multiple_functions_maintain_order(df):
     tm.assert_index_equal(result.columns, exp_cols)
 
 
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_agg_multiple_functions_numeric_frame(num_threads):
+    # numeric columns are aggregated with each function at once
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "key": rng.integers(0, 5, 50),
+            "a": rng.standard_normal(50),
+            "b": rng.integers(0, 10, 50),
+            "c": rng.standard_normal(50).astype(np.float32),
+        }
+    )
+    df.loc[::7, "a"] = np.nan
+    funcs = ["sum", "mean", "max", "var"]
+    gb = df.groupby("key")
+    with pd.option_context("compute.num_threads", num_threads):
+        result = gb.agg(funcs)
+
+    expected = pd.concat({col: gb[col].agg(funcs) for col in ["a", "b", "c"]}, axis=1)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_agg_multiple_functions_numeric_frame_multiindex_columns():
+    # the function level comes after all the levels of the columns
+    rng = np.random.default_rng(2)
+    columns = MultiIndex.from_tuples([("k", "g"), ("x", "a"), ("x", "b"), ("y", "a")])
+    df = DataFrame(rng.standard_normal((20, 4)), columns=columns)
+    df[("k", "g")] = rng.integers(0, 3, 20)
+    funcs = ["sum", "mean"]
+    result = df.groupby(("k", "g")).agg(funcs)
+
+    key = df[("k", "g")]
+    expected = pd.concat(
+        {col: df[col].groupby(key).agg(funcs) for col in columns[1:]}, axis=1
+    )
+    tm.assert_frame_equal(result, expected)
+    assert result.columns[0] == ("x", "a", "sum")
+
+
 def test_series_index_name(df):
     grouped = df.loc[:, ["C"]].groupby(df["A"])
     result = grouped.agg(lambda x: x.mean())
@@ -413,3 +413,20 @@ def test_cython_agg_EA_known_dtypes(data, op_name, action, with_na):
 
     result = grouped["col"].aggregate(op_name)
     assert result.dtype == expected_dtype
+
+
+@pytest.mark.parametrize(
+    "how", ["sum", "prod", "min", "max", "mean", "var", "first", "cumsum", "rank"]
+)
+def test_cython_op_column_chunks(monkeypatch, how):
+    # column chunks of 2D blocks are processed in a thread pool
+    df = DataFrame(np.random.default_rng(2).standard_normal((30, 7)))
+    df[3] = np.arange(30)
+    df.iloc[::4, 1] = np.nan
+    labels = np.arange(30) % 4
+    expected = getattr(df.groupby(labels), how)()
+
+    monkeypatch.setattr("pandas.core.groupby.ops._MIN_CHUNK_SIZE", 10)
+    with pd.option_context("compute.num_threads", 3):
+        result = getattr(df.groupby(labels), how)()
+    tm.assert_frame_equal(result, expected)
@@ -456,3 +456,45 @@ def test_groupby_quantile_nonmulti_levels_order():
     # We need to check that index levels are not sorted
     expected_levels = pd.core.indexes.frozen.FrozenList([["B", "A"], [0.2, 0.8]])
     tm.assert_equal(result.index.levels, expected_levels)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "int64", "Int64", "Float64"])
+def test_groupby_quantile_approx(dtype):
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "key": rng.integers(0, 5, 10_000),
+            "val": rng.integers(0, 1000, 10_000),
+        }
+    ).astype({"val": dtype})
+    df.loc[::10, "val"] = None if dtype in ("Int64", "Float64") else 0
+    gb = df.groupby("key")
+    result = gb.quantile([0.1, 0.5, 0.9], method="approx")
+    expected = gb.quantile([0.1, 0.5, 0.9])
+    if dtype == "int64":
+        expected = expected.astype("float64")
+    elif dtype == "Int64":
+        expected = expected.astype("Float64")
+    tm.assert_frame_equal(result, expected, atol=10)
+
+
+def test_groupby_quantile_approx_exact_small():
+    # exact as long as every value is its own centroid, empty groups are NaN
+    df = DataFrame(
+        {
+            "key": pd.Categorical(
+                ["a", "b", "a", "b", "a"], categories=["a", "b", "c"]
+            ),
+            "val": [1.0, 4.0, 3.0, np.nan, 2.0],
+        }
+    )
+    gb = df.groupby("key", observed=False)
+    result = gb.quantile(0.25, method="approx")
+    expected = gb.quantile(0.25)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_groupby_quantile_invalid_method():
+    df = DataFrame({"key": [1, 1], "val": [1, 2]})
+    with pytest.raises(ValueError, match="Invalid method: table"):
+        df.groupby("key").quantile(method="table")
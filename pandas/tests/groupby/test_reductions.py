@@ -1037,6 +1037,35 @@ def test_nunique():
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize("as_index", [True, False])
+def test_nunique_approx(dropna, as_index):
+    df = DataFrame({"A": list("abbacc"), "B": ["a", "b", None, "a", "c", None]})
+    gb = df.groupby("A", as_index=as_index)
+    result = gb.nunique(dropna=dropna, approx=True)
+    expected = gb.nunique(dropna=dropna)
+    tm.assert_frame_equal(result, expected)
+
+    result = gb["B"].nunique(dropna=dropna, approx=True)
+    expected = gb["B"].nunique(dropna=dropna)
+    tm.assert_equal(result, expected)
+
+
+def test_nunique_approx_small_groups_exact():
+    # groups smaller than a sketch are counted exactly, so many groups do
+    #  not need a sketch each
+    ngroups = 100_000
+    df = DataFrame(
+        {
+            "A": np.r_[np.arange(ngroups).repeat(3), np.full(50_000, ngroups)],
+            "B": np.r_[np.tile([0, 1, 0], ngroups), np.arange(50_000)],
+        }
+    )
+    result = df.groupby("A")["B"].nunique(approx=True, error=0.01)
+    assert (result.iloc[:-1] == 2).all()
+    assert abs(result.iloc[-1] - 50_000) <= 2_000
+
+
 def test_nunique_with_object():
     # GH 11077
     data = DataFrame(
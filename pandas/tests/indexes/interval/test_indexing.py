@@ -5,6 +5,7 @@ import pytest
 
 from pandas.errors import InvalidIndexError
 
+import pandas as pd
 from pandas import (
     NA,
     CategoricalIndex,
@@ -503,6 +504,43 @@ class TestGetIndexer:
         result = idx.get_indexer_non_unique(arr)[0]
         tm.assert_numpy_array_equal(result, expected, check_dtype=False)
 
+    def test_get_indexer_threads(self, monkeypatch):
+        # large targets are queried in chunks across threads
+        idx = IntervalIndex.from_arrays([0, 2, 4, 6], [3, 5, 7, 9])
+        target = np.array([-1, 0.5, 2.5, 4.5, 6, 8, 10, 3])
+        expected = idx.get_indexer_non_unique(target)
+        expected_unique = idx[::2].get_indexer(target)
+
+        monkeypatch.setattr("pandas.core.indexes.interval._MIN_CHUNK_SIZE", 2)
+        with pd.option_context("compute.num_threads", 3):
+            result = idx.get_indexer_non_unique(target)
+            result_unique = idx[::2].get_indexer(target)
+        tm.assert_numpy_array_equal(result[0], expected[0])
+        tm.assert_numpy_array_equal(result[1], expected[1])
+        tm.assert_numpy_array_equal(result_unique, expected_unique)
+
+    def test_engine_shared(self):
+        # indexes with the same bounds share their IntervalTree
+        idx = IntervalIndex.from_breaks(date_range("2020-01-01", periods=10))
+        other = IntervalIndex(idx, name="other")
+        assert other._engine is idx._engine
+        assert idx[1:]._engine is not idx._engine
+        assert idx.set_closed("both")._engine is not idx._engine
+
+    def test_engine_not_shared_after_bounds_changed(self):
+        left = np.arange(10)
+        right = left + 1
+        idx = IntervalIndex.from_arrays(left, right, copy=False)
+        result = idx.get_indexer([0.5, 3.5])
+        tm.assert_numpy_array_equal(result, np.array([0, 3], dtype=np.intp))
+
+        left[:] = left[::-1].copy()
+        right[:] = left + 1
+        other = IntervalIndex.from_arrays(left, right, copy=False)
+        assert other._engine is not idx._engine
+        result = other.get_indexer([0.5, 3.5])
+        tm.assert_numpy_array_equal(result, np.array([9, 6], dtype=np.intp))
+
 
 class TestSliceLocs:
     def test_slice_locs_with_interval(self):
@@ -137,6 +137,35 @@ class TestIntervalTree:
         expected = found if tree.closed_right else not_found
         tm.assert_numpy_array_equal(expected, tree.get_indexer(x + 0.5))
 
+    @pytest.mark.parametrize("dtype", ["int64", "uint64", "float64"])
+    @pytest.mark.parametrize("target_dtype", [None, "float64"])
+    def test_get_indexer_non_unique_matches_brute_force(
+        self, closed, dtype, target_dtype
+    ):
+        # the bulk queries walk a flattened copy of the tree without the GIL
+        rng = np.random.default_rng(2)
+        left = rng.integers(0, 500, 1000).astype(dtype)
+        right = left + rng.integers(0, 30, 1000).astype(dtype)
+        tree = IntervalTree(left, right, closed=closed, leaf_size=8)
+        target = rng.integers(0, 550, 200).astype(target_dtype or dtype)
+
+        indexer, missing = tree.get_indexer_non_unique(target)
+
+        left_op = np.less_equal if tree.closed_left else np.less
+        right_op = np.less_equal if tree.closed_right else np.less
+        start = 0
+        expected_missing = []
+        for i, point in enumerate(target):
+            matches = np.flatnonzero(left_op(left, point) & right_op(point, right))
+            if len(matches) == 0:
+                matches = np.array([-1])
+                expected_missing.append(i)
+            result = np.sort(indexer[start : start + len(matches)])
+            tm.assert_numpy_array_equal(result, matches.astype("intp"))
+            start += len(matches)
+        assert start == len(indexer)
+        tm.assert_numpy_array_equal(missing, np.array(expected_missing, dtype="intp"))
+
     @pytest.mark.parametrize(
         "left, right, expected",
         [
@@ -926,13 +926,13 @@ def test_slice_indexer_with_missing_value(index_arr, expected, start_idx, end_id
         (2, "uint16"),  # 2*4*N = 16
         (4, "uint32"),  # 2*4*N = 32
         (8, "uint64"),  # 2*4*N = 64
-        (10, "object"),  # 2*4*N = 80
+        (10, "uint64"),  # 2*4*N = 80, folded in 64 bits
     ],
 )
 def test_pyint_engine(N, expected_dtype):
     # GH#18519 : when combinations of codes cannot be represented in 64
-    # bits, the index underlying the MultiIndex engine works with Python
-    # integers, rather than uint64.
+    # bits, the index underlying the MultiIndex engine folds the ranks of
+    # 64 bit words rather than truncating.
     keys = [
         tuple(arr)
         for arr in [
@@ -968,6 +968,39 @@ def test_pyint_engine(N, expected_dtype):
     tm.assert_numpy_array_equal(result, expected)
 
 
+@pytest.mark.parametrize("sort", [True, False])
+def test_wide_engine(sort):
+    # label combinations overflowing 64 bits keep a uint64 engine
+    rng = np.random.default_rng(2)
+    n = 1000
+    arrays = [rng.integers(0, 5000, n).astype(float) for _ in range(8)]
+    if not sort:
+        arrays[1][::7] = np.nan
+    index = MultiIndex.from_arrays(arrays)
+    if sort:
+        index = index.sort_values()
+    assert type(index._engine).__name__ == "MultiIndexUInt64WideEngine"
+    assert index._engine.values.dtype == "uint64"
+    # the folding preserves the lexicographic order
+    assert index._engine.is_monotonic_increasing is sort
+
+    keys = list(index)
+    for i in [0, 7, 500, n - 1]:
+        assert index.get_loc(keys[i]) == i
+
+    target = MultiIndex.from_tuples(keys[::3] + [(1.0,) * 8, (0.5,) * 8])
+    result = index.get_indexer(target)
+    expected = np.array(list(range(0, n, 3)) + [-1, -1], dtype=np.intp)
+    tm.assert_numpy_array_equal(result, expected)
+
+    with pytest.raises(KeyError, match="1.0"):
+        index.get_loc((1.0,) * 8)
+
+    if sort:
+        dup = index.append(index[:10]).sort_values()
+        assert dup.get_loc(dup[0]) == slice(0, 2)
+
+
 @pytest.mark.parametrize(
     "keys,expected",
     [
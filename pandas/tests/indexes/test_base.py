@@ -1,4 +1,5 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 import math
@@ -1350,6 +1351,77 @@ class TestIndex:
 
         tm.assert_index_equal(result, expected)
 
+    @pytest.mark.parametrize(
+        "idx",
+        [
+            Index(np.arange(10)),
+            Index(np.arange(10.0)),
+            Index(list("abcdefghij"), dtype=object),
+            pd.date_range("2020-01-01", periods=10, tz="UTC"),
+            pd.timedelta_range("1 day", periods=10),
+            pd.period_range("2020-01-01", periods=10),
+        ],
+    )
+    def test_engine_shared_between_indexes_with_same_values(self, idx):
+        # the hash table is only built once for indexes wrapping the same array
+        idx.get_loc(idx[3])
+        assert idx._engine.is_mapping_populated
+
+        other = type(idx)(idx, name="other")
+        assert other._engine is idx._engine
+        assert other.get_loc(idx[4]) == 4
+
+        # different memory or dtype get their own engine
+        assert idx.copy(deep=True)._engine is not idx._engine
+        assert idx[1:]._engine is not idx._engine
+        assert idx[1:].get_loc(idx[4]) == 3
+
+    def test_engine_shared_between_threads(self):
+        # indexes sharing an engine populate its hash table only once
+        idx = Index(np.arange(100_000))
+        indexes = [Index(idx, name=i) for i in range(8)]
+        assert all(index._engine is idx._engine for index in indexes)
+
+        def lookup(index):
+            return index.get_indexer(np.arange(0, 100_000, 7))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lookup, indexes))
+        expected = np.arange(0, 100_000, 7, dtype=np.intp)
+        for result in results:
+            tm.assert_numpy_array_equal(result, expected)
+
+    def test_engine_not_shared_with_other_dtype(self):
+        dti = pd.date_range("2020-01-01", periods=10, tz="UTC")
+        naive = dti.tz_convert(None)
+        assert naive._engine is not dti._engine
+
+        idx = Index(np.arange(10, dtype=np.int64))
+        view = Index(idx._data.view("M8[ns]"), copy=False)
+        assert view._engine is not idx._engine
+
+    def test_engine_not_shared_after_buffer_changed(self):
+        # a new index over a changed writeable buffer builds its own hash table
+        buf = np.arange(10)
+        idx = Index(buf, copy=False)
+        assert idx.get_loc(3) == 3
+
+        buf[:] = buf[::-1].copy()
+        other = Index(buf, copy=False)
+        assert other._engine is not idx._engine
+        assert other.get_loc(3) == 6
+        tm.assert_numpy_array_equal(
+            other.get_indexer([3, 9]), np.array([6, 0], dtype=np.intp)
+        )
+        tm.assert_numpy_array_equal(other.isin([3]), buf == 3)
+
+    def test_engine_shared_for_readonly_buffer(self):
+        buf = np.arange(10)
+        buf.flags.writeable = False
+        idx = Index(buf, copy=False)
+        idx.get_loc(3)
+        assert Index(buf, copy=False)._engine is idx._engine
+
 
 class TestMixedIntIndex:
     # Mostly the tests from common.py for which the results differ
@@ -6,6 +6,7 @@ import pytest
 from pandas._libs import index as libindex
 
 import pandas as pd
+import pandas._testing as tm
 
 
 @pytest.fixture(
@@ -135,6 +136,39 @@ class TestNumericEngine:
         result = engine.get_loc(2)
         assert (result == expected).all()
 
+    @pytest.mark.parametrize("decreasing", [False, True])
+    def test_get_indexer_over_size_cutoff(
+        self, numeric_indexing_engine_type_and_dtype, monkeypatch, decreasing
+    ):
+        # large unique monotonic indexes are searched without a hash table
+        engine_type, dtype = numeric_indexing_engine_type_and_dtype
+        monkeypatch.setattr(libindex, "_SIZE_CUTOFF", 10)
+
+        arr = np.arange(2, 42, 2, dtype=dtype)
+        if decreasing:
+            arr = arr[::-1]
+        engine = engine_type(arr)
+        targets = np.array([4, 3, 40, 1, 2, 41], dtype=dtype)
+        result = engine.get_indexer(targets)
+        expected = np.array([1, -1, 19, -1, 0, -1], dtype=np.intp)
+        if decreasing:
+            expected = np.where(expected == -1, -1, len(arr) - 1 - expected)
+        tm.assert_numpy_array_equal(result, expected)
+        assert engine.is_mapping_populated is False
+        assert engine.sizeof() == 0
+
+    def test_is_unique_monotonic_over_size_cutoff(
+        self, numeric_indexing_engine_type_and_dtype, monkeypatch
+    ):
+        engine_type, dtype = numeric_indexing_engine_type_and_dtype
+        monkeypatch.setattr(libindex, "_SIZE_CUTOFF", 10)
+
+        arr = np.array([1] * 10 + [2] * 10, dtype=dtype)
+        engine = engine_type(arr)
+        assert engine.is_unique is False
+        assert engine.get_loc(2) == slice(10, 20)
+        assert engine.is_mapping_populated is False
+
 
 class TestObjectEngine:
     engine_type = libindex.ObjectEngine
@@ -190,3 +224,74 @@ class TestObjectEngine:
         expected = np.array([False, True, False] * num, dtype=bool)
         result = engine.get_loc("b")
         assert (result == expected).all()
+
+
+class TestArrowStringEngine:
+    def make_engine(self, values):
+        pytest.importorskip("pyarrow")
+        arr = pd.array(values, dtype="string[pyarrow]")
+        return libindex.ArrowStringEngine(arr, *arr._utf8_buffers())
+
+    def test_index_uses_engine(self):
+        pytest.importorskip("pyarrow")
+        idx = pd.Index(["a", "b", "c"], dtype="string[pyarrow]")
+        assert isinstance(idx._engine, libindex.ArrowStringEngine)
+
+    def test_is_unique(self):
+        assert self.make_engine(["a", "b", None, "é"]).is_unique is True
+        assert self.make_engine(["a", "b", "a"]).is_unique is False
+        assert self.make_engine(["a", None, None]).is_unique is False
+
+    def test_get_loc(self):
+        engine = self.make_engine(["b", "a", "", "é", None])
+        assert engine.get_loc("a") == 1
+        assert engine.get_loc("") == 2
+        assert engine.get_loc("é") == 3
+        assert engine.get_loc(None) == 4
+        assert engine.get_loc(np.nan) == 4
+        for key in ["c", "\ud800", 1]:
+            with pytest.raises(KeyError, match=re.escape(repr(key))):
+                engine.get_loc(key)
+
+    def test_get_loc_duplicates(self):
+        num = 1000
+        engine = self.make_engine(["a"] * num + ["b"] * num + ["c"] * num)
+        assert engine.get_loc("b") == slice(num, 2 * num)
+
+        engine = self.make_engine(["a", "b", "c"] * num)
+        expected = np.array([False, True, False] * num, dtype=bool)
+        tm.assert_numpy_array_equal(engine.get_loc("b"), expected)
+
+    @pytest.mark.parametrize(
+        "values, inc, dec, unique",
+        [
+            (["a", "ab", "b", "é"], True, False, True),
+            (["é", "b", "b", "a"], False, True, False),
+            (["a", "a"], True, True, False),
+            (["b", "a", "c", "a"], False, False, False),
+            (["a", None, "b"], False, False, True),
+        ],
+    )
+    def test_is_monotonic(self, values, inc, dec, unique):
+        engine = self.make_engine(values)
+        assert engine.is_monotonic_increasing is inc
+        assert engine.is_monotonic_decreasing is dec
+        assert engine.is_unique is unique
+
+    def test_get_indexer(self):
+        engine = self.make_engine(["b", "a", None, "é"])
+        target = ["a", "c", None, "é", "b"]
+        expected = np.array([1, -1, 2, 3, 0], dtype=np.intp)
+        result = engine.get_indexer(np.array(target, dtype=object))
+        tm.assert_numpy_array_equal(result, expected)
+        result = engine.get_indexer(pd.array(target, dtype="string[pyarrow]"))
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_get_indexer_non_unique(self):
+        engine = self.make_engine(["b", "a", "b", None, "a"])
+        target = pd.array(["a", "c", None, "b"], dtype="string[pyarrow]")
+        indexer, missing = engine.get_indexer_non_unique(target)
+        tm.assert_numpy_array_equal(
+            indexer, np.array([1, 4, -1, 3, 0, 2], dtype=np.intp)
+        )
+        tm.assert_numpy_array_equal(missing, np.array([1], dtype=np.intp))
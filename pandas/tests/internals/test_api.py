@@ -24,6 +24,7 @@ def test_namespace():
 
     modules = [
         "blocks",
+        "copy_tracking",
         "concat",
         "managers",
         "construction",
@@ -1410,3 +1410,52 @@ def test_make_block_no_pandas_array(block_maker):
             )
         assert result.dtype.kind in ["i", "u"]
         assert result.is_extension is False
+
+
+class TestNumThreads:
+    @pytest.fixture
+    def df(self):
+        n = 1000
+        return DataFrame(
+            {
+                "a": np.arange(n, dtype="f8"),
+                "b": np.arange(n, dtype="i8"),
+                "c": pd.array(np.arange(n), dtype="Int64"),
+                "d": Series(["x", "y"] * (n // 2), dtype=object),
+                "e": pd.date_range("2016-01-01", periods=n),
+                "f": np.arange(n) % 3 == 0,
+                "g": Categorical(["p", "q"] * (n // 2)),
+            }
+        )
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            lambda df: df.astype(str),
+            lambda df: df.where(df.notna(), None).fillna(0),
+            lambda df: df.shift(2),
+            lambda df: df.select_dtypes("number") * 2,
+            lambda df: df.select_dtypes("number") + df.select_dtypes("number"),
+            lambda df: df.sum(numeric_only=True),
+            lambda df: df.drop(columns="g").min(),
+            lambda df: df.select_dtypes("number").quantile(),
+            lambda df: df.groupby("d").sum(numeric_only=True),
+            lambda df: df.groupby("d").first(),
+        ],
+    )
+    def test_num_threads(self, df, method):
+        expected = method(df)
+        with pd.option_context("compute.num_threads", 4):
+            result = method(df)
+        tm.assert_equal(result, expected)
+
+    def test_num_threads_reduce_split_block(self):
+        # a single large block is split in column chunks
+        df = DataFrame(np.random.default_rng(2).standard_normal((100_000, 8)))
+        expected = df.sum()
+        with pd.option_context("compute.num_threads", 4):
+            assert len(df._mgr.blocks) == 1
+            result = df.sum()
+            grouped = df.groupby(np.arange(len(df)) % 10).mean()
+        tm.assert_series_equal(result, expected)
+        tm.assert_frame_equal(grouped, df.groupby(np.arange(len(df)) % 10).mean())
@@ -1621,6 +1621,53 @@ class TestExcelFileRead:
             with pd.ExcelFile("blank" + read_ext) as excel:
                 excel.parse(sheet_name=sheet_name)
 
+    @pytest.mark.parametrize("sheet_name", [None, [2, "Charlie", "Charlie"]])
+    def test_parse_max_workers(self, read_ext, sheet_name):
+        with pd.ExcelFile("test_multisheet" + read_ext) as excel:
+            expected = excel.parse(sheet_name=sheet_name)
+            result = excel.parse(sheet_name=sheet_name, max_workers=2)
+        assert list(result.keys()) == list(expected.keys())
+        for key, df in expected.items():
+            tm.assert_frame_equal(result[key], df)
+
+    def test_parse_max_workers_buffer(self, read_ext):
+        with open("test_multisheet" + read_ext, "rb") as f:
+            with pd.ExcelFile(f) as excel:
+                expected = excel.parse(sheet_name=None)
+                result = excel.parse(sheet_name=None, max_workers=2)
+        assert list(result.keys()) == list(expected.keys())
+        for key, df in expected.items():
+            tm.assert_frame_equal(result[key], df)
+
+    def test_parse_max_workers_threads(self, read_ext, monkeypatch):
+        with open("test_multisheet" + read_ext, "rb") as f:
+            with pd.ExcelFile(f) as excel:
+                expected = excel.parse(sheet_name=None)
+                monkeypatch.setattr(
+                    "pandas.io.excel._base._GIL_RELEASING_ENGINES",
+                    frozenset([excel.engine]),
+                )
+                result = excel.parse(sheet_name=None, max_workers=2)
+        assert list(result.keys()) == list(expected.keys())
+        for key, df in expected.items():
+            tm.assert_frame_equal(result[key], df)
+
+    def test_parse_max_workers_unpicklable(self, read_ext):
+        # a lambda cannot be sent to a worker process, parse sequentially
+        with pd.ExcelFile("test_multisheet" + read_ext) as excel:
+            converters = {0: lambda x: str(x)}
+            expected = excel.parse(sheet_name=None, converters=converters)
+            result = excel.parse(sheet_name=None, converters=converters, max_workers=2)
+        assert list(result.keys()) == list(expected.keys())
+        for key, df in expected.items():
+            tm.assert_frame_equal(result[key], df)
+
+    def test_parse_max_workers_invalid(self, read_ext):
+        msg = "'max_workers' must be an integer >=1"
+        with pd.ExcelFile("test_multisheet" + read_ext) as excel:
+            with pytest.raises(ValueError, match=msg):
+                excel.parse(sheet_name=None, max_workers=0)
+
     def test_excel_read_buffer(self, engine, read_ext):
         pth = "test1" + read_ext
         expected = pd.read_excel(pth, sheet_name="Sheet1", index_col=0, engine=engine)
@@ -1,9 +1,12 @@
 import contextlib
 import uuid
 
+import numpy as np
 import pytest
 
+import pandas as pd
 from pandas import DataFrame
+import pandas._testing as tm
 
 from pandas.io.excel import ExcelWriter
 
@@ -84,3 +87,51 @@ def test_book_and_sheets_consistent(tmp_excel):
         assert writer.sheets == {}
         sheet = writer.book.add_worksheet("test_name")
         assert writer.sheets == {"test_name": sheet}
+
+
+@pytest.mark.parametrize("index", [True, False])
+def test_constant_memory_roundtrip(tmp_excel, index):
+    # unstyled frames are written row by row, which constant_memory requires
+    pytest.importorskip("openpyxl")
+
+    df = DataFrame(
+        {
+            "A": [1.5, np.nan, np.inf, -2.25],
+            "B": [1, 2, 3, 4],
+            "C": ["a", "b", None, "d"],
+            "D": pd.date_range("2020-01-01", periods=4),
+        },
+        index=pd.Index(list("wxyz"), name="idx"),
+    )
+    engine_kwargs = {"options": {"constant_memory": True}}
+    with ExcelWriter(
+        tmp_excel, engine="xlsxwriter", engine_kwargs=engine_kwargs
+    ) as writer:
+        df.to_excel(writer, index=index, na_rep="missing", inf_rep="INF")
+
+    result = pd.read_excel(tmp_excel, index_col=0 if index else None)
+    expected = df.astype({"A": object, "D": "M8[us]"})
+    expected["A"] = [1.5, "missing", "INF", -2.25]
+    expected["C"] = ["a", "b", "missing", "d"]
+    if not index:
+        expected = expected.reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_write_body_in_batches(tmp_excel, monkeypatch):
+    # the body is formatted and written a few rows at a time
+    pytest.importorskip("openpyxl")
+    from pandas.io.formats.excel import ExcelFormatter
+
+    monkeypatch.setattr(ExcelFormatter, "batch_size", 6)
+    df = DataFrame(
+        {
+            "A": np.arange(10) + 0.5,
+            "B": pd.date_range("2020-01-01", periods=10),
+            "C": list("abcdefghij"),
+        }
+    )
+    df.to_excel(tmp_excel, engine="xlsxwriter")
+
+    result = pd.read_excel(tmp_excel, index_col=0)
+    tm.assert_frame_equal(result, df.astype({"B": "M8[us]"}))
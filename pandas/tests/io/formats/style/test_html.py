@@ -1032,3 +1032,89 @@ def test_format_index_names(styler_multi, escape_axis_0, escape_axis_1):
     result = styler_multi.to_html(table_uuid="test")
     for expected_str in expected_index + expected_columns:
         assert f"{expected_str}</th>" in result
+
+
+@pytest.mark.parametrize("start_row, start_column", [(0, 0), (3, 2), (5, None)])
+def test_to_html_viewport(start_row, start_column):
+    # the viewport renders the same elements as hiding the preceding rows/columns
+    df = DataFrame(np.arange(80).reshape(10, 8))
+    styler = Styler(df, uuid_len=0).highlight_max(axis=None)
+    result = styler.to_html(
+        start_row=start_row, start_column=start_column, max_rows=4, max_columns=3
+    )
+
+    expected = (
+        Styler(df, uuid_len=0)
+        .highlight_max(axis=None)
+        .hide(df.index[:start_row], axis=0)
+        .hide(df.columns[: start_column or 0], axis=1)
+        .to_html(max_rows=4, max_columns=3)
+    )
+    assert result == expected
+    assert f'class="data row{start_row} col{start_column or 0}"' in result
+    assert "row_trim" in result
+    assert "col_trim" in result
+
+
+def test_to_html_viewport_multiindex(styler_mi):
+    result = styler_mi.to_html(start_row=1, start_column=1, max_rows=2, max_columns=2)
+    # sparsified sections restart at the start of the viewport
+    assert 'class="row_heading level0 row1" >a</th>' in result
+    assert 'class="row_heading level0 row2" >b</th>' in result
+    assert 'class="col_heading level0 col1" >a</th>' in result
+    assert 'class="col_heading level0 col2" >b</th>' in result
+    assert "row0" not in result
+    assert "col0" not in result
+
+
+@pytest.mark.parametrize("start", [-1, 1.5])
+def test_to_html_viewport_raises(styler, start):
+    with pytest.raises(ValueError, match="`start_row` must be a non-negative integer"):
+        styler.to_html(start_row=start)
+
+
+def test_to_html_caches_computed_styles(styler):
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        return "color: red;"
+
+    styler.map(func)
+    styler.to_html()
+    styler.to_html(start_row=1)
+    assert len(calls) == 2
+
+    styler.map(lambda x: "color: blue;")
+    result = styler.to_html()
+    assert len(calls) == 2
+    assert "color: red;\n  color: blue;" in result
+
+    styler.clear()
+    styler.map(func)
+    styler.to_html()
+    assert len(calls) == 4
+
+
+def test_to_html_recomputes_styles_after_data_change():
+    styler = Styler(DataFrame({"A": [0, 0], "B": [0, 0]}))
+    styler.map(lambda x: "color: red;" if x == 1 else "")
+    assert "color: red;" not in styler.to_html()
+
+    styler.data.iloc[0, 1] = 1
+    assert "color: red;" in styler.to_html()
+
+    styler.data.iloc[0, 1] = 0
+    assert "color: red;" not in styler.to_html()
+
+
+def test_to_html_keeps_ctx_of_styler():
+    # renders share the computed styles, but concatenated styles are not added
+    df = DataFrame({"A": [1, 2]})
+    styler = df.style.map(lambda x: "color: red;")
+    styler.to_html()
+    ctx = dict(styler.ctx)
+
+    styler.concat(df.agg(["sum"]).style.map(lambda x: "color: blue;"))
+    assert "color: blue;" in styler.to_html()
+    assert styler.ctx == ctx
@@ -276,6 +276,8 @@ def test_copy(comprehensive, render, deepcopy, mi_styler, mi_styler_comp):
         "cellstyle_map",  # render time vars..
         "cellstyle_map_columns",
         "cellstyle_map_index",
+        "_todo_computed",  # computed styles cache..
+        "_data_computed",
         "template_latex",  # render templates are class level
         "template_html",
         "template_html_style",
@@ -1942,6 +1942,14 @@ class TestFloatArrayFormatter:
         assert result[0] == " 12.0"
         assert result[1] == "  0.0"
 
+    def test_format_decimal_na_rep_threshold(self):
+        # na_rep is not affected by the decimal replacement
+        values = np.array([1.5, np.nan, 1e-3, -2.25], dtype=np.float64)
+        with option_context("display.chop_threshold", 0.01):
+            obj = fmt.FloatArrayFormatter(values, decimal=",", na_rep="N.A.")
+            result = obj.get_result()
+        assert result == [" 1,50", " N.A.", " 0,00", "-2,25"]
+
     def test_output_display_precision_trailing_zeroes(self):
         # Issue #20359: trimming zeros while there is no decimal point
 
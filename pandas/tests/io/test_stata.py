@@ -2207,6 +2207,47 @@ def test_direct_read(datapath, monkeypatch):
                 assert reader._path_or_buf is bio
 
 
+@pytest.mark.parametrize("version", [105, 114, 118])
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_memory_map(datapath, version, chunksize):
+    for prefix in ["stata-compat-", "stata-compat-be-"]:
+        file_path = datapath("io", "data", "stata", f"{prefix}{version}.dta")
+        expected = read_stata(file_path)
+        with StataReader(file_path, memory_map=True, chunksize=chunksize) as reader:
+            if chunksize is None:
+                result = reader.read()
+            else:
+                result = pd.concat(reader)
+            assert reader._mmap is not None
+        tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_memory_map_chunks_columns(datapath, num_threads):
+    file_path = datapath("io", "data", "stata", "stata-compat-be-118.dta")
+    columns = ["s10", "i16", "d"]
+    expected = read_stata(file_path, columns=columns)
+    with pd.option_context("compute.num_threads", num_threads):
+        with StataReader(
+            file_path, memory_map=True, chunksize=1, columns=columns
+        ) as reader:
+            chunks = list(reader)
+    assert len(chunks) == len(expected)
+    tm.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_strls_read_once(temp_file):
+    df = DataFrame({"a": ["x" * 3000, "y", "x" * 3000, "z"], "b": range(4)})
+    df.to_stata(temp_file, version=117, convert_strl=["a"])
+    with StataReader(temp_file, chunksize=1, convert_categoricals=False) as reader:
+        first = next(reader)
+        gso = reader.GSO
+        rest = list(reader)
+        assert reader.GSO is gso
+    result = pd.concat([first, *rest])
+    tm.assert_series_equal(result["a"], df["a"].astype(result["a"].dtype))
+
+
 @pytest.mark.parametrize("version", [114, 117, 118, 119, None])
 @pytest.mark.parametrize("use_dict", [True, False])
 @pytest.mark.parametrize("infer", [True, False])
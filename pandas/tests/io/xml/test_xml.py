@@ -1474,6 +1474,47 @@ def test_wrong_dict_value(xml_books, parser):
         read_xml(xml_books, parser=parser, iterparse={"book": "category"})
 
 
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 10])
+def test_iterparse_chunksize(xml_books, parser, chunksize):
+    iterparse = {"book": ["category", "title", "year", "author", "price"]}
+    df_expected = read_xml(xml_books, parser=parser, iterparse=iterparse)
+
+    chunks = list(
+        read_xml(xml_books, parser=parser, iterparse=iterparse, chunksize=chunksize)
+    )
+
+    assert len(chunks) == -(-len(df_expected) // chunksize)
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    tm.assert_frame_equal(pd.concat(chunks), df_expected)
+
+
+def test_iterparse_chunksize_wrong_dict_type(xml_books, parser):
+    # iterparse is validated before the first chunk is requested
+    with pytest.raises(TypeError, match="list is not a valid type for iterparse"):
+        read_xml(
+            xml_books,
+            parser=parser,
+            iterparse=["category", "title", "year", "author", "price"],
+            chunksize=1,
+        )
+
+
+def test_chunksize_without_iterparse(xml_books, parser):
+    with pytest.raises(ValueError, match="chunksize is only supported with iterparse"):
+        read_xml(xml_books, parser=parser, chunksize=1)
+
+
+@pytest.mark.parametrize("chunksize", [0, -1, 1.5])
+def test_chunksize_invalid(xml_books, parser, chunksize):
+    with pytest.raises(ValueError, match="'chunksize' must be an integer >=1"):
+        read_xml(
+            xml_books,
+            parser=parser,
+            iterparse={"book": ["category", "title"]},
+            chunksize=chunksize,
+        )
+
+
 def test_bad_xml(parser):
     bad_xml = """\
 <?xml version='1.0' encoding='utf-8'?>
@@ -670,6 +670,15 @@ class TestHelpFunctions:
         expected = np.zeros_like(values, dtype=np.bool_)
         tm.assert_numpy_array_equal(result, expected)
 
+    def test_ismember_bloom(self, dtype):
+        # a fifth of arr is in values, so the Bloom filter is used
+        values = np.arange(0, 100, 5).astype(dtype)
+        arr = np.tile(np.arange(100).astype(dtype), 30)
+        result = ht.ismember(arr, values, use_bloom=True)
+        expected = ht.ismember(arr, values)
+        tm.assert_numpy_array_equal(result, expected)
+        assert expected.sum() == 600
+
     def test_mode(self, dtype, writable):
         if dtype in (np.int8, np.uint8):
             N = 53
@@ -756,12 +765,32 @@ class TestHelpFunctionsWithNans:
         expected = np.array([False, False, False], dtype=np.bool_)
         tm.assert_numpy_array_equal(result, expected)
 
+    def test_ismember_bloom(self, dtype):
+        values = np.array([np.nan, 0.0, 1.5], dtype=dtype)
+        arr = np.concatenate(
+            [np.arange(2000, dtype=dtype) + 2, np.array([np.nan, -0.0, 1.5, 2.5])]
+        ).astype(dtype)
+        result = ht.ismember(arr, values, use_bloom=True)
+        expected = np.zeros(len(arr), dtype=np.bool_)
+        expected[-4:-1] = True
+        tm.assert_numpy_array_equal(result, expected)
+
     def test_mode(self, dtype):
         values = np.array([42, np.nan, np.nan, np.nan], dtype=dtype)
         assert ht.mode(values, True)[0] == 42
         assert np.isnan(ht.mode(values, False)[0])
 
 
+@pytest.mark.parametrize("dtype", [np.int64, np.uint32, np.float64])
+def test_bloom_filter(dtype):
+    values = np.arange(0, 200_000, 2).astype(dtype)
+    bloom = ht.BloomFilter(len(values))
+    bloom.add(values)
+    # no false negatives, few false positives
+    assert bloom.contains(values).all()
+    assert bloom.contains(values + 1).mean() < 0.02
+
+
 def test_ismember_tuple_with_nans():
     # GH-41836
     values = np.empty(2, dtype=object)
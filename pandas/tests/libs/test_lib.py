@@ -1,3 +1,4 @@
+from collections import namedtuple
 import pickle
 
 import numpy as np
@@ -73,6 +74,25 @@ class TestMisc:
         result = lib.fast_multiget(mapping2, oindex)
         tm.assert_numpy_array_equal(result, expected)
 
+    def test_rows_from_columns(self):
+        columns = [[1, 2], ["a", "b"]]
+        assert lib.rows_from_columns(columns) == [(1, "a"), (2, "b")]
+        assert lib.rows_from_columns(columns, keys=["x", "y"]) == [
+            {"x": 1, "y": "a"},
+            {"x": 2, "y": "b"},
+        ]
+        assert lib.rows_from_columns([]) == []
+
+        Row = namedtuple("Row", ["x", "y"])
+        result = lib.rows_from_columns(columns, Row)
+        assert result == [Row(1, "a"), Row(2, "b")]
+        assert all(type(row) is Row for row in result)
+
+        with pytest.raises(ValueError, match="same length"):
+            lib.rows_from_columns([[1, 2], [3]])
+        with pytest.raises(ValueError, match="same length"):
+            lib.rows_from_columns(columns, keys=["x"])
+
 
 class TestIndexing:
     def test_maybe_indices_to_slice_left_edge(self):
@@ -0,0 +1,139 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pandas._libs import sketches
+
+import pandas._testing as tm
+from pandas.util import hash_array
+
+
+class TestHyperLogLog:
+    @pytest.mark.parametrize("n", [0, 1, 100, 10_000, 1_000_000])
+    def test_estimate(self, n):
+        sketch = sketches.HyperLogLog(14)
+        sketch.update(hash_array(np.arange(n)))
+        # standard error is about 0.8%
+        assert abs(sketch.estimate() - n) <= 0.03 * n + 0.5
+
+    def test_duplicates(self):
+        sketch = sketches.HyperLogLog(12)
+        sketch.update(hash_array(np.arange(1000).repeat(5)))
+        assert abs(sketch.estimate() - 1000) <= 50
+
+    def test_merge(self):
+        hashes = hash_array(np.arange(50_000))
+        left = sketches.HyperLogLog(10)
+        left.update(hashes[:30_000])
+        right = sketches.HyperLogLog(10)
+        right.update(hashes[20_000:])
+        expected = sketches.HyperLogLog(10)
+        expected.update(hashes)
+
+        left.merge(right)
+        tm.assert_numpy_array_equal(left.registers, expected.registers)
+        assert left.estimate() == expected.estimate()
+
+        with pytest.raises(ValueError, match="different precisions"):
+            left.merge(sketches.HyperLogLog(11))
+
+    def test_pickle(self):
+        sketch = sketches.HyperLogLog(8)
+        sketch.update(hash_array(np.arange(100)))
+        result = pickle.loads(pickle.dumps(sketch))
+        assert result.precision == 8
+        tm.assert_numpy_array_equal(result.registers, sketch.registers)
+
+    @pytest.mark.parametrize("precision", [3, 19])
+    def test_invalid_precision(self, precision):
+        with pytest.raises(ValueError, match="precision must be between 4 and 18"):
+            sketches.HyperLogLog(precision)
+
+
+def test_group_nunique_approx():
+    values = np.arange(30_000) % 1000
+    labels = np.repeat(np.arange(3, dtype=np.intp), 10_000)
+    labels[::2] = -1
+    result = sketches.group_nunique_approx(hash_array(values), labels, 4, 12)
+    assert (np.abs(result - [500, 500, 500, 0]) <= 30).all()
+
+
+class TestTDigest:
+    @pytest.mark.parametrize("n", [1, 2, 10, 500])
+    def test_exact_small(self, n):
+        # as long as every value is its own centroid, the quantiles are exact
+        values = np.random.default_rng(2).permutation(n).astype(np.float64)
+        qs = np.linspace(0, 1, 21)
+        sketch = sketches.TDigest()
+        sketch.update(values)
+        tm.assert_almost_equal(sketch.quantile(qs), np.quantile(values, qs))
+
+    def test_accuracy(self):
+        values = np.random.default_rng(2).standard_normal(1_000_000)
+        qs = np.array([0.001, 0.01, 0.1, 0.5, 0.9, 0.99, 0.999])
+        sketch = sketches.TDigest()
+        sketch.update(values)
+        assert sketch.count == len(values)
+        # compare the ranks of the estimates
+        ranks = np.searchsorted(np.sort(values), sketch.quantile(qs)) / len(values)
+        assert (np.abs(ranks - qs) <= 0.002).all()
+        assert sketch.quantile(np.array([0.0, 1.0])).tolist() == [
+            values.min(),
+            values.max(),
+        ]
+
+    def test_skips_nan(self):
+        sketch = sketches.TDigest()
+        sketch.update(np.array([np.nan, 3.0, np.nan, 1.0]))
+        assert sketch.count == 2
+        assert sketch.quantile(np.array([0.5])).tolist() == [2.0]
+
+    def test_empty(self):
+        sketch = sketches.TDigest()
+        sketch.update(np.array([np.nan]))
+        assert np.isnan(sketch.quantile(np.array([0.5]))).all()
+
+    def test_merge(self):
+        values = np.random.default_rng(2).exponential(size=100_000)
+        qs = np.array([0.01, 0.5, 0.99])
+        sketch = sketches.TDigest()
+        for chunk in np.array_split(values, 7):
+            part = sketches.TDigest()
+            part.update(chunk)
+            sketch.merge(part)
+        assert sketch.count == len(values)
+        ranks = np.searchsorted(np.sort(values), sketch.quantile(qs)) / len(values)
+        assert (np.abs(ranks - qs) <= 0.005).all()
+        assert sketch.quantile(np.array([0.0, 1.0])).tolist() == [
+            values.min(),
+            values.max(),
+        ]
+
+    def test_pickle(self):
+        sketch = sketches.TDigest(50)
+        sketch.update(np.random.default_rng(2).standard_normal(10_000))
+        result = pickle.loads(pickle.dumps(sketch))
+        assert result.compression == 50
+        assert result.count == sketch.count
+        qs = np.linspace(0, 1, 11)
+        tm.assert_numpy_array_equal(result.quantile(qs), sketch.quantile(qs))
+
+    def test_invalid_compression(self):
+        with pytest.raises(ValueError, match="compression must be at least 1"):
+            sketches.TDigest(0.5)
+
+
+def test_group_quantile_approx():
+    values = np.array([1.0, 2.0, np.nan, 4.0, 5.0, 6.0])
+    mask = np.isnan(values)
+    starts = np.array([0, 3, 6], dtype=np.int64)
+    ends = np.array([3, 6, 6], dtype=np.int64)
+    qs = np.array([0.0, 0.5])
+    out = np.empty((3, 2))
+    result_mask = np.zeros((3, 2), dtype=np.uint8)
+    sketches.group_quantile_approx(out, values, mask, qs, starts, ends, result_mask)
+    tm.assert_numpy_array_equal(out[:2], np.array([[1.0, 1.5], [4.0, 5.0]]))
+    tm.assert_numpy_array_equal(
+        result_mask, np.array([[0, 0], [0, 0], [1, 1]], dtype=np.uint8)
+    )
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from pandas import (
     Categorical,
@@ -22,3 +23,37 @@ def test_nunique_categorical():
 
     ser = Series(Categorical([np.nan]))
     assert ser.nunique() == 0
+
+
+def test_nunique_approx():
+    series = Series(np.arange(100_000) % 20_000, dtype="float64")
+    series[::10] = np.nan
+    assert abs(series.nunique(approx=True) - series.nunique()) <= 600
+    result = series.nunique(approx=True, dropna=False)
+    assert abs(result - series.nunique(dropna=False)) <= 600
+
+    series = Series([0.0, -0.0, 1.5, np.nan, np.nan], dtype="float64")
+    assert series.nunique(approx=True) == 2
+    assert series.nunique(approx=True, dropna=False) == 3
+
+    series = Series(["a", "b", None, "a"], dtype=object)
+    assert series.nunique(approx=True) == 2
+
+    # objects are hashed by value, not by their string representation
+    series = Series([1, "1", 1.0, True, None, np.nan, (1, 2)], dtype=object)
+    assert series.nunique(approx=True) == series.nunique() == 3
+    assert series.nunique(approx=True, dropna=False) == series.nunique(dropna=False)
+
+    # the builtin hash of -1 and -2 is the same
+    series = Series([1, "1", -1, -2], dtype=object)
+    assert series.nunique(approx=True) == series.nunique() == 4
+    series = Series(
+        [-1, -2, np.int8(-1), np.uint64(2**64 - 1), 2**70, 2.0**70], dtype=object
+    )
+    assert series.nunique(approx=True) == series.nunique() == 4
+
+
+@pytest.mark.parametrize("error", [0, 1.5])
+def test_nunique_approx_invalid_error(error):
+    with pytest.raises(ValueError, match="error must be between 0 and 1"):
+        Series([1, 2]).nunique(approx=True, error=error)
@@ -245,3 +245,25 @@ class TestSeriesQuantile:
         result = ser.quantile([0.1, 0.5])
         expected = Series([1, 1], dtype=any_int_ea_dtype, index=[0.1, 0.5])
         tm.assert_series_equal(result, expected)
+
+    def test_quantile_approx(self):
+        ser = Series(np.random.default_rng(2).standard_normal(100_000))
+        qs = [0.01, 0.5, 0.99]
+        result = ser.quantile(qs, method="approx")
+        expected = ser.quantile(qs)
+        tm.assert_series_equal(result, expected, atol=0.02)
+
+        ser32 = ser.astype(np.float32)
+        assert ser32.quantile(qs, method="approx").dtype == ser32.quantile(qs).dtype
+
+        # exact as long as every value is its own centroid
+        ser = Series([4.0, np.nan, 1.0, 3.0, 2.0])
+        assert ser.quantile(0.25, method="approx") == ser.quantile(0.25)
+
+    def test_quantile_approx_datetime(self):
+        ser = Series(pd.date_range("2020-01-01", periods=5))
+        assert ser.quantile(0.5, method="approx") == Timestamp("2020-01-03")
+
+    def test_quantile_invalid_method(self):
+        with pytest.raises(ValueError, match="Invalid method: table"):
+            Series([1, 2]).quantile(0.5, method="table")
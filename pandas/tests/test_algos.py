@@ -7,6 +7,7 @@ import pytest
 from pandas._libs import (
     algos as libalgos,
     hashtable as ht,
+    index as libindex,
 )
 
 from pandas.core.dtypes.common import (
@@ -234,6 +235,49 @@ class TestFactorize:
         expected_uniques = np.array([1, 2, 3], dtype="int64")
         tm.assert_numpy_array_equal(rizer.uniques.to_array(), expected_uniques)
 
+    @pytest.mark.parametrize("use_na_sentinel", [True, False])
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.array([3, 1, 3, 2, 1, 5, 3, 2] * 8 + [7, 0], dtype=np.int64),
+            np.array([2.0, np.nan, 1.0, 2.0, 5.0, np.nan] * 10 + [1.5, 1.0]),
+            np.array(["2020-01-02", "NaT", "2020-01-01"] * 20, dtype="M8[ns]"),
+        ],
+    )
+    def test_factorize_array_threads(self, monkeypatch, values, use_na_sentinel):
+        # large arrays are factorized in chunks across threads
+        expected_codes, expected_uniques = algos.factorize_array(
+            values, use_na_sentinel=use_na_sentinel
+        )
+        monkeypatch.setattr("pandas.core.algorithms._MIN_FACTORIZE_CHUNK_SIZE", 10)
+        monkeypatch.setattr(
+            "pandas.core.algorithms._has_few_uniques", lambda *args: True
+        )
+        with pd.option_context("compute.num_threads", 3):
+            codes, uniques = algos.factorize_array(
+                values, use_na_sentinel=use_na_sentinel
+            )
+        tm.assert_numpy_array_equal(codes, expected_codes)
+        tm.assert_numpy_array_equal(uniques, expected_uniques)
+
+    def test_factorize_array_threads_mask(self, monkeypatch):
+        values = np.arange(60) % 7
+        mask = np.arange(60) % 5 == 0
+        expected_codes, expected_uniques = algos.factorize_array(values, mask=mask)
+        monkeypatch.setattr("pandas.core.algorithms._MIN_FACTORIZE_CHUNK_SIZE", 10)
+        monkeypatch.setattr(
+            "pandas.core.algorithms._has_few_uniques", lambda *args: True
+        )
+        with pd.option_context("compute.num_threads", 3):
+            codes, uniques = algos.factorize_array(values, mask=mask)
+        tm.assert_numpy_array_equal(codes, expected_codes)
+        tm.assert_numpy_array_equal(uniques, expected_uniques)
+
+    def test_has_few_uniques(self):
+        hash_klass = ht.Int64HashTable
+        assert algos._has_few_uniques(hash_klass, np.arange(10**6) % 100, 4)
+        assert not algos._has_few_uniques(hash_klass, np.arange(10**6), 4)
+
     def test_factorizer_object_with_nan(self):
         # GH#49549
         data = np.array([1, 2, 3, 1, np.nan])
@@ -891,6 +935,26 @@ def test_nunique_ints(index_or_series_or_array):
 
 
 class TestIsin:
+    def test_index_reuses_hash_table(self, monkeypatch):
+        # large enough for a Bloom filter
+        monkeypatch.setattr(libindex, "_SIZE_CUTOFF", 100)
+        keys = Index(np.random.default_rng(2).permutation(np.arange(0, 1000, 7)))
+        comps = np.arange(5000)
+        expected = np.isin(comps, keys)
+
+        result = algos.isin(comps, keys)
+        tm.assert_numpy_array_equal(result, expected)
+        assert keys._engine.is_mapping_populated
+
+        # same engine for another call, and the Bloom filter when few match
+        engine = keys._engine
+        result = algos.isin(comps[::-1], keys)
+        tm.assert_numpy_array_equal(result, expected[::-1])
+        assert keys._engine is engine
+
+        result = algos.isin(np.array([7.0, 7.5]), keys)
+        tm.assert_numpy_array_equal(result, np.array([True, False]))
+
     def test_invalid(self):
         msg = (
             r"only list-like objects are allowed to be passed to isin\(\), "
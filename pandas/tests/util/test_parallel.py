@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from pandas import option_context
+
+from pandas.core.util import parallel
+from pandas.core.util.parallel import (
+    get_num_threads,
+    thread_map,
+)
+
+
+def test_num_threads_option():
+    assert get_num_threads() == 1
+    with option_context("compute.num_threads", 3):
+        assert get_num_threads() == 3
+    assert get_num_threads() == 1
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_thread_map_order(num_threads):
+    result = thread_map(lambda x: x * 2, list(range(20)), num_threads=num_threads)
+    assert result == [x * 2 for x in range(20)]
+
+
+def test_thread_map_raises():
+    def func(x):
+        if x == 3:
+            raise ValueError("bad item")
+        return x
+
+    with pytest.raises(ValueError, match="bad item"):
+        thread_map(func, list(range(10)), num_threads=4)
+
+
+def test_thread_map_nested_serial():
+    main = threading.get_ident()
+
+    def inner(x):
+        return threading.get_ident()
+
+    def outer(x):
+        outer_thread = threading.get_ident()
+        inner_threads = thread_map(inner, list(range(4)), num_threads=4)
+        return outer_thread, set(inner_threads)
+
+    result = thread_map(outer, list(range(4)), num_threads=4)
+    for outer_thread, inner_threads in result:
+        assert outer_thread != main
+        assert inner_threads == {outer_thread}
+
+
+def test_thread_map_single_executor():
+    with option_context("compute.num_threads", 2):
+        thread_map(lambda x: x, list(range(4)))
+        executor = parallel._executor
+        assert executor is not None
+        thread_map(lambda x: x, list(range(4)))
+        assert parallel._executor is executor
+
+    # changing the option shuts down the pool of the previous value
+    assert parallel._executor is None
+    assert executor._shutdown
+
+    with option_context("compute.num_threads", 3):
+        thread_map(lambda x: x, list(range(4)))
+        assert parallel._executor is not executor